@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Analyzer Scalability Benchmark
+Times each stage of performance_analyzer.py (discovery, parsing, pairing,
+statistics and every exporter) on synthetic corpora of increasing size and
+saves files/s and peak RSS per stage to JSON, so hot-path changes can be
+tracked over time
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from generate_logs import ENCODINGS, VARIANTS, generate_corpus
+from performance_analyzer import PARSERS, PerformanceAnalyzer
+
+
+def peak_rss_mib(who: int = resource.RUSAGE_SELF) -> float:
+    """Peak resident set size in MiB (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    maxrss = resource.getrusage(who).ru_maxrss
+    return maxrss / 1024**2 if sys.platform == 'darwin' else maxrss / 1024
+
+
+def run_stages(base_path: Path, parser: str, jobs: int, columnar: bool) -> Dict[str, object]:
+    """Run every analyzer stage once on a corpus, timing each"""
+    analyzer = PerformanceAnalyzer(parser=parser, columnar=columnar)
+    stages = {}
+
+    def timed(name: str, func) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            stages[name] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timed('discover', lambda: analyzer.discover_log_files(base_path))
+        timed('parse', lambda: analyzer.scan_directories(base_path, jobs=jobs))
+        timed('pair', analyzer.build_pair_index)
+        timed('statistics', analyzer.comparison_model)
+        timed('report', analyzer.generate_report)
+        timed('export_csv', lambda: analyzer.export_csv(str(Path(tmp) / 'report.csv')))
+        timed('export_json', lambda: analyzer.export_json(str(Path(tmp) / 'report.json')))
+        timed('export_markdown', lambda: analyzer.export_markdown(str(Path(tmp) / 'report.md')))
+
+    return {
+        'results': sum(len(results) for results in analyzer.results.values()),
+        'stages': stages,
+        'peak_rss_mib': peak_rss_mib(),
+        'peak_rss_children_mib': peak_rss_mib(resource.RUSAGE_CHILDREN),
+    }
+
+
+def measure(base_path: Path, parser: str, jobs: int, columnar: bool) -> Dict[str, object]:
+    """Run the stages in a fresh interpreter so peak RSS belongs to this corpus alone"""
+    command = [sys.executable, __file__, '--stage-run', str(base_path),
+               '--parser', parser, '--jobs', str(jobs)]
+    if columnar:
+        command.append('--columnar')
+    completed = subprocess.run(command, capture_output=True, text=True, check=True,
+                               cwd=Path(__file__).resolve().parent)
+    return json.loads(completed.stdout)
+
+
+def benchmark(file_counts: List[int], platforms: int, runs: int, encodings: List[str],
+              parser: str, jobs: int, columnar: bool) -> List[Dict[str, object]]:
+    """Generate each corpus size, measure it and print a per-stage table"""
+    entries = []
+    for target in file_counts:
+        configurations = max(1, -(-target // (platforms * len(VARIANTS))))
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = generate_corpus(Path(tmp), platforms, configurations, runs, encodings)
+            measured = measure(Path(tmp), parser, jobs, columnar)
+
+        files = corpus['files']
+        stages = {name: {'seconds': seconds, 'files_per_sec': files / seconds if seconds else None}
+                  for name, seconds in measured['stages'].items()}
+        entries.append({
+            'files': files,
+            'bytes': corpus['bytes'],
+            'platforms': platforms,
+            'configurations': configurations,
+            'runs': runs,
+            'results': measured['results'],
+            'peak_rss_mib': measured['peak_rss_mib'],
+            'peak_rss_children_mib': measured['peak_rss_children_mib'],
+            'stages': stages,
+        })
+
+        print(f"\n{files} files ({corpus['bytes'] / 1024**2:.1f} MiB), peak RSS {measured['peak_rss_mib']:.1f} MiB")
+        print(f"{'Stage':<18} {'Time (s)':<12} {'Files/s':<12}")
+        for name, stage in stages.items():
+            rate = f"{stage['files_per_sec']:.0f}" if stage['files_per_sec'] else "-"
+            print(f"{name:<18} {stage['seconds']:<12.4f} {rate:<12}")
+    return entries
+
+
+def main():
+    """Main function with command line interface"""
+    parser = argparse.ArgumentParser(description="Benchmark performance_analyzer.py stages at several corpus sizes")
+    parser.add_argument('--files', type=int, nargs='+', default=[100, 1000, 10000],
+                      help='Approximate corpus sizes in log files (default: 100 1000 10000)')
+    parser.add_argument('--platforms', type=int, default=4, help='Platforms per corpus (default: 4)')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per log (default: 10)')
+    parser.add_argument('--encodings', nargs='+', choices=list(ENCODINGS), default=['utf-8', 'utf-16-le'],
+                      help='Encodings assigned round-robin across files (default: utf-8 utf-16-le)')
+    parser.add_argument('--parser', choices=list(PARSERS), default='streaming',
+                      help='Log parser implementation (default: streaming)')
+    parser.add_argument('--jobs', type=int, default=1, help='Parse worker processes (default: 1)')
+    parser.add_argument('--columnar', action='store_true', help='Use the columnar run store for statistics')
+    parser.add_argument('--output', type=str, default='benchmark_results.json',
+                      help='JSON file to save results to (default: benchmark_results.json)')
+    parser.add_argument('--stage-run', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage_run:
+        json.dump(run_stages(Path(args.stage_run), args.parser, args.jobs, args.columnar), sys.stdout)
+        return
+
+    entries = benchmark(args.files, args.platforms, args.runs, args.encodings,
+                        args.parser, args.jobs, args.columnar)
+    report = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'parser': args.parser,
+        'jobs': args.jobs,
+        'columnar': args.columnar,
+        'encodings': args.encodings,
+        'corpora': entries,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nBenchmark results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
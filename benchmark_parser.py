@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark
+Compares the streaming byte-level parser against the original regex parser
+on a log corpus and on large synthetic logs in each supported encoding
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+from performance_analyzer import LogParser, StreamingLogParser
+
+
+SYNTHETIC_HEADER = """=== Running download-5GiB-1x.run.json with regular APIs ===
+Start time: Thu Dec 25 14:16:34 UTC 2025
+
+
+Workload Configuration:
+- MaxRepeatCount: {runs}
+- MaxRepeatSecs: 600
+- FilesOnDisk: True
+- WithResponseApis: False
+
+Tasks:
+- Task: action=download, size=5,368,709,120 bytes, key=download/5GiB-1x/1
+
+Total bytes per run: 5,368,709,120
+
+"""
+
+# Encoding name and BOM written in front of the synthetic log
+SYNTHETIC_ENCODINGS = [
+    ('utf-8', b''),
+    ('utf-16-le', b'\xff\xfe'),
+    ('utf-16-be', b'\xfe\xff'),
+]
+
+
+def write_synthetic_log(path: Path, runs: int, encoding: str, bom: bytes) -> None:
+    """Write a log with the given number of runs, streaming it out in blocks"""
+    with open(path, 'wb') as f:
+        f.write(bom)
+        f.write(SYNTHETIC_HEADER.format(runs=runs).encode(encoding))
+        block = []
+        for i in range(1, runs + 1):
+            block.append(f"Run:{i} Secs:53.791757 Gb/s:0.798443\n")
+            if len(block) == 10000:
+                f.write(''.join(block).encode(encoding))
+                block = []
+        block.append("\nEnd time: Thu Dec 25 14:25:47 UTC 2025\n")
+        f.write(''.join(block).encode(encoding))
+
+
+def time_parser(parse: Callable[[Path], object], files: List[Path], repeat: int) -> float:
+    """Best-of-N wall time for parsing every file once"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in files:
+            parse(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(parse: Callable[[Path], object], files: List[Path]) -> int:
+    """Peak traced Python allocation while parsing every file once"""
+    tracemalloc.start()
+    for path in files:
+        parse(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def compare(label: str, files: List[Path], repeat: int) -> None:
+    """Benchmark both parsers on a set of files and check they agree"""
+    regex_parser = LogParser()
+    streaming_parser = StreamingLogParser()
+
+    for path in files:
+        expected = regex_parser.try_parse_log_file(path).result
+        actual = streaming_parser.try_parse_log_file(path).result
+        if expected != actual:
+            print(f"MISMATCH: {path}")
+
+    total_bytes = sum(path.stat().st_size for path in files)
+    print(f"\n{label}: {len(files)} files, {total_bytes / 1024**2:.1f} MiB")
+    print(f"{'Parser':<12} {'Best Time (s)':<15} {'MiB/s':<10} {'Peak Memory (MiB)':<18}")
+    for name, parser in (('regex', regex_parser), ('streaming', streaming_parser)):
+        elapsed = time_parser(parser.try_parse_log_file, files, repeat)
+        peak = peak_memory(parser.try_parse_log_file, files)
+        rate = total_bytes / 1024**2 / elapsed if elapsed else float('inf')
+        print(f"{name:<12} {elapsed:<15.4f} {rate:<10.1f} {peak / 1024**2:<18.2f}")
+
+
+def main():
+    """Main function with command line interface"""
+    parser = argparse.ArgumentParser(description="Benchmark the regex and streaming log parsers")
+    parser.add_argument('--base-path', type=str, default='.',
+                      help='Base directory containing platform folders (default: current directory)')
+    parser.add_argument('--repeat', type=int, default=5,
+                      help='Timing repetitions, best time is reported (default: 5)')
+    parser.add_argument('--synthetic-runs', type=int, default=200000,
+                      help='Run lines per synthetic log, 0 to skip (default: 200000)')
+    args = parser.parse_args()
+
+    corpus = sorted(Path(args.base_path).glob("*/*.log"))
+    if corpus:
+        compare("Corpus", corpus, args.repeat)
+
+    if args.synthetic_runs:
+        with tempfile.TemporaryDirectory() as tmp:
+            for encoding, bom in SYNTHETIC_ENCODINGS:
+                path = Path(tmp) / f"synthetic-{encoding}.log"
+                write_synthetic_log(path, args.synthetic_runs, encoding, bom)
+                compare(f"Synthetic {encoding}", [path], max(1, args.repeat // 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Synthetic Log Generator
+Writes realistic log corpora in the format parsed by performance_analyzer.py:
+N platform directories, each holding M workload configurations in all four
+storage/API variants, with K runs per log, in UTF-8 or UTF-16 (with BOMs)
+"""
+
+import argparse
+import calendar
+import gzip
+import lzma
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+# Sizes used by the real corpus; further configurations get distinct MiB sizes
+STANDARD_SIZES = [('100MiB', 100 * 1024**2), ('1GiB', 1024**3), ('5GiB', 5 * 1024**3), ('30GiB', 30 * 1024**3)]
+
+# Encoding name and BOM written in front of the log
+ENCODINGS = {
+    'utf-8': ('utf-8', b''),
+    'utf-8-sig': ('utf-8', b'\xef\xbb\xbf'),
+    'utf-16-le': ('utf-16-le', b'\xff\xfe'),
+    'utf-16-be': ('utf-16-be', b'\xfe\xff'),
+}
+
+# (files_on_disk, with_response_apis) -> file name suffix
+VARIANTS = [
+    (True, False, 'regular'),
+    (True, True, 'withresponse'),
+    (False, False, 'ram-regular'),
+    (False, True, 'ram-withresponse'),
+]
+
+# Typical throughput (Gb/s) of the regular and WithResponse APIs
+REGULAR_GBPS = 0.8
+WITH_RESPONSE_GBPS = 12.0
+# Contention per extra concurrent task: aggregate = base * N / (1 + CONTENTION * (N - 1))
+CONTENTION = 0.25
+
+# Compression suffix -> compressor for archived corpora
+COMPRESSORS = {'gz': gzip.compress, 'xz': lzma.compress}
+
+TIME_FORMAT = '%a %b %d %H:%M:%S UTC %Y'
+
+
+def workload_sizes(count: int) -> List[Tuple[str, int]]:
+    """Label and byte size of the first ``count`` workload configurations"""
+    sizes = STANDARD_SIZES[:count]
+    mib = 200
+    while len(sizes) < count:
+        sizes.append((f'{mib}MiB', mib * 1024**2))
+        mib += 1
+    return sizes
+
+
+def render_log(workload: str, size_bytes: int, files_on_disk: bool, with_response_apis: bool,
+               runs: int, rng: random.Random, start: float, concurrency: int = 1) -> str:
+    """Render one log: header, one task per concurrent transfer, K runs with a slower first (warm-up) run, end time"""
+    api = 'WithResponse' if with_response_apis else 'regular'
+    ram = '' if files_on_disk else '-ram'
+    base_gbps = (WITH_RESPONSE_GBPS if with_response_apis else REGULAR_GBPS) * (0.95 if files_on_disk else 1.0)
+    base_gbps *= concurrency / (1 + CONTENTION * (concurrency - 1))
+    total_bytes = size_bytes * concurrency
+    key = workload[len('download-'):]
+    lines = [
+        f"=== Running {workload}{ram}.run.json with {api} APIs ===",
+        f"Start time: {time.strftime(TIME_FORMAT, time.gmtime(start))}",
+        "",
+        "",
+        "Workload Configuration:",
+        f"- MaxRepeatCount: {runs}",
+        "- MaxRepeatSecs: 100000",
+        f"- FilesOnDisk: {files_on_disk}",
+        f"- WithResponseApis: {with_response_apis}",
+        "",
+        "Tasks:",
+    ]
+    lines.extend(f"- Task: action=download, size={size_bytes:,} bytes, key=download/{key}/{task}"
+                 for task in range(1, concurrency + 1))
+    lines.extend(["", f"Total bytes per run: {total_bytes:,}", ""])
+    elapsed = 0.0
+    for run in range(1, runs + 1):
+        gbps = base_gbps * rng.gauss(1.0, 0.01) * (0.9 if run == 1 else 1.0)
+        secs = total_bytes * 8 / (gbps * 1e9)
+        elapsed += secs
+        lines.append(f"Run:{run} Secs:{secs:.6f} Gb/s:{gbps:.6f}")
+    lines.append("")
+    lines.append(f"End time: {time.strftime(TIME_FORMAT, time.gmtime(start + elapsed))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(output: Path, platforms: int, configurations: int, runs: int,
+                    encodings: List[str], seed: int = 0, compress: str = None,
+                    concurrency: List[int] = (1,)) -> Dict[str, int]:
+    """Write a corpus of platforms x configurations x concurrency levels x 4 variant logs
+
+    Encodings are assigned round-robin across files; with ``compress`` logs are
+    written as .log.gz or .log.xz. Returns file and (on-disk) byte counts.
+    """
+    rng = random.Random(seed)
+    start = calendar.timegm((2025, 12, 25, 14, 0, 0, 0, 0, 0))
+    files = total_bytes = 0
+    for platform_index in range(platforms):
+        platform_dir = output / f'platform_{platform_index:03d}'
+        platform_dir.mkdir(parents=True, exist_ok=True)
+        for size_label, size_bytes in workload_sizes(configurations):
+            for level in concurrency:
+                workload = f'download-{size_label}-{level}x'
+                for files_on_disk, with_response_apis, suffix in VARIANTS:
+                    encoding, bom = ENCODINGS[encodings[files % len(encodings)]]
+                    data = bom + render_log(workload, size_bytes, files_on_disk, with_response_apis,
+                                            runs, rng, start, level).encode(encoding)
+                    name = f'{workload}-{suffix}.log'
+                    if compress:
+                        data = COMPRESSORS[compress](data)
+                        name += f'.{compress}'
+                    (platform_dir / name).write_bytes(data)
+                    files += 1
+                    total_bytes += len(data)
+    return {'files': files, 'bytes': total_bytes}
+
+
+def main():
+    """Main function with command line interface"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic log corpus for performance_analyzer.py")
+    parser.add_argument('output', type=str, help='Directory to write platform folders into')
+    parser.add_argument('--platforms', type=int, default=3, help='Number of platforms (default: 3)')
+    parser.add_argument('--configurations', type=int, default=4,
+                      help='Workload configurations per platform, 4 logs each (default: 4)')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per log (default: 10)')
+    parser.add_argument('--encodings', nargs='+', choices=list(ENCODINGS), default=['utf-8'],
+                      help='Encodings assigned round-robin across files (default: utf-8)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1],
+                      help='Concurrency levels (Nx workloads) per configuration (default: 1)')
+    parser.add_argument('--compress', choices=list(COMPRESSORS),
+                      help='Write compressed logs (.log.gz or .log.xz)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    counts = generate_corpus(Path(args.output), args.platforms, args.configurations,
+                             args.runs, args.encodings, args.seed, args.compress,
+                             args.concurrency)
+    print(f"Wrote {counts['files']} log files ({counts['bytes'] / 1024**2:.1f} MiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,92 @@ Supports multiple platforms (Linux, Windows, etc.)
 import os
 import re
 import json
+from array import array
+from collections.abc import Sequence
 import csv
+import gzip
 import argparse
+import atexit
+import bz2
+import calendar
+import contextlib
+import hashlib
+import io
+import lzma
+import mmap
+import pickle
+import random
+import socket
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from fractions import Fraction
+from bisect import bisect_left, bisect_right
+from itertools import combinations
+from functools import lru_cache
+from math import ceil, comb, exp, fsum, isnan, lgamma, log, nan
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from statistics import mean, median, stdev
+from dataclasses import dataclass, field
+from statistics import NormalDist, mean, median, stdev
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # optional: RunStore falls back to the statistics module
+    np = None
+
+try:
+    import resource
+except ImportError:  # optional (not on Windows): --profile then omits peak RSS
+    resource = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:  # optional: .log.zst files are skipped without it
+        zstd = None
+
+
+# Test name tokens that encode the storage or API variant rather than the workload
+VARIANT_TOKEN_PATTERN = re.compile(r'-(?:ram|regular|withresponse)(?=-|$)')
+
+# Compressed log suffixes and their streaming (binary, decompress-as-you-read) openers
+LOG_OPENERS = {'.gz': gzip.open, '.xz': lzma.open, '.bz2': bz2.open}
+if zstd is not None:
+    LOG_OPENERS['.zst'] = zstd.open
+
+
+def is_log_file(path: Path) -> bool:
+    """Whether a path is a plain or (supported) compressed log"""
+    return path.suffix == '.log' or (path.suffix in LOG_OPENERS and Path(path.stem).suffix == '.log')
+
+
+def log_stem(path: Path) -> str:
+    """Test name of a log file, ignoring any compression suffix (x.log.gz -> x)"""
+    if path.suffix in LOG_OPENERS:
+        path = Path(path.stem)
+    return path.stem
+
+
+def open_log(path: Path):
+    """Open a log for binary reading, decompressing on the fly when compressed"""
+    opener = LOG_OPENERS.get(path.suffix)
+    return opener(path, 'rb') if opener is not None and Path(path.stem).suffix == '.log' else open(path, 'rb')
+
+
+def list_log_files(directory: Path) -> List[Path]:
+    """Sorted logs in a directory; a plain .log wins over a compressed copy of itself"""
+    candidates = [path for path in directory.glob("*.log*") if is_log_file(path)]
+    plain = {path.name for path in candidates if path.suffix == '.log'}
+    return sorted(path for path in candidates if path.suffix == '.log' or path.stem not in plain)
+
 
 @dataclass
 class TestRun:
@@ -25,6 +103,18 @@ class TestRun:
     gbps: float
 
 
+@dataclass
+class TaskSpec:
+    """One entry of a log's Tasks: section"""
+    action: str
+    size_bytes: int
+    key: str
+
+
+# Concurrency factor in a workload name (download-5GiB-4x -> 4)
+CONCURRENCY_PATTERN = re.compile(r'-(\d+)x(?=-|$)')
+
+
 @dataclass
 class TestResult:
     """Represents complete test results from a log file"""
@@ -36,573 +126,4540 @@ class TestResult:
     max_repeat_count: int
     max_repeat_secs: int
     runs: List[TestRun]
+    # Start/End time lines as seconds since the epoch, reading the logged wall
+    # clock as UTC (only differences are used); None when a line is missing
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    # Every Tasks: entry and the logged total bytes per run (None when missing)
+    tasks: List[TaskSpec] = field(default_factory=list)
+    total_bytes_per_run: Optional[int] = None
+    # Run time and throughput sketches, fed by the parser as it reads each run
+    time_sketch: Optional['QuantileSketch'] = field(default=None, repr=False, compare=False)
+    throughput_sketch: Optional['QuantileSketch'] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def task_signature(self) -> str:
+        """Workload name without storage/API variant tokens (e.g. download-5GiB-1x)"""
+        return VARIANT_TOKEN_PATTERN.sub('', self.test_name)
+    
+    @property
+    def concurrency(self) -> int:
+        """Concurrency level from the workload name's Nx token, else the task count"""
+        match = CONCURRENCY_PATTERN.search(self.task_signature)
+        if match:
+            return int(match.group(1))
+        return max(1, len(self.tasks))
+    
+    def column(self, attr: str) -> List:
+        """One TestRun field for every run, read straight from the store when runs are a RunView"""
+        if isinstance(self.runs, RunView):
+            return self.runs.column(attr)
+        return [getattr(run, attr) for run in self.runs]
     
     def get_stats(self) -> Dict[str, float]:
         """Calculate statistical metrics for the test runs"""
-        times = [run.seconds for run in self.runs]
-        throughputs = [run.gbps for run in self.runs]
+        return run_stats(self.column('seconds'), self.column('gbps'))
+    
+    def get_robust_stats(self) -> Dict[str, object]:
+        """Warm-up split, steady-state/cold-start figures, robust estimators and outlier runs
+        
+        Warm-up runs are found by changepoint detection on the run times (see
+        detect_warmup); outliers are steady-state runs whose time is more than
+        OUTLIER_Z robust standard deviations from the steady-state median.
+        """
+        times = self.column('seconds')
+        throughputs = self.column('gbps')
+        warmup = detect_warmup(times)
+        steady_times, steady_throughputs = times[warmup:], throughputs[warmup:]
+        
+        center = median(steady_times)
+        scale = robust_scale(steady_times)
+        outliers = [run_number for run_number, seconds in zip(self.column('run_number')[warmup:], steady_times)
+                    if abs(seconds - center) > OUTLIER_Z * scale]
+        
+        return {
+            'warmup_runs': warmup,
+            'cold_start_time': times[0],
+            'cold_start_throughput': throughputs[0],
+            'steady_state_time': mean(steady_times),
+            'steady_state_throughput': mean(steady_throughputs),
+            'trimmed_mean_time': trimmed_mean(times),
+            'trimmed_mean_throughput': trimmed_mean(throughputs),
+            'mad_time': median_absolute_deviation(times),
+            'mad_throughput': median_absolute_deviation(throughputs),
+            'outlier_runs': outliers,
+        }
+    
+    def sketches(self) -> Tuple['QuantileSketch', 'QuantileSketch']:
+        """Run time and throughput sketches, built from the runs only for results no parser fed"""
+        if self.time_sketch is None or self.throughput_sketch is None:
+            self.time_sketch, self.throughput_sketch = QuantileSketch(), QuantileSketch()
+            self.time_sketch.extend(self.column('seconds'))
+            self.throughput_sketch.extend(self.column('gbps'))
+        return self.time_sketch, self.throughput_sketch
+    
+    def get_tail_stats(self) -> Dict[str, object]:
+        """p50/p90/p99/p99.9 of run time and throughput and a throughput histogram
+        
+        Read from the result's quantile sketches (see QuantileSketch), which
+        the parsers and the snapshot reader feed run by run and which hold at
+        most SKETCH_MAX_BUCKETS buckets whatever the run count. The run list
+        is still kept for the other statistics; --columnar compacts it into
+        the RunStore's arrays.
+        """
+        return tail_stats(*self.sketches())
+    
+    def get_overhead_stats(self) -> Dict[str, object]:
+        """Wall-clock duration against measured run time, and why the test stopped
+        
+        Overhead is everything between the Start and End time lines that is not
+        a measured transfer: setup, teardown and gaps between runs. Timestamps
+        have one-second resolution, so short tests carry up to ~1 s of error.
+        The stop reason is 'count' when MaxRepeatCount runs completed, 'time'
+        when MaxRepeatSecs was reached first, and 'incomplete' otherwise.
+        """
+        measured = sum(self.column('seconds'))
+        wall = None
+        if self.start_time is not None and self.end_time is not None:
+            wall = self.end_time - self.start_time
         
+        if len(self.runs) >= self.max_repeat_count:
+            stop_reason = 'count'
+        elif max(measured, wall or 0.0) >= self.max_repeat_secs:
+            stop_reason = 'time'
+        else:
+            stop_reason = 'incomplete'
+        
+        overhead = wall - measured if wall is not None else None
         return {
-            'mean_time': mean(times),
-            'median_time': median(times),
-            'min_time': min(times),
-            'max_time': max(times),
-            'std_time': stdev(times) if len(times) > 1 else 0.0,
-            'mean_throughput': mean(throughputs),
-            'median_throughput': median(throughputs),
-            'min_throughput': min(throughputs),
-            'max_throughput': max(throughputs),
-            'std_throughput': stdev(throughputs) if len(throughputs) > 1 else 0.0
+            'wall_clock_secs': wall,
+            'measured_secs': measured,
+            'overhead_secs': overhead,
+            'overhead_per_run_secs': overhead / len(self.runs) if overhead is not None and self.runs else None,
+            'efficiency_percent': measured / wall * 100 if wall else None,
+            'stop_reason': stop_reason,
         }
+    
+    def run_windows(self) -> List[Tuple[float, float]]:
+        """Estimated (start, end) wall-clock window of each run; empty without a Start time
+        
+        Runs are laid out back to back from the Start time, with any harness
+        overhead up to the End time spread evenly before, between and after them.
+        """
+        if self.start_time is None:
+            return []
+        measured = sum(run.seconds for run in self.runs)
+        gap = 0.0
+        if self.end_time is not None and self.end_time - self.start_time > measured:
+            gap = (self.end_time - self.start_time - measured) / (len(self.runs) + 1)
+        windows = []
+        position = self.start_time + gap
+        for run in self.runs:
+            windows.append((position, position + run.seconds))
+            position += run.seconds + gap
+        return windows
 
 
-class LogParser:
-    """Parses performance log files and extracts test data"""
+def run_stats(times, throughputs) -> Dict[str, float]:
+    """Mean/median/min/max/std of run times and throughputs (see TestResult.get_stats)"""
+    return {
+        'mean_time': mean(times),
+        'median_time': median(times),
+        'min_time': min(times),
+        'max_time': max(times),
+        'std_time': stdev(times) if len(times) > 1 else 0.0,
+        'mean_throughput': mean(throughputs),
+        'median_throughput': median(throughputs),
+        'min_throughput': min(throughputs),
+        'max_throughput': max(throughputs),
+        'std_throughput': stdev(throughputs) if len(throughputs) > 1 else 0.0
+    }
+
+
+# Warm-up detection: at most this fraction of runs may be warm-up, at least
+# WARMUP_MIN_STEADY runs must remain, and every warm-up run must sit more than
+# WARMUP_Z robust standard deviations from the steady-state median
+WARMUP_MAX_FRACTION = 0.5
+WARMUP_MIN_STEADY = 3
+WARMUP_Z = 3.5
+OUTLIER_Z = 3.5
+# Floor for the robust scale, relative to the median, so that sub-percent
+# jitter in otherwise identical runs is never flagged
+ROBUST_SCALE_FLOOR = 0.005
+TRIM_PROPORTION = 0.1
+
+
+# Start/End time layouts: Unix `date` (zone name removed) and Windows Get-Date
+TIMESTAMP_FORMATS = ['%a %b %d %H:%M:%S %Y', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %I:%M:%S %p',
+                     '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S']
+TIMESTAMP_ZONE_PATTERN = re.compile(r' [A-Z]{2,5}(?= \d{4}$)')
+
+
+def parse_timestamp(text: str) -> Optional[float]:
+    """Seconds since the epoch for a logged Start/End time, or None if unrecognised"""
+    text = TIMESTAMP_ZONE_PATTERN.sub('', text.strip())
+    for layout in TIMESTAMP_FORMATS:
+        try:
+            return float(calendar.timegm(time.strptime(text, layout)))
+        except ValueError:
+            continue
+    return None
+
+
+def median_absolute_deviation(values: List[float]) -> float:
+    center = median(values)
+    return median([abs(v - center) for v in values])
+
+
+def robust_scale(values: List[float]) -> float:
+    """MAD scaled to a normal standard deviation, floored relative to the median"""
+    return max(1.4826 * median_absolute_deviation(values), ROBUST_SCALE_FLOOR * abs(median(values)))
+
+
+def trimmed_mean(values: List[float], proportion: float = TRIM_PROPORTION) -> float:
+    """Mean after dropping ``proportion`` of the values from each end"""
+    ordered = sorted(values)
+    cut = int(len(ordered) * proportion)
+    return mean(ordered[cut:len(ordered) - cut])
+
+
+def detect_warmup(values: List[float]) -> int:
+    """Number of leading transient runs, found with a single mean-shift changepoint
     
-    def __init__(self):
-        self.workload_pattern = re.compile(r'- MaxRepeatCount: (\d+)')
-        self.repeat_secs_pattern = re.compile(r'- MaxRepeatSecs: (\d+)')
-        self.files_on_disk_pattern = re.compile(r'- FilesOnDisk: (True|False)')
-        self.with_response_pattern = re.compile(r'- WithResponseApis: (True|False)')
-        self.task_pattern = re.compile(r'- Task: action=download, size=([\d,]+) bytes')
-        self.run_pattern = re.compile(r'Run:(\d+) Secs:([\d.]+) Gb/s:([\d.]+)')
+    The split minimising the two segments' summed squared error is located
+    with prefix sums in O(n), restricted to the first WARMUP_MAX_FRACTION of
+    the series. It is kept only if every run before it is an outlier relative
+    to the runs after it, so steady series report no warm-up.
+    """
+    n = len(values)
+    limit = min(int(n * WARMUP_MAX_FRACTION), n - WARMUP_MIN_STEADY)
+    if limit < 1:
+        return 0
     
-    def parse_log_file(self, file_path: Path) -> Optional[TestResult]:
-        """Parse a single log file and return TestResult"""
+    prefix, prefix_sq = [0.0], [0.0]
+    for v in values:
+        prefix.append(prefix[-1] + v)
+        prefix_sq.append(prefix_sq[-1] + v * v)
+    
+    def sse(start: int, end: int) -> float:
+        total = prefix[end] - prefix[start]
+        return (prefix_sq[end] - prefix_sq[start]) - total * total / (end - start)
+    
+    split = min(range(1, limit + 1), key=lambda k: sse(0, k) + sse(k, n))
+    steady = values[split:]
+    center, scale = median(steady), robust_scale(steady)
+    if all(abs(v - center) > WARMUP_Z * scale for v in values[:split]):
+        return split
+    return 0
+
+
+# Statistic keys (time, throughput) used as the central value of a comparison
+ESTIMATORS = {
+    'mean': ('mean_time', 'mean_throughput'),
+    'median': ('median_time', 'median_throughput'),
+    'trimmed_mean': ('trimmed_mean_time', 'trimmed_mean_throughput'),
+    'steady_state': ('steady_state_time', 'steady_state_throughput'),
+}
+# Statistic of a run sample that the significance test compares for each
+# estimator (steady-state is the mean of the post-warm-up runs)
+ESTIMATOR_STATISTICS = {
+    'mean': 'mean',
+    'median': 'median',
+    'trimmed_mean': 'trimmed_mean',
+    'steady_state': 'mean',
+}
+ESTIMATOR_LABELS = {
+    'mean': 'Average',
+    'median': 'Median',
+    'trimmed_mean': 'Trimmed Mean',
+    'steady_state': 'Steady-State',
+}
+
+
+# Concurrency knee: the first level where stepping up to the next measured
+# level adds less than this fraction of aggregate throughput
+SCALING_KNEE_GAIN = 0.10
+
+
+def find_scaling_knee(levels: List[Tuple[int, float]]) -> Optional[int]:
+    """Last concurrency level before aggregate throughput gains drop below SCALING_KNEE_GAIN
+    
+    ``levels`` is a list of (concurrency, aggregate Gb/s) sorted by concurrency.
+    Returns None with fewer than two levels (no scaling data), and the highest
+    level when every step still pays off (the knee was not reached).
+    """
+    if len(levels) < 2:
+        return None
+    for (level, aggregate), (_, next_aggregate) in zip(levels, levels[1:]):
+        if next_aggregate < aggregate * (1 + SCALING_KNEE_GAIN):
+            return level
+    return levels[-1][0]
+
+
+# Object sizes throughput is predicted for by the size-scaling model
+PREDICTION_SIZES = [1024**2, 10 * 1024**2, 100 * 1024**2, 1024**3, 10 * 1024**3, 100 * 1024**3]
+SIZE_UNITS = {'B': 1, 'KiB': 1024, 'MiB': 1024**2, 'GiB': 1024**3, 'TiB': 1024**4}
+SIZE_PATTERN = re.compile(r'^\s*([0-9]+(?:\.[0-9]+)?)\s*(B|KiB|MiB|GiB|TiB)?\s*$')
+
+
+def argument_type(parse):
+    """Wrap a parsing function for argparse so its ValueError message is shown"""
+    def convert(text: str):
         try:
-            # Detect encoding by reading BOM (Byte Order Mark)
-            encoding = 'utf-8'
-            with open(file_path, 'rb') as f:
-                bom = f.read(2)
-                if bom == b'\xff\xfe':
-                    encoding = 'utf-16-le'
-                elif bom == b'\xfe\xff':
-                    encoding = 'utf-16-be'
-                elif bom.startswith(b'\xef\xbb\xbf'):
-                    encoding = 'utf-8-sig'
-            
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            
-            # Extract platform from path (e.g., linux/, windows/)
-            platform = file_path.parent.name
-            test_name = file_path.stem
-            
-            # Parse workload configuration
-            max_repeat_count = int(self.workload_pattern.search(content).group(1))
-            max_repeat_secs = int(self.repeat_secs_pattern.search(content).group(1))
-            files_on_disk = self.files_on_disk_pattern.search(content).group(1) == 'True'
-            with_response_apis = self.with_response_pattern.search(content).group(1) == 'True'
-            
-            # Parse file size (remove commas)
-            size_match = self.task_pattern.search(content)
-            file_size_bytes = int(size_match.group(1).replace(',', ''))
-            
-            # Parse test runs
-            runs = []
-            for match in self.run_pattern.finditer(content):
-                run_number = int(match.group(1))
-                seconds = float(match.group(2))
-                gbps = float(match.group(3))
-                runs.append(TestRun(run_number, seconds, gbps))
-            
-            return TestResult(
-                platform=platform,
-                test_name=test_name,
-                file_size_bytes=file_size_bytes,
-                files_on_disk=files_on_disk,
-                with_response_apis=with_response_apis,
-                max_repeat_count=max_repeat_count,
-                max_repeat_secs=max_repeat_secs,
-                runs=runs
-            )
-        
-        except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
+            return parse(text)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+    convert.__name__ = parse.__name__
+    return convert
+
+
+def parse_size(text: str) -> int:
+    """Byte count of a size such as '5GiB', '100MiB' or '4096'"""
+    match = SIZE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"invalid size: {text!r}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2) or 'B'])
+
+
+def parse_listen_address(text: str) -> Tuple[str, int]:
+    """(host, port) of a '[HOST:]PORT' listen address; the host defaults to 127.0.0.1 and port 0 picks a free one"""
+    host, _, port = text.rpartition(':')
+    if not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"invalid [HOST:]PORT: {text!r}")
+    return host or '127.0.0.1', int(port)
+
+
+def bytes_per_run(result: TestResult) -> int:
+    """Bytes moved by one run: the logged total, else the sum of the tasks, else the workload size"""
+    if result.total_bytes_per_run is not None:
+        return result.total_bytes_per_run
+    if result.tasks:
+        return sum(task.size_bytes for task in result.tasks)
+    return result.file_size_bytes
+
+
+@dataclass(frozen=True)
+class SizeModel:
+    """Least-squares fit of run time = overhead + bytes / bandwidth across object sizes"""
+    overhead_secs: float
+    secs_per_byte: float
+    r_squared: float
+    runs: int
+    sizes: Tuple[int, ...]
+    
+    @property
+    def bandwidth_gbps(self) -> Optional[float]:
+        """Asymptotic throughput; None when time does not grow with size (no usable fit)"""
+        return 8 / (self.secs_per_byte * 1e9) if self.secs_per_byte > 0 else None
+    
+    @property
+    def half_bandwidth_bytes(self) -> Optional[float]:
+        """Size at which transfer time equals the fixed overhead (half the asymptotic Gb/s)"""
+        if self.secs_per_byte <= 0 or self.overhead_secs <= 0:
             return None
+        return self.overhead_secs / self.secs_per_byte
+    
+    def predict_secs(self, size_bytes: int) -> float:
+        return self.overhead_secs + size_bytes * self.secs_per_byte
+    
+    def predict_gbps(self, size_bytes: int) -> Optional[float]:
+        secs = self.predict_secs(size_bytes)
+        return size_bytes * 8 / (secs * 1e9) if secs > 0 else None
 
 
-class PerformanceAnalyzer:
-    """Analyzes and compares performance test results"""
+def fit_size_model(sizes: List[int], seconds: List[float]) -> Optional[SizeModel]:
+    """Least squares of seconds on bytes over every run; None with fewer than two sizes
+    
+    Overhead is constrained to be non-negative: when the unconstrained
+    intercept is negative the line is refitted through the origin (pure
+    bandwidth). Solved with NumPy lstsq when NumPy is installed and from the
+    closed-form sums otherwise.
+    """
+    distinct = tuple(sorted(set(sizes)))
+    if len(distinct) < 2:
+        return None
+    if np is not None:
+        x = np.asarray(sizes, dtype=np.float64)
+        y = np.asarray(seconds, dtype=np.float64)
+        (overhead, slope), *_ = np.linalg.lstsq(np.column_stack([np.ones_like(x), x]), y, rcond=None)
+        if overhead < 0:
+            overhead, (slope,) = 0.0, np.linalg.lstsq(x[:, None], y, rcond=None)[0]
+        residual = float(((y - overhead - slope * x) ** 2).sum())
+        total = float(((y - y.mean()) ** 2).sum())
+        overhead, slope = float(overhead), float(slope)
+    else:
+        n = len(sizes)
+        mean_x, mean_y = sum(sizes) / n, sum(seconds) / n
+        sxx = sum((x - mean_x) ** 2 for x in sizes)
+        sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(sizes, seconds))
+        slope = sxy / sxx
+        overhead = mean_y - slope * mean_x
+        if overhead < 0:
+            overhead = 0.0
+            slope = sum(x * y for x, y in zip(sizes, seconds)) / sum(x * x for x in sizes)
+        residual = sum((y - overhead - slope * x) ** 2 for x, y in zip(sizes, seconds))
+        total = sum((y - mean_y) ** 2 for y in seconds)
+    r_squared = 1 - residual / total if total else 1.0
+    return SizeModel(overhead, slope, r_squared, len(sizes), distinct)
+
+
+class RunStore:
+    """Columnar storage of every run in a corpus
+    
+    Runs live in flat typed arrays (seconds, Gb/s, run number; 24 bytes a
+    run) with an offset index marking where each result's runs start, so
+    mean/median/min/max/std for every result come from one vectorized pass
+    when NumPy is installed (and from the statistics module otherwise). A
+    moved result's ``runs`` becomes a RunView over its slice and the TestRun
+    objects are dropped. Only these basic statistics are columnar; robust
+    and tail statistics still run per result over the view's columns.
+    """
+    
+    STAT_FIELDS = [('time', 'seconds'), ('throughput', 'gbps')]
+    # TestRun field -> store array
+    COLUMNS = {'run_number': 'run_numbers', 'seconds': 'seconds', 'gbps': 'gbps'}
     
     def __init__(self):
-        self.parser = LogParser()
-        self.results: Dict[str, List[TestResult]] = {}
+        self.seconds = array('d')
+        self.gbps = array('d')
+        self.run_numbers = array('q')
+        self.offsets = array('q', [0])
+        self.results: List[TestResult] = []
     
-    def scan_directories(self, base_path: Path) -> None:
-        """Scan for platform directories and log files"""
-        for platform_dir in base_path.iterdir():
-            if platform_dir.is_dir():
-                platform_name = platform_dir.name
-                self.results[platform_name] = []
-                
-                # Find all .log files in the platform directory
-                for log_file in platform_dir.glob("*.log"):
-                    result = self.parser.parse_log_file(log_file)
-                    if result:
-                        self.results[platform_name].append(result)
-                
-                print(f"Found {len(self.results[platform_name])} log files in {platform_name}/")
+    @classmethod
+    def from_results(cls, results: List[TestResult], move: bool = False) -> 'RunStore':
+        store = cls()
+        for result in results:
+            store.add(result, move)
+        return store
     
-    def find_test_pairs(self, platform: str) -> List[Tuple[TestResult, TestResult]]:
-        """Find matching regular vs WithResponse API test pairs"""
-        if platform not in self.results:
-            return []
-        
-        pairs = []
-        tests = self.results[platform]
-        
-        for regular_test in tests:
-            if not regular_test.with_response_apis:
-                # Look for corresponding WithResponse test with same configuration
-                # Replace '-regular' suffix with '-withresponse'
-                withresponse_name = regular_test.test_name.replace('-regular', '-withresponse')
-                withresponse_test = next(
-                    (t for t in tests if t.test_name == withresponse_name 
-                     and t.files_on_disk == regular_test.files_on_disk 
-                     and t.file_size_bytes == regular_test.file_size_bytes
-                     and t.with_response_apis), 
-                    None
-                )
-                if withresponse_test:
-                    pairs.append((regular_test, withresponse_test))
+    def add(self, result: TestResult, move: bool = False) -> int:
+        """Append a result's runs and return its position in the store
         
-        return pairs
+        With ``move`` the result's runs are replaced by a RunView over the
+        appended slice, so they are held once, in the store's arrays.
+        """
+        position = len(self.results)
+        start = len(self.seconds)
+        runs = result.runs
+        if isinstance(runs, RunView):
+            for name in self.COLUMNS.values():
+                getattr(self, name).extend(getattr(runs.store, name)[runs.start:runs.stop])
+        else:
+            for run in runs:
+                self.run_numbers.append(run.run_number)
+                self.seconds.append(run.seconds)
+                self.gbps.append(run.gbps)
+        self.offsets.append(len(self.seconds))
+        self.results.append(result)
+        if move:
+            result.runs = RunView(self, start, len(self.seconds))
+        return position
     
-    def calculate_improvement(self, regular: TestResult, withresponse: TestResult) -> Dict[str, float]:
-        """Calculate performance comparison metrics between regular and WithResponse APIs"""
-        regular_stats = regular.get_stats()
-        withresponse_stats = withresponse.get_stats()
+    def __len__(self) -> int:
+        return len(self.results)
+    
+    def compute_stats(self) -> List[Dict[str, float]]:
+        """Statistics for every stored result, in the same shape as TestResult.get_stats"""
+        if np is None or not self.results:
+            return [self._segment_stats_python(position) for position in range(len(self.results))]
         
-        # Calculate difference ratios showing how much better WithResponse is compared to Regular
-        # Values > 1 mean WithResponse is better
-        time_ratio = regular_stats['mean_time'] / withresponse_stats['mean_time']  # Higher = WithResponse is faster
-        throughput_ratio = withresponse_stats['mean_throughput'] / regular_stats['mean_throughput']  # Higher = WithResponse has better throughput
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        columns = {}
+        for label, attr in self.STAT_FIELDS:
+            values = np.frombuffer(getattr(self, attr), dtype=np.float64)
+            for metric, column in segment_stats(values, offsets).items():
+                columns[f'{metric}_{label}'] = column.tolist()
         
+        # Transpose back to one dict per result, keeping the key order of TestResult.get_stats
+        ordered = [columns[key] for key in STATS_KEYS]
+        return [dict(zip(STATS_KEYS, row)) for row in zip(*ordered)]
+    
+    def _segment_stats_python(self, position: int) -> Dict[str, float]:
+        start, end = self.offsets[position], self.offsets[position + 1]
+        return run_stats(self.seconds[start:end], self.gbps[start:end])
+
+
+class RunView(Sequence):
+    """Read-only list of a result's runs backed by a slice of a RunStore
+    
+    TestRun objects are built only when runs are indexed or iterated;
+    ``column`` reads one field for every run straight from the arrays.
+    Pickling (the parse cache, worker processes) yields a plain list.
+    """
+    
+    __slots__ = ('store', 'start', 'stop')
+    
+    def __init__(self, store: RunStore, start: int, stop: int):
+        self.store = store
+        self.start = start
+        self.stop = stop
+    
+    def __len__(self) -> int:
+        return self.stop - self.start
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return RunView(self.store, self.start + start, self.start + max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("run index out of range")
+        position = self.start + index
+        store = self.store
+        return TestRun(store.run_numbers[position], store.seconds[position], store.gbps[position])
+    
+    def __iter__(self):
+        store, window = self.store, slice(self.start, self.stop)
+        return map(TestRun, store.run_numbers[window], store.seconds[window], store.gbps[window])
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, RunView)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def __reduce__(self):
+        return list, (list(self),)
+    
+    def column(self, attr: str) -> List:
+        return getattr(self.store, RunStore.COLUMNS[attr])[self.start:self.stop].tolist()
+
+
+STATS_KEYS = [
+    'mean_time', 'median_time', 'min_time', 'max_time', 'std_time',
+    'mean_throughput', 'median_throughput', 'min_throughput', 'max_throughput', 'std_throughput',
+]
+
+
+def segment_stats(values, offsets) -> Dict[str, object]:
+    """Vectorized mean/median/min/max/sample-std of each values[offsets[i]:offsets[i+1]] (NumPy)
+    
+    Every segment must be non-empty, mirroring the statistics module, which
+    raises on empty data.
+    """
+    starts = offsets[:-1]
+    counts = np.diff(offsets)
+    if (counts == 0).any():
+        raise ValueError("cannot compute statistics for a result without runs")
+    
+    means = np.add.reduceat(values, starts) / counts
+    deviations = values - np.repeat(means, counts)
+    squares = np.add.reduceat(deviations * deviations, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stds = np.where(counts > 1, np.sqrt(squares / (counts - 1)), 0.0)
+    
+    # Sort within segments, then average the one or two middle elements
+    segment_ids = np.repeat(np.arange(len(counts)), counts)
+    ordered = values[np.lexsort((values, segment_ids))]
+    medians = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+    
+    return {
+        'mean': means,
+        'median': medians,
+        'min': np.minimum.reduceat(values, starts),
+        'max': np.maximum.reduceat(values, starts),
+        'std': stds,
+    }
+
+
+class SignificanceTester:
+    """Bootstrap confidence intervals and permutation tests for a pair's throughput
+    
+    The ratio CI resamples each side's runs with replacement and takes
+    percentiles of stat(variant) / stat(baseline), where stat is the central
+    statistic of the chosen estimator (mean, median or trimmed mean). The
+    p-value is a two-sided permutation test on the difference of that
+    statistic between the two sides; it is exact when
+    the number of distinct relabelings is at most ``resamples`` and Monte
+    Carlo otherwise. All resamples are drawn as one matrix when NumPy is
+    installed. Each pair gets its own seeded RNG so results are reproducible
+    and independent of which platforms are processed. When the samples are
+    too small for any p-value to fall below alpha (3 vs 3 runs cannot go
+    under 0.1), significance is decided by whether the CI excludes 1 instead.
+    """
+    
+    INCONCLUSIVE = "Inconclusive"
+    STATISTICS = {'mean': mean, 'median': median, 'trimmed_mean': trimmed_mean}
+    
+    def __init__(self, resamples: int = 5000, confidence: float = 0.95, alpha: float = 0.05,
+                 seed: int = 0):
+        self.resamples = resamples
+        self.confidence = confidence
+        self.alpha = alpha
+        self.seed = seed
+    
+    def _pair_seed(self, key: str) -> int:
+        return self.seed ^ zlib.crc32(key.encode('utf-8'))
+    
+    def test(self, key: str, baseline: List[float], variant: List[float],
+             statistic: str = 'mean') -> Dict[str, float]:
+        """Ratio CI and p-value of ``statistic`` for two samples of per-run throughput"""
+        seed = self._pair_seed(key)
+        if np is not None:
+            low, high = self._bootstrap_numpy(baseline, variant, np.random.default_rng(seed), statistic)
+            p_value = self._permutation_numpy(baseline, variant, np.random.default_rng(seed + 1), statistic)
+        else:
+            low, high = self._bootstrap_python(baseline, variant, random.Random(seed), statistic)
+            p_value = self._permutation_python(baseline, variant, random.Random(seed + 1), statistic)
+        min_p_value = self.min_p_value(len(baseline), len(variant))
+        if min_p_value >= self.alpha:
+            decided_by, significant = 'ci', not low <= 1.0 <= high
+        else:
+            decided_by, significant = 'permutation', p_value < self.alpha
         return {
-            'time_ratio': time_ratio,
-            'throughput_ratio': throughput_ratio,
-            'time_difference_percent': ((withresponse_stats['mean_time'] - regular_stats['mean_time']) / regular_stats['mean_time']) * 100,
-            'throughput_difference_percent': ((withresponse_stats['mean_throughput'] - regular_stats['mean_throughput']) / regular_stats['mean_throughput']) * 100,
-            'regular_mean_time': regular_stats['mean_time'],
-            'withresponse_mean_time': withresponse_stats['mean_time'],
-            'regular_mean_throughput': regular_stats['mean_throughput'],
-            'withresponse_mean_throughput': withresponse_stats['mean_throughput']
+            'ratio_ci_low': low,
+            'ratio_ci_high': high,
+            'confidence': self.confidence,
+            'p_value': p_value,
+            'min_p_value': min_p_value,
+            'decided_by': decided_by,
+            'significant': significant,
         }
     
-    def format_file_size(self, size_bytes: int) -> str:
-        """Format file size in human readable format"""
-        if size_bytes >= 1024**3:
-            return f"{size_bytes / (1024**3):.1f}GiB"
-        elif size_bytes >= 1024**2:
-            return f"{size_bytes / (1024**2):.1f}MiB"
+    def min_p_value(self, n: int, m: int) -> float:
+        """Smallest p-value the permutation test can return for samples of n and m runs"""
+        relabelings = comb(n + m, n)
+        if relabelings <= self.resamples:
+            # The observed split, and with equal sizes its mirror image, always count as extreme
+            return (2 if n == m else 1) / relabelings
+        return 1 / (self.resamples + 1)
+    
+    @staticmethod
+    def verdict(significance: Dict[str, object]) -> str:
+        """'significant' or 'not significant', noting when too few runs left the decision to the CI"""
+        verdict = "significant" if significance['significant'] else "not significant"
+        if significance.get('decided_by') == 'ci':
+            verdict += f" by CI; p cannot go below {significance['min_p_value']:.2f} with these run counts"
+        return verdict
+    
+    @staticmethod
+    def _statistic_numpy(samples, statistic: str):
+        """The statistic of each row of a 2-D array of samples"""
+        if statistic == 'median':
+            return np.median(samples, axis=1)
+        if statistic == 'trimmed_mean':
+            cut = int(samples.shape[1] * TRIM_PROPORTION)
+            return np.sort(samples, axis=1)[:, cut:samples.shape[1] - cut].mean(axis=1)
+        return samples.mean(axis=1)
+    
+    def _bootstrap_numpy(self, baseline: List[float], variant: List[float], rng,
+                         statistic: str = 'mean') -> Tuple[float, float]:
+        base = np.asarray(baseline, dtype=np.float64)
+        var = np.asarray(variant, dtype=np.float64)
+        base_stats = self._statistic_numpy(base[rng.integers(0, len(base), size=(self.resamples, len(base)))], statistic)
+        var_stats = self._statistic_numpy(var[rng.integers(0, len(var), size=(self.resamples, len(var)))], statistic)
+        tail = (1 - self.confidence) / 2
+        low, high = np.quantile(var_stats / base_stats, [tail, 1 - tail])
+        return float(low), float(high)
+    
+    def _bootstrap_python(self, baseline: List[float], variant: List[float], rng: random.Random,
+                          statistic: str = 'mean') -> Tuple[float, float]:
+        stat = self.STATISTICS[statistic]
+        ratios = sorted(
+            stat(rng.choices(variant, k=len(variant))) / stat(rng.choices(baseline, k=len(baseline)))
+            for _ in range(self.resamples)
+        )
+        tail = (1 - self.confidence) / 2
+        return percentile(ratios, tail), percentile(ratios, 1 - tail)
+    
+    def _permutation_numpy(self, baseline: List[float], variant: List[float], rng,
+                           statistic: str = 'mean') -> float:
+        pooled = np.asarray(list(baseline) + list(variant), dtype=np.float64)
+        n = len(baseline)
+        observed = abs(float(self._statistic_numpy(np.asarray([variant], dtype=np.float64), statistic)[0])
+                       - float(self._statistic_numpy(np.asarray([baseline], dtype=np.float64), statistic)[0]))
+        if comb(len(pooled), n) <= self.resamples:
+            groups = np.array(list(combinations(range(len(pooled)), n)))
+            rest = np.ones((len(groups), len(pooled)), dtype=bool)
+            rest[np.arange(len(groups))[:, None], groups] = False
+            complements = np.nonzero(rest)[1].reshape(len(groups), -1)
+            base_samples, var_samples = pooled[groups], pooled[complements]
+            exact = True
         else:
-            return f"{size_bytes}B"
+            shuffled = rng.permuted(np.tile(pooled, (self.resamples, 1)), axis=1)
+            base_samples, var_samples = shuffled[:, :n], shuffled[:, n:]
+            exact = False
+        diffs = np.abs(self._statistic_numpy(var_samples, statistic) - self._statistic_numpy(base_samples, statistic))
+        extreme = int(np.count_nonzero(diffs >= observed * (1 - 1e-12)))
+        return extreme / len(diffs) if exact else (extreme + 1) / (len(diffs) + 1)
+    
+    def _permutation_python(self, baseline: List[float], variant: List[float], rng: random.Random,
+                            statistic: str = 'mean') -> float:
+        stat = self.STATISTICS[statistic]
+        pooled = list(baseline) + list(variant)
+        n = len(baseline)
+        observed = abs(stat(variant) - stat(baseline))
+        if comb(len(pooled), n) <= self.resamples:
+            splits = []
+            for group in combinations(range(len(pooled)), n):
+                chosen = set(group)
+                splits.append(([pooled[i] for i in group], [pooled[i] for i in range(len(pooled)) if i not in chosen]))
+            exact = True
+        else:
+            splits = []
+            for _ in range(self.resamples):
+                shuffled = rng.sample(pooled, len(pooled))
+                splits.append((shuffled[:n], shuffled[n:]))
+            exact = False
+        extreme = sum(1 for base, var in splits if abs(stat(var) - stat(base)) >= observed * (1 - 1e-12))
+        return extreme / len(splits) if exact else (extreme + 1) / (len(splits) + 1)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an already sorted list (NumPy's default method)"""
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+# Quantile sketches: relative error of every reported quantile, bucket budget
+# (bounds memory per sketch whatever the run count), histogram bins, and the
+# percentiles reported for each result
+SKETCH_RELATIVE_ACCURACY = 0.0005
+SKETCH_MAX_BUCKETS = 4096
+HISTOGRAM_BINS = 10
+TAIL_QUANTILES = [('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p99_9', 0.999)]
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch with relative-error guarantees (DDSketch)
+    
+    Positive values are counted in logarithmic buckets (gamma^(i-1), gamma^i]
+    with gamma = (1 + a) / (1 - a), so every quantile is returned within
+    relative error ``a`` of the exact value. At most ``max_buckets`` buckets
+    are kept; beyond that the lowest are collapsed together, giving up
+    accuracy only at the far low end. Two sketches with the same accuracy
+    merge exactly by adding their bucket counts.
+    """
+    
+    __slots__ = ('relative_accuracy', 'max_buckets', 'gamma', 'log_gamma', 'buckets',
+                 'zeros', 'count', 'min', 'max')
+    
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY,
+                 max_buckets: int = SKETCH_MAX_BUCKETS):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zeros = 0  # values <= 0, which have no logarithmic bucket
+        self.count = 0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = ceil(log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+    
+    def extend(self, values) -> None:
+        """Add every value of a sequence; the same sketch as repeated ``add``, with less per-value overhead"""
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, min(values))
+        self.max = max(self.max, max(values))
+        buckets, log_gamma = self.buckets, self.log_gamma
+        for value in values:
+            if value <= 0:
+                self.zeros += 1
+                continue
+            key = ceil(log(value) / log_gamma)
+            if key in buckets:
+                buckets[key] += 1
+            else:
+                buckets[key] = 1
+                if len(buckets) > self.max_buckets:
+                    self._collapse()
+    
+    def _collapse(self) -> None:
+        """Fold the lowest buckets into the lowest one kept, restoring the bucket budget"""
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        self.buckets[target] += sum(self.buckets.pop(key) for key in keys[:excess])
+    
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add another sketch's values to this one"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge quantile sketches with different relative accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+    
+    def to_dict(self) -> Dict[str, object]:
+        """JSON-compatible form, restored by ``from_dict``"""
+        return {'relative_accuracy': self.relative_accuracy, 'max_buckets': self.max_buckets,
+                'buckets': {str(key): count for key, count in self.buckets.items()},
+                'zeros': self.zeros, 'count': self.count,
+                'min': self.min if self.count else None, 'max': self.max if self.count else None}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> 'QuantileSketch':
+        sketch = cls(data['relative_accuracy'], data['max_buckets'])
+        sketch.buckets = {int(key): count for key, count in data['buckets'].items()}
+        sketch.zeros, sketch.count = data['zeros'], data['count']
+        if sketch.count:
+            sketch.min, sketch.max = data['min'], data['max']
+        return sketch
+    
+    def bucket_value(self, key: int) -> float:
+        """Representative of a bucket: within relative_accuracy of anything it holds"""
+        return 2 * self.gamma ** key / (self.gamma + 1)
+    
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (lower rank q * (count - 1)); nan for an empty sketch"""
+        if not self.count:
+            return nan
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return min(0.0, self.max)
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Clamp so the extremes are reported exactly
+                return min(max(self.bucket_value(key), self.min), self.max)
+        return self.max
+    
+    def histogram(self, bins: int = HISTOGRAM_BINS) -> List[Dict[str, float]]:
+        """Equal-width histogram between min and max, built from the bucket counts"""
+        if not self.count:
+            return []
+        width = (self.max - self.min) / bins
+        counts = [0] * bins
+        counts[0] += self.zeros
+        for key, count in self.buckets.items():
+            value = min(max(self.bucket_value(key), self.min), self.max)
+            counts[min(int((value - self.min) / width), bins - 1) if width else 0] += count
+        return [{'low': self.min + i * width, 'high': self.min + (i + 1) * width, 'count': counts[i]}
+                for i in range(bins)]
+
+
+def tail_stats(time_sketch: QuantileSketch, throughput_sketch: QuantileSketch) -> Dict[str, object]:
+    """Reported percentiles and throughput histogram of a result's time and throughput sketches"""
+    return {
+        'time_percentiles': {name: time_sketch.quantile(q) for name, q in TAIL_QUANTILES},
+        'throughput_percentiles': {name: throughput_sketch.quantile(q) for name, q in TAIL_QUANTILES},
+        'throughput_histogram': throughput_sketch.histogram(),
+        'relative_accuracy': time_sketch.relative_accuracy,
+    }
+
+
+def regularized_beta(x: float, a: float, b: float) -> float:
+    """Regularized incomplete beta function I_x(a, b), by Lentz's continued fraction"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        # The continued fraction converges quickly only below the mean; use the symmetry
+        return 1 - regularized_beta(1 - x, b, a)
+    front = exp(lgamma(a + b) - lgamma(a) - lgamma(b) + a * log(x) + b * log(1 - x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    fraction = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            fraction *= c * d
+        if abs(c * d - 1) < 1e-15:
+            break
+    return front * fraction
+
+
+def t_upper_tail(t: float, df: float) -> float:
+    """P(T > t) for Student's t with ``df`` (possibly fractional) degrees of freedom"""
+    tail = regularized_beta(df / (df + t * t), df / 2, 0.5) / 2
+    return tail if t >= 0 else 1 - tail
+
+
+class SampleSizeAdvisor:
+    """How many runs a result needed for a target precision or a settled decision
+    
+    Precision is the relative half-width of the t confidence interval of the
+    mean throughput. Per result this gives the run at which a sequential
+    "enough samples" rule would have stopped (the first count of at least
+    ``min_runs`` steady-state runs meeting the target) and the count
+    recommended from the observed variance. For a pair, the decision run is
+    the first look at which a Welch t-test separates the two sides, with
+    alpha split across every possible look (Bonferroni) so repeated peeking
+    does not inflate false decisions. Student-t quantiles are found by
+    bisection on the exact t distribution, since the fractional Welch degrees
+    of freedom of early looks are where approximations are least accurate.
+    """
+    
+    def __init__(self, target_precision: float = 0.01, confidence: float = 0.95,
+                 alpha: float = 0.05, min_runs: int = 3):
+        self.target_precision = target_precision
+        self.confidence = confidence
+        self.alpha = alpha
+        self.min_runs = max(2, min_runs)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def t_quantile(p: float, df: float) -> float:
+        """Student-t quantile, to about 1e-12 relative; cached since looks repeat the same (p, df)"""
+        if p <= 0.5:
+            return -SampleSizeAdvisor.t_quantile(1 - p, df) if p < 0.5 else 0.0
+        tail = 1 - p
+        low, high = 0.0, 1.0
+        while t_upper_tail(high, df) > tail:
+            low, high = high, high * 2
+        while high - low > 1e-12 * high:
+            middle = (low + high) / 2
+            if t_upper_tail(middle, df) > tail:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+    
+    def half_width(self, count: int, center: float, std: float) -> float:
+        """Relative CI half-width of the mean; inf when it cannot be estimated"""
+        if count < 2 or center <= 0:
+            return float('inf')
+        return self.t_quantile(1 - (1 - self.confidence) / 2, count - 1) * std / count ** 0.5 / center
+    
+    def enough(self, count: int, center: float, std: float) -> bool:
+        """Streaming signal: the runs so far already meet the target precision"""
+        return count >= self.min_runs and self.half_width(count, center, std) <= self.target_precision
+    
+    def required_runs(self, center: float, std: float, limit: int = 100000) -> int:
+        """Smallest run count whose CI meets the target at the observed mean and spread; ``limit`` if none can"""
+        if std == 0:
+            return self.min_runs
+        if center <= 0:
+            # No relative precision is reachable around a non-positive mean (see half_width)
+            return limit
+        z = NormalDist().inv_cdf(1 - (1 - self.confidence) / 2)
+        count = max(self.min_runs, ceil((z * std / (self.target_precision * center)) ** 2))
+        while count < limit and self.half_width(count, center, std) > self.target_precision:
+            count += 1
+        return count
+    
+    def sequential_stop(self, values: List[float]) -> Optional[int]:
+        """Number of values after which the "enough samples" rule first fires; None if never"""
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+            if self.enough(stats.count, stats.mean, stats.std):
+                return stats.count
+        return None
+    
+    def decision_run(self, baseline: List[float], variant: List[float]) -> Optional[int]:
+        """First per-side run count at which the two sides differ significantly; None if never"""
+        looks = min(len(baseline), len(variant)) - self.min_runs + 1
+        if looks < 1:
+            return None
+        base_stats, variant_stats = RunningStats(), RunningStats()
+        for count, (base_value, variant_value) in enumerate(zip(baseline, variant), 1):
+            base_stats.add(base_value)
+            variant_stats.add(variant_value)
+            if count < self.min_runs:
+                continue
+            base_var, variant_var = base_stats.std ** 2 / count, variant_stats.std ** 2 / count
+            difference = abs(variant_stats.mean - base_stats.mean)
+            if base_var + variant_var == 0:
+                if difference > 0:
+                    return count
+                continue
+            df = (base_var + variant_var) ** 2 / ((base_var ** 2 + variant_var ** 2) / (count - 1))
+            critical = self.t_quantile(1 - self.alpha / (2 * looks), max(df, 2))
+            if difference / (base_var + variant_var) ** 0.5 > critical:
+                return count
+        return None
+    
+    def advise(self, result: TestResult) -> Dict[str, object]:
+        """Precision reached, sequential stop, recommended repeat count and time it would save"""
+        warmup = detect_warmup(result.column('seconds'))
+        steady = result.column('gbps')[warmup:]
+        center = mean(steady)
+        std = stdev(steady) if len(steady) > 1 else 0.0
+        stop = self.sequential_stop(steady)
+        recommended = warmup + self.required_runs(center, std)
+        overhead = result.get_overhead_stats()['overhead_per_run_secs'] or 0.0
+        skipped = result.runs[recommended:]
+        return {
+            'runs': len(result.runs),
+            'warmup_runs': warmup,
+            'cv_percent': std / center * 100 if center else None,
+            'precision_percent': self.half_width(len(steady), center, std) * 100,
+            'stopped_at_run': warmup + stop if stop is not None else None,
+            'recommended_runs': recommended,
+            'saved_secs': sum(run.seconds for run in skipped) + overhead * len(skipped),
+        }
+
+
+@dataclass(frozen=True)
+class PairAxis:
+    """A boolean configuration dimension whose two values are compared against each other"""
+    dimension: str
+    baseline_label: str      # display label for the False side, e.g. "Regular"
+    variant_label: str       # display label for the True side, e.g. "WithResponse"
+    variant_short: str       # compact variant label for table headers
+    noun: str                # what the labels describe, e.g. "APIs"
+    context_header: str      # column header for the other boolean dimension
+    context_labels: Tuple[str, str]   # labels for the other dimension (False, True)
+    context_phrases: Tuple[str, str]  # phrases for the other dimension in headings
+    
+    @property
+    def context_dimension(self) -> str:
+        """The boolean dimension that is held fixed within a pair"""
+        return 'files_on_disk' if self.dimension == 'with_response_apis' else 'with_response_apis'
+    
+    @property
+    def baseline_key(self) -> str:
+        return self.baseline_label.lower()
+    
+    @property
+    def variant_key(self) -> str:
+        return self.variant_label.lower()
+    
+    @property
+    def singular_noun(self) -> str:
+        return self.noun[:-1] if self.noun.endswith('s') else self.noun
+    
+    @property
+    def baseline_name(self) -> str:
+        return f"{self.baseline_label} {self.noun}"
+    
+    @property
+    def variant_name(self) -> str:
+        return f"{self.variant_label} {self.noun}"
+    
+    @property
+    def faster_header(self) -> str:
+        """Header of the column naming the faster side (Faster API, Faster Storage)"""
+        return f"Faster {self.singular_noun}"
+    
+    def base_name(self, test_name: str) -> str:
+        """Display name of a pair's workload, without the tokens of the compared dimension"""
+        if self.dimension == 'files_on_disk':
+            test_name = test_name.replace('-ram', '')
+        name = test_name.replace('-regular', '').replace('-withresponse', '').replace('-1x', '').replace('GiB-', 'GiB ')
+        return name.replace('-ram', ' (RAM)')
+    
+    def context_label(self, result: TestResult) -> str:
+        return self.context_labels[getattr(result, self.context_dimension)]
+    
+    def context_phrase(self, result: TestResult) -> str:
+        return self.context_phrases[getattr(result, self.context_dimension)]
+    
+    def pair_key(self, result: TestResult) -> Tuple:
+        """Configuration tuple that must match between the two sides of a pair"""
+        return (result.file_size_bytes, getattr(result, self.context_dimension),
+                result.max_repeat_count, result.task_signature)
+
+
+PAIR_AXES = {
+    'with_response_apis': PairAxis('with_response_apis', 'Regular', 'WithResponse', 'WithResp', 'APIs',
+                                   'Storage', ('RAM', 'Disk'), ('to RAM', 'to Disk')),
+    'files_on_disk': PairAxis('files_on_disk', 'RAM', 'Disk', 'Disk', 'Storage',
+                              'API', ('Regular', 'WithResponse'),
+                              ('with Regular APIs', 'with WithResponse APIs')),
+}
+
+
+@dataclass(frozen=True)
+class PairComparison:
+    """Precomputed statistics and comparison metrics for one (baseline, variant) pair"""
+    platform: str
+    baseline: TestResult
+    variant: TestResult
+    baseline_stats: Dict[str, float]
+    variant_stats: Dict[str, float]
+    metrics: Dict[str, float]
+    faster: str
+    significance: Optional[Dict[str, float]] = None
+    baseline_robust: Optional[Dict[str, object]] = None
+    variant_robust: Optional[Dict[str, object]] = None
+    baseline_tail: Optional[Dict[str, object]] = None
+    variant_tail: Optional[Dict[str, object]] = None
+
+
+@dataclass(frozen=True)
+class ComparisonModel:
+    """Immutable analysis of a scanned corpus shared by every report and exporter
+    
+    Built once per scan: each TestResult's stats are computed a single time
+    and each pair's metrics derived from those memoized stats.
+    """
+    axis: PairAxis
+    pairs: Dict[str, Tuple[PairComparison, ...]]
+    stats_computed: int
+    
+    def pairs_for(self, platform: str) -> Tuple[PairComparison, ...]:
+        return self.pairs.get(platform, ())
+
+
+def task_size(result: TestResult) -> int:
+    """Bytes moved by one task: the first Tasks: entry, else the workload size"""
+    return result.tasks[0].size_bytes if result.tasks else result.file_size_bytes
+
+
+# Dimensions a comparison matrix can pivot on, and the value a result takes in each.
+# Platform directories are named <os>_<runtime> (e.g. linux_netstandard).
+COMPARE_DIMENSIONS = {
+    'platform': lambda result: result.platform,
+    'os': lambda result: result.platform.partition('_')[0],
+    'runtime': lambda result: result.platform.partition('_')[2],
+    'storage': lambda result: 'Disk' if result.files_on_disk else 'RAM',
+    'api': lambda result: 'WithResponse' if result.with_response_apis else 'Regular',
+    'concurrency': lambda result: f"{result.concurrency}x",
+}
+MATCH_VALUES = {**COMPARE_DIMENSIONS, 'size': task_size}
+MATCH_COLUMNS = {
+    'platform': 'Platform', 'os': 'OS', 'runtime': 'Runtime', 'size': 'Task_Size_Bytes',
+    'concurrency': 'Concurrency', 'storage': 'Storage', 'api': 'API',
+}
+
+
+def match_dimensions(pivot: str) -> Tuple[str, ...]:
+    """Dimensions that must agree between the cells of one comparison matrix row
+    
+    Everything except the pivot: pivoting on the OS keeps the runtime part of
+    the platform name fixed (and vice versa), pivoting on the platform frees
+    both, and any other pivot holds the whole platform fixed.
+    """
+    platform_parts = {'platform': (), 'os': ('runtime',), 'runtime': ('os',)}.get(pivot, ('platform',))
+    return platform_parts + tuple(d for d in ('size', 'concurrency', 'storage', 'api') if d != pivot)
+
+
+@dataclass(frozen=True)
+class MatrixCell:
+    """One result's central throughput within a comparison matrix row"""
+    result: TestResult
+    throughput: float
+    ratio: float        # throughput / baseline throughput (1.0 for the baseline cell)
+    significance: Optional[Dict[str, float]] = None
+
+
+@dataclass(frozen=True)
+class MatrixRow:
+    """The baseline and every other pivot value measured on one matching configuration"""
+    match: Tuple[Tuple[str, object], ...]   # (dimension, value) shared by every cell
+    baseline: MatrixCell
+    cells: Dict[str, MatrixCell]            # pivot value -> cell
+    
+    def involves(self, platform: str) -> bool:
+        return any(cell.result.platform == platform for cell in (self.baseline, *self.cells.values()))
+
+
+@dataclass(frozen=True)
+class ComparisonMatrix:
+    """Throughput ratios of every value of a pivot dimension against a baseline value
+    
+    Rows are configurations that match on every other dimension; rows without
+    the baseline value, or with nothing to compare it to, are left out.
+    """
+    dimension: str
+    baseline: str
+    values: Tuple[str, ...]                 # the other pivot values, sorted
+    match_dimensions: Tuple[str, ...]
+    rows: Tuple[MatrixRow, ...]
+    
+    def rows_for(self, platform: Optional[str]) -> Tuple[MatrixRow, ...]:
+        if platform is None:
+            return self.rows
+        return tuple(row for row in self.rows if row.involves(platform))
+    
+    @staticmethod
+    def geometric_mean_ratios(rows: Tuple[MatrixRow, ...], values: Tuple[str, ...]) -> Dict[str, Optional[float]]:
+        """Per-value geometric mean of the ratios (the average of ratios that is symmetric in the baseline)"""
+        means = {}
+        for value in values:
+            ratios = [row.cells[value].ratio for row in rows if value in row.cells]
+            means[value] = exp(mean(log(ratio) for ratio in ratios)) if ratios else None
+        return means
+
+
+# Query fields: name -> value of a result. Ordered fields support range predicates
+QUERY_FIELDS = {
+    'platform': COMPARE_DIMENSIONS['platform'],
+    'os': COMPARE_DIMENSIONS['os'],
+    'runtime': COMPARE_DIMENSIONS['runtime'],
+    'storage': COMPARE_DIMENSIONS['storage'],
+    'api': COMPARE_DIMENSIONS['api'],
+    'size': lambda result: result.file_size_bytes,
+    'task_size': task_size,
+    'concurrency': lambda result: result.concurrency,
+    'repeat': lambda result: result.max_repeat_count,
+    'repeat_secs': lambda result: result.max_repeat_secs,
+    'test': lambda result: result.task_signature,
+}
+ORDERED_QUERY_FIELDS = {'size', 'task_size', 'concurrency', 'repeat', 'repeat_secs'}
+QUERY_OPERATORS = ('>=', '<=', '!=', '==', '=', '>', '<')
+QUERY_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|!=|==|=|>|<)\s*(.+?)\s*$')
+QUERY_STATISTICS = ['mean', 'median', 'min', 'max', 'std', 'p50', 'p90', 'p99', 'p99_9']
+QUERY_METRICS = {'gbps': 'gbps', 'secs': 'seconds'}
+
+
+def parse_query_value(field: str, text: str):
+    """Typed value of a query field: sizes like 5GiB, integers, '4x' concurrency, case-insensitive labels"""
+    if field in ('size', 'task_size'):
+        return parse_size(text)
+    if field == 'concurrency':
+        return int(text.lower().rstrip('x'))
+    if field in ORDERED_QUERY_FIELDS:
+        return int(text)
+    if field in ('storage', 'api'):
+        labels = ('Disk', 'RAM') if field == 'storage' else ('Regular', 'WithResponse')
+        for label in labels:
+            if label.lower() == text.lower():
+                return label
+        raise ValueError(f"{field} must be one of: {', '.join(labels)}")
+    return text
+
+
+def parse_predicate(text: str) -> Tuple[str, str, Tuple]:
+    """Parse 'field OP value[,value...]' into (field, operator, typed values)"""
+    match = QUERY_PATTERN.match(text)
+    if not match or match.group(1) not in QUERY_FIELDS:
+        raise ValueError(f"invalid filter {text!r}; expected FIELD OP VALUE with FIELD one of "
+                         f"{', '.join(QUERY_FIELDS)} and OP one of {' '.join(QUERY_OPERATORS)}")
+    field, operator, values = match.groups()
+    if operator in ('>', '<', '>=', '<=') and field not in ORDERED_QUERY_FIELDS:
+        raise ValueError(f"range filter on unordered field {field!r}")
+    typed = tuple(parse_query_value(field, value) for value in values.split(','))
+    return field, '=' if operator == '==' else operator, typed
+
+
+def parse_fields(text: str) -> List[str]:
+    """Comma-separated query field names, e.g. 'platform,storage'"""
+    fields = [field.strip() for field in text.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in QUERY_FIELDS]
+    if unknown or not fields:
+        raise ValueError(f"unknown field(s) {', '.join(unknown) or text!r}; expected any of {', '.join(QUERY_FIELDS)}")
+    return fields
+
+
+def parse_aggregate(text: str) -> str:
+    """Validate an aggregate name: count, runs or <statistic>_<gbps|secs> (e.g. p50_gbps)"""
+    statistic, _, metric = text.rpartition('_')
+    if text in ('count', 'runs') or (statistic in QUERY_STATISTICS and metric in QUERY_METRICS):
+        return text
+    raise ValueError(f"invalid aggregate {text!r}; expected count, runs or STAT_METRIC with STAT one of "
+                     f"{', '.join(QUERY_STATISTICS)} and METRIC one of {', '.join(QUERY_METRICS)}")
+
+
+class ResultIndex:
+    """Secondary indexes over parsed results for filter, group-by and aggregate queries
+    
+    Every query field gets a hash index (value -> sorted result positions);
+    ordered fields also keep their sorted distinct values, so a range
+    predicate is a bisect plus a union of posting lists. Predicates are
+    intersected starting with the most selective, and no result outside the
+    candidate set is visited.
+    """
+    
+    def __init__(self, results: List[TestResult]):
+        self.results = results
+        self.postings: Dict[str, Dict[object, List[int]]] = {field: {} for field in QUERY_FIELDS}
+        for position, result in enumerate(results):
+            for field, value_of in QUERY_FIELDS.items():
+                self.postings[field].setdefault(value_of(result), []).append(position)
+        self.sorted_keys = {field: sorted(self.postings[field]) for field in ORDERED_QUERY_FIELDS}
+    
+    def lookup(self, field: str, operator: str, values: Tuple) -> set:
+        """Positions of the results matching one predicate"""
+        postings = self.postings[field]
+        if operator in ('=', '!='):
+            matched = set()
+            for value in values:
+                matched.update(postings.get(value, ()))
+            return matched if operator == '=' else set(range(len(self.results))) - matched
+        keys = self.sorted_keys[field]
+        bound = values[0]
+        if operator == '>=':
+            selected = keys[bisect_left(keys, bound):]
+        elif operator == '>':
+            selected = keys[bisect_right(keys, bound):]
+        elif operator == '<=':
+            selected = keys[:bisect_right(keys, bound)]
+        else:
+            selected = keys[:bisect_left(keys, bound)]
+        return {position for key in selected for position in postings[key]}
+    
+    def select(self, predicates: List[Tuple[str, str, Tuple]]) -> List[TestResult]:
+        """Results matching every predicate, in corpus order"""
+        if not predicates:
+            return list(self.results)
+        matches = sorted((self.lookup(*predicate) for predicate in predicates), key=len)
+        positions = matches[0].intersection(*matches[1:])
+        return [self.results[position] for position in sorted(positions)]
+    
+    @staticmethod
+    def aggregate(results: List[TestResult], group_by: List[str], aggregates: List[str]) -> List[Dict[str, object]]:
+        """One row per group (sorted by group values) with each aggregate over the group's pooled runs"""
+        groups: Dict[Tuple, List[TestResult]] = {}
+        for result in results:
+            groups.setdefault(tuple(QUERY_FIELDS[field](result) for field in group_by), []).append(result)
+        rows = []
+        for key in sorted(groups):
+            members = groups[key]
+            row = dict(zip(group_by, key))
+            pooled: Dict[str, List[float]] = {}
+            for name in aggregates:
+                if name == 'count':
+                    row[name] = len(members)
+                    continue
+                if name == 'runs':
+                    row[name] = sum(len(result.runs) for result in members)
+                    continue
+                statistic, _, metric = name.rpartition('_')
+                if metric not in pooled:
+                    attr = QUERY_METRICS[metric]
+                    pooled[metric] = sorted(getattr(run, attr) for result in members for run in result.runs)
+                values = pooled[metric]
+                if not values:
+                    row[name] = None
+                elif statistic == 'mean':
+                    row[name] = mean(values)
+                elif statistic == 'median':
+                    row[name] = median(values)
+                elif statistic == 'min':
+                    row[name] = values[0]
+                elif statistic == 'max':
+                    row[name] = values[-1]
+                elif statistic == 'std':
+                    row[name] = stdev(values) if len(values) > 1 else 0.0
+                else:
+                    row[name] = percentile(values, dict(TAIL_QUANTILES)[statistic])
+            rows.append(row)
+        return rows
+
+
+def format_query_table(rows: List[Dict[str, object]], columns: List[str], format_file_size) -> str:
+    """Render aggregate query rows as an aligned text table"""
+    def cell(column: str, value) -> str:
+        if value is None:
+            return "-"
+        if column in ('size', 'task_size'):
+            return format_file_size(value)
+        if column == 'concurrency':
+            return f"{value}x"
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+    
+    cells = [[cell(column, row[column]) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(line[i]) for line in cells]) + 2 for i, column in enumerate(columns)]
+    lines = ["".join(f"{column:<{width}}" for column, width in zip(columns, widths)).rstrip(),
+             "-" * sum(widths)]
+    lines.extend("".join(f"{value:<{width}}" for value, width in zip(line, widths)).rstrip() for line in cells)
+    lines.append(f"\n{len(rows)} group(s)")
+    return "\n".join(lines)
+
+
+@dataclass
+class ParseOutcome:
+    """Result of parsing one log file: either a TestResult or an error message"""
+    path: str
+    result: Optional[TestResult] = None
+    error: Optional[str] = None
+    # (perf_counter start, wall seconds, CPU seconds, pid, bytes on disk) when profiling
+    timing: Optional[Tuple[float, float, float, int, int]] = None
+
+
+def timed_parse(parser: 'LogParser', path: Path) -> ParseOutcome:
+    """Parse a file, recording its wall and CPU time and size in the outcome"""
+    start, cpu = time.perf_counter(), time.process_time()
+    outcome = parser.try_parse_log_file(path)
+    wall, cpu = time.perf_counter() - start, time.process_time() - cpu
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    outcome.timing = (start, wall, cpu, os.getpid(), size)
+    return outcome
+
+
+class LogParser:
+    """Parses performance log files and extracts test data"""
+    
+    def __init__(self):
+        self.workload_pattern = re.compile(r'- MaxRepeatCount: (\d+)')
+        self.repeat_secs_pattern = re.compile(r'- MaxRepeatSecs: (\d+)')
+        self.files_on_disk_pattern = re.compile(r'- FilesOnDisk: (True|False)')
+        self.with_response_pattern = re.compile(r'- WithResponseApis: (True|False)')
+        self.task_pattern = re.compile(r'- Task: action=download, size=([\d,]+) bytes')
+        self.run_pattern = re.compile(r'Run:(\d+) Secs:([\d.]+) Gb/s:([\d.]+)')
+        self.task_line_pattern = re.compile(r'- Task: action=(\w+), size=([\d,]+) bytes, key=([\w/.-]+)')
+        self.total_bytes_pattern = re.compile(r'Total bytes per run: ([\d,]+)')
+        self.start_time_pattern = re.compile(r'Start time: ([A-Za-z0-9 :/.,+-]+)')
+        self.end_time_pattern = re.compile(r'End time: ([A-Za-z0-9 :/.,+-]+)')
+    
+    def parse_log_file(self, file_path: Path) -> Optional[TestResult]:
+        """Parse a single log file and return TestResult"""
+        outcome = self.try_parse_log_file(file_path)
+        if outcome.error is not None:
+            print(outcome.error)
+        return outcome.result
+    
+    def try_parse_log_file(self, file_path: Path) -> ParseOutcome:
+        """Parse a single log file, reporting failures in the outcome instead of printing"""
+        try:
+            # Detect encoding by reading BOM (Byte Order Mark)
+            encoding = 'utf-8'
+            with open_log(file_path) as f:
+                bom = f.read(3)
+                if bom.startswith(b'\xff\xfe'):
+                    encoding = 'utf-16-le'
+                elif bom.startswith(b'\xfe\xff'):
+                    encoding = 'utf-16-be'
+                elif bom.startswith(b'\xef\xbb\xbf'):
+                    encoding = 'utf-8-sig'
+            
+            with io.TextIOWrapper(open_log(file_path), encoding=encoding) as f:
+                content = f.read()
+            
+            # Extract platform from path (e.g., linux/, windows/)
+            platform = file_path.parent.name
+            test_name = log_stem(file_path)
+            
+            # Parse workload configuration
+            max_repeat_count = int(self.workload_pattern.search(content).group(1))
+            max_repeat_secs = int(self.repeat_secs_pattern.search(content).group(1))
+            files_on_disk = self.files_on_disk_pattern.search(content).group(1) == 'True'
+            with_response_apis = self.with_response_pattern.search(content).group(1) == 'True'
+            
+            # Parse file size (remove commas)
+            size_match = self.task_pattern.search(content)
+            file_size_bytes = int(size_match.group(1).replace(',', ''))
+            
+            # Parse test runs
+            runs = []
+            for match in self.run_pattern.finditer(content):
+                run_number = int(match.group(1))
+                seconds = float(match.group(2))
+                gbps = float(match.group(3))
+                runs.append(TestRun(run_number, seconds, gbps))
+            time_sketch, throughput_sketch = QuantileSketch(), QuantileSketch()
+            time_sketch.extend([run.seconds for run in runs])
+            throughput_sketch.extend([run.gbps for run in runs])
+            
+            tasks = [TaskSpec(action, int(size.replace(',', '')), key)
+                     for action, size, key in self.task_line_pattern.findall(content)]
+            total_match = self.total_bytes_pattern.search(content)
+            start_match = self.start_time_pattern.search(content)
+            end_match = self.end_time_pattern.search(content)
+            
+            result = TestResult(
+                platform=platform,
+                test_name=test_name,
+                file_size_bytes=file_size_bytes,
+                files_on_disk=files_on_disk,
+                with_response_apis=with_response_apis,
+                max_repeat_count=max_repeat_count,
+                max_repeat_secs=max_repeat_secs,
+                runs=runs,
+                start_time=parse_timestamp(start_match.group(1)) if start_match else None,
+                end_time=parse_timestamp(end_match.group(1)) if end_match else None,
+                tasks=tasks,
+                total_bytes_per_run=int(total_match.group(1).replace(',', '')) if total_match else None,
+                time_sketch=time_sketch,
+                throughput_sketch=throughput_sketch
+            )
+            return ParseOutcome(str(file_path), result=result)
+        
+        except Exception as e:
+            return ParseOutcome(str(file_path), error=f"Error parsing {file_path}: {e}")
+
+
+def detect_encoding(head: bytes) -> Tuple[str, int]:
+    """Detect a log's encoding from its leading bytes; returns (encoding, BOM length)"""
+    if head.startswith(b'\xff\xfe'):
+        return 'utf-16-le', 2
+    if head.startswith(b'\xfe\xff'):
+        return 'utf-16-be', 2
+    if head.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8', 3
+    return 'utf-8', 0
+
+
+class StreamingLogParser(LogParser):
+    """Single-pass, constant-memory parser working on the raw (possibly UTF-16) bytes
+    
+    The file is read once in fixed-size chunks; each chunk is cut at its last
+    complete line so no record straddles two chunks. Patterns are compiled to
+    bytes regexes for the BOM-detected encoding (e.g. ``R\\x00u\\x00n\\x00`` for
+    UTF-16-LE), so the text is never decoded. A small state machine searches
+    the header section until every configuration key has been seen (first
+    occurrence wins, as with the regex parser) and then only scans for runs.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    # Pattern templates: literal text interleaved with (character class | alternatives) groups
+    HEADER_TEMPLATES = [
+        ('max_repeat_count', ['- MaxRepeatCount: ', ('class', '0-9')]),
+        ('max_repeat_secs', ['- MaxRepeatSecs: ', ('class', '0-9')]),
+        ('files_on_disk', ['- FilesOnDisk: ', ('alt', 'True', 'False')]),
+        ('with_response_apis', ['- WithResponseApis: ', ('alt', 'True', 'False')]),
+        ('file_size_bytes', ['- Task: action=download, size=', ('class', '0-9,'), ' bytes']),
+        ('start_time', ['Start time: ', ('class', 'A-Za-z0-9 :/.,+-')]),
+        ('end_time', ['End time: ', ('class', 'A-Za-z0-9 :/.,+-')]),
+        ('total_bytes_per_run', ['Total bytes per run: ', ('class', '0-9,')]),
+    ]
+    # Header fields a log may lack without being rejected
+    OPTIONAL_FIELDS = ('start_time', 'end_time', 'total_bytes_per_run')
+    # Every task line is collected (tasks precede the first run)
+    TASK_TEMPLATE = ['- Task: action=', ('class', 'A-Za-z0-9_'), ', size=', ('class', '0-9,'),
+                     ' bytes, key=', ('class', 'A-Za-z0-9_/.-')]
+    RUN_TEMPLATE = ['Run:', ('class', '0-9'), ' Secs:', ('class', '0-9.'), ' Gb/s:', ('class', '0-9.')]
+    
+    def __init__(self):
+        super().__init__()
+        self._compiled: Dict[str, Tuple[bytes, re.Pattern, List[Tuple[str, re.Pattern]], re.Pattern]] = {}
+    
+    @staticmethod
+    def _compile_template(template: List, encoding: str) -> re.Pattern:
+        """Compile a pattern template into a bytes regex for the given encoding"""
+        def encode_literal(text: str) -> bytes:
+            return b''.join(re.escape(ch.encode(encoding)) for ch in text)
+        
+        pad = '\0'.encode(encoding)[:-1] if encoding != 'utf-8' else b''
+        parts = []
+        for item in template:
+            if isinstance(item, str):
+                parts.append(encode_literal(item))
+            elif item[0] == 'class':
+                char_class = b'[' + item[1].encode('ascii') + b']'
+                if encoding == 'utf-16-le':
+                    char_class = char_class + re.escape(pad)
+                elif encoding == 'utf-16-be':
+                    char_class = re.escape(pad) + char_class
+                parts.append(b'((?:' + char_class + b')+)')
+            else:
+                parts.append(b'(' + b'|'.join(encode_literal(alt) for alt in item[1:]) + b')')
+        return re.compile(b''.join(parts))
+    
+    def _patterns_for(self, encoding: str) -> Tuple[bytes, re.Pattern, List[Tuple[str, re.Pattern]], re.Pattern]:
+        """Encoded newline, run pattern, header patterns and task pattern for an encoding (cached)"""
+        if encoding not in self._compiled:
+            header = [(field, self._compile_template(template, encoding))
+                      for field, template in self.HEADER_TEMPLATES]
+            run = self._compile_template(self.RUN_TEMPLATE, encoding)
+            task = self._compile_template(self.TASK_TEMPLATE, encoding)
+            self._compiled[encoding] = ('\n'.encode(encoding), run, header, task)
+        return self._compiled[encoding]
+    
+    def try_parse_log_file(self, file_path: Path) -> ParseOutcome:
+        """Parse a single log file, reporting failures in the outcome instead of printing"""
+        try:
+            with open_log(file_path) as f:
+                return self.parse_stream(f, file_path)
+        except Exception as e:
+            return ParseOutcome(str(file_path), error=f"Error parsing {file_path}: {e}")
+    
+    def iter_chunks(self, stream, newline: bytes, pending: bytes = b''):
+        """Yield line-aligned blocks of raw bytes from a binary stream"""
+        width = len(newline)
+        buffer = pending
+        while True:
+            chunk = stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            block, buffer = self.split_complete_lines(buffer + chunk, newline)
+            if block:
+                yield block
+        if buffer:
+            yield buffer
+    
+    @staticmethod
+    def split_complete_lines(buffer: bytes, newline: bytes) -> Tuple[bytes, bytes]:
+        """Split a buffer into (complete lines, trailing partial line)"""
+        width = len(newline)
+        cut = buffer.rfind(newline)
+        # A UTF-16 newline must start on a code unit boundary
+        while cut != -1 and cut % width:
+            cut = buffer.rfind(newline, 0, cut)
+        if cut == -1:
+            return b'', buffer
+        return buffer[:cut + width], buffer[cut + width:]
+    
+    def scan_block(self, block: bytes, encoding: str, header: Dict[str, bytes],
+                   remaining: List[str], runs: List[TestRun],
+                   tasks: Optional[List[TaskSpec]] = None) -> None:
+        """Extract header values (first occurrence), tasks and runs from a line-aligned block"""
+        patterns = self._patterns_for(encoding)
+        width = len(patterns[0])
+        if width > 1:
+            # Offsets of the low (ASCII) and high bytes of each UTF-16 code unit
+            low, high = (0, 1) if encoding == 'utf-16-le' else (1, 0)
+            if not block[high::2].strip(b'\0'):
+                # Pure ASCII UTF-16: drop the zero bytes and match the narrow patterns
+                self._scan_block(block[low::2], self._patterns_for('utf-8'), 1, header, remaining, runs, tasks)
+                return
+        self._scan_block(block, patterns, width, header, remaining, runs, tasks)
+    
+    @staticmethod
+    def _scan_block(block: bytes, patterns: Tuple[bytes, re.Pattern, List[Tuple[str, re.Pattern]], re.Pattern],
+                    width: int, header: Dict[str, bytes], remaining: List[str],
+                    runs: List[TestRun], tasks: Optional[List[TaskSpec]] = None) -> None:
+        """Extract header values, tasks and runs from one line-aligned block"""
+        _, run_pattern, header_patterns, task_pattern = patterns
+        
+        # Task lines sit in the header, so stop looking once runs have started
+        if tasks is not None and not runs:
+            for match in task_pattern.finditer(block):
+                if match.start() % width == 0:
+                    action, size, key = (g.replace(b'\0', b'').decode('ascii') for g in match.groups())
+                    tasks.append(TaskSpec(action, int(size.replace(',', '')), key))
+        
+        # Header state: look for the first occurrence of each missing key
+        if remaining:
+            for field, pattern in header_patterns:
+                if field not in remaining:
+                    continue
+                for match in pattern.finditer(block):
+                    if match.start() % width == 0:
+                        header[field] = match.group(1).replace(b'\0', b'')
+                        remaining.remove(field)
+                        break
+        
+        # Run state
+        if width == 1:
+            runs.extend(TestRun(int(number), float(seconds), float(gbps))
+                        for number, seconds, gbps in run_pattern.findall(block))
+            return
+        for match in run_pattern.finditer(block):
+            if match.start() % width == 0:
+                number, seconds, gbps = (g.replace(b'\0', b'') for g in match.groups())
+                runs.append(TestRun(int(number), float(seconds), float(gbps)))
+    
+    def parse_stream(self, stream, file_path: Path) -> ParseOutcome:
+        """Parse an open binary stream positioned at the start of a log (decompressed or not)"""
+        head = stream.read(4)
+        while 0 < len(head) < 4:
+            # Decompressing readers may return short reads
+            more = stream.read(4 - len(head))
+            if not more:
+                break
+            head += more
+        encoding, bom_length = detect_encoding(head)
+        newline = self._patterns_for(encoding)[0]
+        
+        header: Dict[str, bytes] = {}
+        remaining = [field for field, _ in self.HEADER_TEMPLATES]
+        runs: List[TestRun] = []
+        tasks: List[TaskSpec] = []
+        time_sketch, throughput_sketch = QuantileSketch(), QuantileSketch()
+        
+        for block in self.iter_chunks(stream, newline, head[bom_length:]):
+            fed = len(runs)
+            self.scan_block(block, encoding, header, remaining, runs, tasks)
+            if len(runs) > fed:
+                new_runs = runs[fed:]
+                time_sketch.extend([run.seconds for run in new_runs])
+                throughput_sketch.extend([run.gbps for run in new_runs])
+        
+        required = [field for field in remaining if field not in self.OPTIONAL_FIELDS]
+        if required:
+            missing = ', '.join(required)
+            return ParseOutcome(str(file_path), error=f"Error parsing {file_path}: missing {missing}")
+        result = self.build_result(file_path, header, runs, tasks, (time_sketch, throughput_sketch))
+        return ParseOutcome(str(file_path), result=result)
+    
+    @staticmethod
+    def build_result(file_path: Path, header: Dict[str, bytes], runs: List[TestRun],
+                     tasks: Optional[List[TaskSpec]] = None,
+                     sketches: Optional[Tuple['QuantileSketch', 'QuantileSketch']] = None) -> TestResult:
+        """Assemble a TestResult from a complete set of raw header values"""
+        time_sketch, throughput_sketch = sketches if sketches is not None else (None, None)
+        return TestResult(
+            platform=file_path.parent.name,
+            test_name=log_stem(file_path),
+            file_size_bytes=int(header['file_size_bytes'].replace(b',', b'')),
+            files_on_disk=header['files_on_disk'] == b'True',
+            with_response_apis=header['with_response_apis'] == b'True',
+            max_repeat_count=int(header['max_repeat_count']),
+            max_repeat_secs=int(header['max_repeat_secs']),
+            runs=runs,
+            start_time=parse_timestamp(header['start_time'].decode('ascii')) if 'start_time' in header else None,
+            end_time=parse_timestamp(header['end_time'].decode('ascii')) if 'end_time' in header else None,
+            tasks=tasks if tasks is not None else [],
+            total_bytes_per_run=(int(header['total_bytes_per_run'].replace(b',', b''))
+                                 if 'total_bytes_per_run' in header else None),
+            time_sketch=time_sketch,
+            throughput_sketch=throughput_sketch
+        )
+
+
+PARSERS = {
+    'regex': LogParser,
+    'streaming': StreamingLogParser,
+}
+
+
+# Batches handed to worker processes are capped by total bytes and file count so
+# that many small logs share one task while large logs still spread across workers
+PARALLEL_BATCH_BYTES = 4 * 1024**2
+PARALLEL_BATCH_FILES = 256
+
+
+def _parse_batch(paths: List[str], parser_name: str = 'streaming', timed: bool = False) -> List[ParseOutcome]:
+    """Worker entry point: parse a batch of log files in order"""
+    parser = PARSERS[parser_name]()
+    if timed:
+        return [timed_parse(parser, Path(p)) for p in paths]
+    return [parser.try_parse_log_file(Path(p)) for p in paths]
+
+
+def make_parse_batches(files: List[Path], max_bytes: int = PARALLEL_BATCH_BYTES,
+                       max_files: int = PARALLEL_BATCH_FILES) -> List[List[str]]:
+    """Group files into ordered batches bounded by total size and file count"""
+    batches = []
+    current: List[str] = []
+    current_bytes = 0
+    for path in files:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        if current and (current_bytes + size > max_bytes or len(current) >= max_files):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(str(path))
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache location (honours XDG_CACHE_HOME)"""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(root) / 'performance_analyzer'
+
+
+class ParseCache:
+    """Persistent SQLite store of parsed TestResults keyed by file identity
+    
+    Entries are kept per parser implementation, so switching ``--parser``
+    never serves another parser's result. An entry is reused when the file's
+    size and mtime match; with ``verify_hash`` a content hash must also match,
+    and a file whose mtime changed but whose content did not is still a hit.
+    Entries for files that disappeared from a scanned base path are evicted.
+    """
+    
+    # Bump whenever TestResult/TestRun change shape so stale pickles are dropped
+    SCHEMA_VERSION = 5
+    FILENAME = 'parse_cache.sqlite3'
+    
+    def __init__(self, cache_dir: Path, verify_hash: bool = False, parser: str = 'streaming'):
+        self.cache_dir = Path(cache_dir)
+        self.verify_hash = verify_hash
+        self.parser = parser
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.cache_dir / self.FILENAME))
+        self._init_schema()
+    
+    def _init_schema(self) -> None:
+        """Create tables, discarding the store if it was written by another schema version"""
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None or int(row[0]) != self.SCHEMA_VERSION:
+            self.db.execute("DROP TABLE IF EXISTS entries")
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                            (str(self.SCHEMA_VERSION),))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT, parser TEXT, base TEXT, size INTEGER, mtime_ns INTEGER, "
+            "digest TEXT, result BLOB, PRIMARY KEY (path, parser))"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_base ON entries (base)")
+        self.db.commit()
+    
+    @staticmethod
+    def file_digest(path: Path) -> str:
+        """Content hash of a file, read in blocks"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def lookup(self, path: Path) -> Tuple[Optional[TestResult], Tuple[int, int, Optional[str]]]:
+        """Return (cached result or None, file identity) and count the hit or miss"""
+        stat = path.stat()
+        key = str(path.resolve())
+        row = self.db.execute(
+            "SELECT size, mtime_ns, digest, result FROM entries WHERE path = ? AND parser = ?",
+            (key, self.parser)
+        ).fetchone()
+        digest = None
+        
+        if row is not None and row[0] == stat.st_size:
+            if self.verify_hash:
+                digest = self.file_digest(path)
+                fresh = row[2] == digest
+            else:
+                fresh = row[1] == stat.st_mtime_ns
+            if fresh:
+                self.hits += 1
+                if row[1] != stat.st_mtime_ns:
+                    self.db.execute("UPDATE entries SET mtime_ns = ? WHERE path = ? AND parser = ?",
+                                    (stat.st_mtime_ns, key, self.parser))
+                return pickle.loads(row[3]), (stat.st_size, stat.st_mtime_ns, digest)
+        
+        self.misses += 1
+        if self.verify_hash and digest is None:
+            digest = self.file_digest(path)
+        return None, (stat.st_size, stat.st_mtime_ns, digest)
+    
+    def store(self, base_path: Path, path: Path, identity: Tuple[int, int, Optional[str]],
+              result: TestResult) -> None:
+        """Record a freshly parsed result"""
+        size, mtime_ns, digest = identity
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (str(path.resolve()), self.parser, str(base_path.resolve()), size, mtime_ns, digest,
+             pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+    
+    def evict_missing(self, base_path: Path, seen: List[Path]) -> None:
+        """Drop entries under base_path whose files were not seen in this scan"""
+        seen_keys = {str(path.resolve()) for path in seen}
+        stale = [
+            (path,) for (path,) in self.db.execute(
+                "SELECT DISTINCT path FROM entries WHERE base = ?", (str(base_path.resolve()),))
+            if path not in seen_keys
+        ]
+        self.db.executemany("DELETE FROM entries WHERE path = ?", stale)
+        self.evicted += len(stale)
+    
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        self.db.execute("DELETE FROM entries")
+        self.db.commit()
+    
+    def commit(self) -> None:
+        """Commit pending writes, releasing the database lock for other processes"""
+        self.db.commit()
+    
+    def close(self) -> None:
+        """Commit pending writes and close the store"""
+        self.db.commit()
+        self.db.close()
+    
+    def summary(self) -> str:
+        """One-line hit/miss report"""
+        return f"Parse cache: {self.hits} hits, {self.misses} misses, {self.evicted} evicted"
+
+
+class BaselineStore:
+    """Labelled per-configuration results of analyzed corpora, for regression gating
+    
+    Each recorded build stores one row per result keyed by platform, task
+    signature, file size, storage and API variant, holding the run count and
+    the estimator's central throughput with its standard deviation.
+    """
+    
+    SCHEMA_VERSION = 1
+    FILENAME = 'baselines.sqlite3'
+    KEY_FIELDS = ('platform', 'task_signature', 'file_size_bytes', 'files_on_disk', 'with_response_apis')
+    # --where fields a result key determines (see key_result)
+    KEY_QUERY_FIELDS = ('platform', 'os', 'runtime', 'storage', 'api', 'size', 'concurrency', 'test')
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        # Unlike the parse cache, recorded baselines cannot be rebuilt, so a
+        # store written by another schema version is refused rather than dropped
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None:
+            self.db.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(self.SCHEMA_VERSION),))
+        elif int(row[0]) != self.SCHEMA_VERSION:
+            self.db.close()
+            raise ValueError(f"{self.path} has baseline schema version {row[0]} (expected {self.SCHEMA_VERSION})")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS builds (label TEXT PRIMARY KEY, recorded_at TEXT, "
+            "base_path TEXT, estimator TEXT, result_count INTEGER)"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results (label TEXT, platform TEXT, task_signature TEXT, "
+            "file_size_bytes INTEGER, files_on_disk INTEGER, with_response_apis INTEGER, "
+            "runs INTEGER, throughput REAL, std_throughput REAL, "
+            "PRIMARY KEY (label, platform, task_signature, file_size_bytes, files_on_disk, with_response_apis))"
+        )
+        self.db.commit()
+    
+    @staticmethod
+    def result_key(result: TestResult) -> Tuple:
+        return (result.platform, result.task_signature, result.file_size_bytes,
+                int(result.files_on_disk), int(result.with_response_apis))
+    
+    @staticmethod
+    def key_result(key: Tuple) -> TestResult:
+        """Run-less stand-in for the configuration a result key records"""
+        platform, signature, size, on_disk, with_response = key
+        return TestResult(platform, signature, size, bool(on_disk), bool(with_response), 0, 0, [])
+    
+    @classmethod
+    def filter_rows(cls, rows: List[Dict[str, object]],
+                    predicates: List[Tuple[str, str, Tuple]]) -> List[Dict[str, object]]:
+        """Comparison rows within a --where filter
+        
+        Rows with a current value are kept, since the current results were
+        filtered already. A 'missing' row is matched on its key; a predicate
+        on a field the key does not record (task size, repeat count or secs)
+        excludes it.
+        """
+        missing = [row for row in rows if row['status'] == 'missing']
+        selected = set()
+        if all(field in cls.KEY_QUERY_FIELDS for field, _, _ in predicates):
+            stand_ins = [cls.key_result(row['key']) for row in missing]
+            matched = {id(result) for result in ResultIndex(stand_ins).select(predicates)}
+            selected = {id(row) for row, result in zip(missing, stand_ins) if id(result) in matched}
+        return [row for row in rows if row['status'] != 'missing' or id(row) in selected]
+    
+    @staticmethod
+    def summarize(result: TestResult, estimator: str) -> Tuple[int, float, float]:
+        """(runs, central throughput, throughput std) for a result"""
+        stats = {**result.get_stats(), **result.get_robust_stats()}
+        return len(result.runs), stats[ESTIMATORS[estimator][1]], stats['std_throughput']
+    
+    def record(self, label: str, base_path: Path, results: List[TestResult], estimator: str) -> List[TestResult]:
+        """Store (or replace) a build's per-configuration results
+        
+        Results sharing a key with an earlier one (e.g. the same workload run
+        with a different MaxRepeatCount) are not recorded; the first wins and
+        the skipped results are returned so callers can report them.
+        """
+        rows, skipped, seen = [], [], set()
+        for result in results:
+            key = self.result_key(result)
+            if key in seen:
+                skipped.append(result)
+                continue
+            seen.add(key)
+            rows.append((label, *key, *self.summarize(result, estimator)))
+        self.db.execute("DELETE FROM results WHERE label = ?", (label,))
+        self.db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.db.execute(
+            "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?)",
+            (label, time.strftime('%Y-%m-%d %H:%M:%S'), str(base_path.resolve()), estimator, len(rows))
+        )
+        self.db.commit()
+        return skipped
+    
+    def estimator_of(self, label: str) -> str:
+        """Estimator a build was recorded with; raises KeyError for an unknown label"""
+        row = self.db.execute("SELECT estimator FROM builds WHERE label = ?", (label,)).fetchone()
+        if row is None:
+            raise KeyError(label)
+        return row[0]
+    
+    def builds(self) -> List[Tuple]:
+        return self.db.execute(
+            "SELECT label, recorded_at, base_path, estimator, result_count FROM builds ORDER BY recorded_at"
+        ).fetchall()
+    
+    def load(self, label: str) -> Dict[Tuple, Tuple[int, float, float]]:
+        rows = self.db.execute(
+            "SELECT platform, task_signature, file_size_bytes, files_on_disk, with_response_apis, "
+            "runs, throughput, std_throughput FROM results WHERE label = ?", (label,)
+        ).fetchall()
+        return {tuple(row[:5]): tuple(row[5:]) for row in rows}
+    
+    def compare(self, label: str, results: List[TestResult],
+                threshold: float = 0.05, noise_sigmas: float = 2.0) -> List[Dict[str, object]]:
+        """Diff results against a recorded build
+        
+        Current results are summarized with the estimator the build was
+        recorded with, so both sides use the same central value. A
+        configuration regresses when its throughput dropped by more than
+        ``threshold`` (relative) *and* by more than ``noise_sigmas`` standard
+        errors of the difference, so noisy configurations need a larger drop.
+        """
+        estimator = self.estimator_of(label)
+        baseline = self.load(label)
+        rows = []
+        seen = set()
+        for result in results:
+            key = self.result_key(result)
+            seen.add(key)
+            runs, value, std = self.summarize(result, estimator)
+            row = {'key': key, 'baseline': None, 'current': value, 'change_percent': None, 'status': 'new'}
+            if key in baseline:
+                base_runs, base_value, base_std = baseline[key]
+                if base_value == 0:
+                    # No relative change from a zero baseline; anything measured is an improvement
+                    row.update(baseline=base_value, status='improved' if value > 0 else 'ok')
+                    rows.append(row)
+                    continue
+                change = (value - base_value) / base_value
+                noise = (base_std ** 2 / base_runs + std ** 2 / runs) ** 0.5
+                drop = base_value - value
+                if change < -threshold and drop > noise_sigmas * noise:
+                    status = 'REGRESSION'
+                elif change > threshold and -drop > noise_sigmas * noise:
+                    status = 'improved'
+                else:
+                    status = 'ok'
+                row.update(baseline=base_value, change_percent=change * 100, status=status)
+            rows.append(row)
+        for key, (_, base_value, _) in baseline.items():
+            if key not in seen:
+                rows.append({'key': key, 'baseline': base_value, 'current': None,
+                             'change_percent': None, 'status': 'missing'})
+        rows.sort(key=lambda row: row['key'])
+        return rows
+    
+    def close(self) -> None:
+        self.db.close()
+
+
+def format_baseline_comparison(label: str, rows: List[Dict[str, object]]) -> str:
+    """Render a baseline comparison table"""
+    lines = [f"\nBASELINE COMPARISON against '{label}':", "-" * 120,
+             f"{'Platform':<22} {'Workload':<22} {'Storage':<8} {'API':<13} {'Baseline (Gb/s)':<16} "
+             f"{'Current (Gb/s)':<16} {'Change':<10} {'Status'}",
+             "-" * 120]
+    for row in rows:
+        platform, workload, _, files_on_disk, with_response = row['key']
+        baseline = f"{row['baseline']:.2f}" if row['baseline'] is not None else "-"
+        current = f"{row['current']:.2f}" if row['current'] is not None else "-"
+        change = f"{row['change_percent']:+.1f}%" if row['change_percent'] is not None else "-"
+        lines.append(f"{platform:<22} {workload:<22} {'Disk' if files_on_disk else 'RAM':<8} "
+                     f"{'WithResponse' if with_response else 'Regular':<13} {baseline:<16} {current:<16} "
+                     f"{change:<10} {row['status']}")
+    regressions = sum(1 for row in rows if row['status'] == 'REGRESSION')
+    lines.append(f"\n{regressions} regression(s) across {len(rows)} configurations")
+    return "\n".join(lines)
+
+
+class Snapshot:
+    """Compact, versioned binary snapshot of a parsed corpus
+    
+    Layout (little-endian): a fixed header, a NUL-separated UTF-8 string table
+    (platform and test names), one fixed-size record per result, then the runs
+    of every result as three 8-byte aligned columns (run numbers, seconds,
+    Gb/s). Reading memory-maps the file and views the columns in place, so
+    reloading skips log parsing entirely.
+    """
+    
+    MAGIC = b'PASNAP\0\0'
+    VERSION = 3
+    # magic, version, string table bytes, platform count, result count, run count
+    HEADER = struct.Struct('<8sIIIIQ')
+    # platform index, name index, file size, repeat count, repeat secs, disk, API,
+    # start and end time (NaN when missing), total bytes per run (-1 when missing),
+    # tasks string index ("action,size,key;..."), first run, run count
+    RECORD = struct.Struct('<IIqqq??xxddqIQI')
+    
+    @staticmethod
+    def _column(typecode: str, values) -> bytes:
+        column = array(typecode, values)
+        if sys.byteorder != 'little':
+            column.byteswap()
+        data = column.tobytes()
+        return data + b'\0' * (-len(data) % 8)
+    
+    @classmethod
+    def write(cls, path: Path, results: Dict[str, List[TestResult]]) -> int:
+        """Write a platform -> results mapping; returns the snapshot size in bytes"""
+        parts = cls.encode(results)
+        with open(path, 'wb') as f:
+            for part in parts:
+                f.write(part)
+        return sum(len(part) for part in parts)
+    
+    @classmethod
+    def encode(cls, results: Dict[str, List[TestResult]]) -> List[bytes]:
+        """Snapshot bytes of a platform -> results mapping, as consecutive parts"""
+        strings: Dict[str, int] = {}
+        
+        def intern(text: str) -> int:
+            return strings.setdefault(text, len(strings))
+        
+        for platform in results:
+            intern(platform)  # platforms take the first string indices
+        records = []
+        run_numbers, seconds, gbps = [], [], []
+        for platform_index, tests in enumerate(results.values()):
+            for result in tests:
+                records.append(cls.RECORD.pack(
+                    platform_index, intern(result.test_name), result.file_size_bytes,
+                    result.max_repeat_count, result.max_repeat_secs, result.files_on_disk,
+                    result.with_response_apis,
+                    result.start_time if result.start_time is not None else nan,
+                    result.end_time if result.end_time is not None else nan,
+                    result.total_bytes_per_run if result.total_bytes_per_run is not None else -1,
+                    intern(';'.join(f"{task.action},{task.size_bytes},{task.key}" for task in result.tasks)),
+                    len(run_numbers), len(result.runs)))
+                for run in result.runs:
+                    run_numbers.append(run.run_number)
+                    seconds.append(run.seconds)
+                    gbps.append(run.gbps)
+        
+        table = '\0'.join(strings).encode('utf-8')
+        table += b'\0' * (-(cls.HEADER.size + len(table)) % 8)
+        body = b''.join(records)
+        body += b'\0' * (-len(body) % 8)
+        return [
+            cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(table), len(results), len(records), len(run_numbers)),
+            table, body,
+            cls._column('q', run_numbers), cls._column('d', seconds), cls._column('d', gbps),
+        ]
+    
+    @classmethod
+    def read(cls, path: Path) -> Dict[str, List[TestResult]]:
+        """Load a snapshot written by ``write``; raises ValueError on a bad or foreign file"""
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return cls._decode(view)
+    
+    @classmethod
+    def _decode(cls, view: memoryview) -> Dict[str, List[TestResult]]:
+        if len(view) < cls.HEADER.size:
+            raise ValueError("file too short for a snapshot header")
+        magic, version, table_len, platform_count, result_count, run_count = cls.HEADER.unpack_from(view)
+        if magic != cls.MAGIC:
+            raise ValueError("not a performance analyzer snapshot")
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported snapshot version {version} (expected {cls.VERSION})")
+        
+        records_len = cls.RECORD.size * result_count
+        runs_offset = cls.HEADER.size + table_len + records_len + (-records_len % 8)
+        if len(view) < runs_offset + 3 * 8 * run_count:
+            raise ValueError("snapshot is truncated")
+        
+        offset = cls.HEADER.size
+        strings = bytes(view[offset:offset + table_len]).decode('utf-8').split('\0')
+        offset += table_len
+        records = view[offset:offset + records_len]
+        offset = runs_offset
+        
+        columns = []
+        for typecode in ('q', 'd', 'd'):
+            column = view[offset:offset + 8 * run_count]
+            if sys.byteorder != 'little':
+                swapped = array(typecode, column.tobytes())
+                swapped.byteswap()
+                column = swapped
+            else:
+                column = column.cast(typecode)
+            columns.append(column)
+            offset += 8 * run_count
+        run_numbers, seconds, gbps = (column.tolist() for column in columns)
+        
+        platforms = strings[:platform_count]
+        results: Dict[str, List[TestResult]] = {platform: [] for platform in platforms}
+        for (platform_index, name_index, file_size, repeat_count, repeat_secs, on_disk,
+             with_response, start, end, total_bytes, tasks_index, first, count) in cls.RECORD.iter_unpack(records):
+            stop = first + count
+            runs = list(map(TestRun, run_numbers[first:stop], seconds[first:stop], gbps[first:stop]))
+            time_sketch, throughput_sketch = QuantileSketch(), QuantileSketch()
+            time_sketch.extend(seconds[first:stop])
+            throughput_sketch.extend(gbps[first:stop])
+            platform = platforms[platform_index]
+            results[platform].append(TestResult(
+                platform=platform, test_name=strings[name_index], file_size_bytes=file_size,
+                files_on_disk=on_disk, with_response_apis=with_response,
+                max_repeat_count=repeat_count, max_repeat_secs=repeat_secs, runs=runs,
+                start_time=None if isnan(start) else start,
+                end_time=None if isnan(end) else end,
+                tasks=[TaskSpec(action, int(size), key) for action, size, key in
+                       (task.split(',') for task in strings[tasks_index].split(';') if task)],
+                total_bytes_per_run=None if total_bytes < 0 else total_bytes,
+                time_sketch=time_sketch, throughput_sketch=throughput_sketch))
+        return results
+
+
+# Resource sidecars next to a log (x.log -> x.resources, x.vmstat or x.sar):
+# the native trace written by sample_resources.py, `vmstat -t` or `sar` text output
+RESOURCE_SUFFIXES = ('.resources', '.vmstat', '.sar')
+RESOURCE_TRACE_HEADER = '# resource-trace v1'
+# Per-sample metrics; rates are averages over the interval ending at the sample
+RESOURCE_METRICS = ('cpu_percent', 'cpu_max_percent', 'iowait_percent', 'mem_used_percent',
+                    'disk_read_mbps', 'disk_write_mbps', 'disk_util_percent',
+                    'net_rx_gbps', 'net_tx_gbps', 'net_util_percent')
+# Utilization at which a resource counts as saturated (metric, threshold); a
+# run's likely bottleneck is the resource furthest past its threshold
+RESOURCE_SATURATION = {
+    'cpu': (('cpu_percent', 85.0), ('cpu_max_percent', 95.0)),
+    'disk': (('disk_util_percent', 90.0), ('iowait_percent', 20.0)),
+    'network': (('net_util_percent', 90.0),),
+    'memory': (('mem_used_percent', 95.0),),
+}
+# sar header date (MM/DD/YY[YY] or YYYY-MM-DD) and sample time (optionally 12-hour)
+SAR_DATE_PATTERN = re.compile(r'\s(\d{2}/\d{2}/\d{2,4}|\d{4}-\d{2}-\d{2})\s')
+SAR_TIME_PATTERN = re.compile(r'^(\d{2}:\d{2}:\d{2})(?:\s+([AP]M))?\s+(.*)$')
+
+
+class ResourceTrace:
+    """Host resource samples captured alongside one log
+    
+    Timestamps are read like the log's Start/End lines (wall clock as UTC),
+    so sar and vmstat traces should come from a host running in UTC, as the
+    logs' own timestamps do.
+    """
+    
+    def __init__(self, path: Path, timestamps: List[float], samples: List[Dict[str, float]],
+                 interval: Optional[float] = None):
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        self.path = path
+        self.timestamps = [timestamps[i] for i in order]
+        self.samples = [samples[i] for i in order]
+        if interval is None:
+            gaps = [b - a for a, b in zip(self.timestamps, self.timestamps[1:]) if b > a]
+            interval = median(gaps) if gaps else 1.0
+        self.interval = interval
+    
+    @classmethod
+    def find(cls, log_dir: Path, test_name: str) -> Optional[Path]:
+        """The sidecar for a test, if any (first of RESOURCE_SUFFIXES present)"""
+        for suffix in RESOURCE_SUFFIXES:
+            path = log_dir / f"{test_name}{suffix}"
+            if path.is_file():
+                return path
+        return None
+    
+    @classmethod
+    def read(cls, path: Path) -> 'ResourceTrace':
+        """Parse a sidecar by suffix; raises ValueError when it holds no samples"""
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.read().splitlines()
+        reader = {'.resources': cls._read_native, '.vmstat': cls._read_vmstat, '.sar': cls._read_sar}[path.suffix]
+        timestamps, samples, interval = reader(lines)
+        if not samples:
+            raise ValueError(f"no resource samples in {path.name}")
+        return cls(path, timestamps, samples, interval)
+    
+    @staticmethod
+    def _read_native(lines: List[str]) -> Tuple[List[float], List[Dict[str, float]], Optional[float]]:
+        """Trace written by sample_resources.py: '#' key=value header lines, then CSV"""
+        timestamps, samples = [], []
+        interval, columns = None, None
+        for line in lines:
+            if line.startswith('#'):
+                for token in line[1:].split():
+                    key, _, value = token.partition('=')
+                    if key == 'interval' and value:
+                        interval = float(value)
+            elif columns is None:
+                columns = line.strip().split(',')
+            elif line.strip():
+                values = dict(zip(columns, line.strip().split(',')))
+                timestamps.append(float(values.pop('timestamp')))
+                samples.append({metric: float(value) for metric, value in values.items()
+                                if metric in RESOURCE_METRICS and value})
+        return timestamps, samples, interval
+    
+    @staticmethod
+    def _read_vmstat(lines: List[str]) -> Tuple[List[float], List[Dict[str, float]], Optional[float]]:
+        """`vmstat -t INTERVAL` output; the first report (averages since boot) is skipped"""
+        timestamps, samples = [], []
+        columns = None
+        first = True
+        for line in lines:
+            tokens = line.split()
+            if not tokens or tokens[0] == 'procs':
+                continue
+            if tokens[0] == 'r':
+                columns = tokens[:-1]
+                continue
+            if columns is None or len(tokens) != len(columns) + 2:
+                continue
+            if first:
+                first = False
+                continue
+            timestamp = parse_timestamp(' '.join(tokens[-2:]))
+            if timestamp is None:
+                continue
+            values = dict(zip(columns, (float(token) for token in tokens[:-2])))
+            # bi/bo are 1 KiB blocks per second
+            timestamps.append(timestamp)
+            samples.append({'cpu_percent': 100.0 - values['id'], 'iowait_percent': values['wa'],
+                            'disk_read_mbps': values['bi'] * 1024 / 1e6,
+                            'disk_write_mbps': values['bo'] * 1024 / 1e6})
+        return timestamps, samples, None
+    
+    @staticmethod
+    def _read_sar(lines: List[str]) -> Tuple[List[float], List[Dict[str, float]], Optional[float]]:
+        """`sar -u [-P ALL] -r -d -n DEV` text output (any subset of those reports)
+        
+        Disk and NIC rates are summed over devices (device-mapper and loopback
+        excluded), utilization is the busiest device's, and the per-CPU report
+        gives the busiest core.
+        """
+        match = SAR_DATE_PATTERN.search(f" {lines[0]} ") if lines else None
+        if match is None:
+            return [], [], None
+        day = match.group(1)
+        if len(day) == 8:
+            day = f"{day[:6]}20{day[6:]}"
+        by_time: Dict[float, Dict[str, float]] = {}
+        columns = None
+        previous = None
+        day_offset = 0.0
+        for line in lines[1:]:
+            match = SAR_TIME_PATTERN.match(line)
+            if match is None:
+                columns = None
+                continue
+            clock, meridiem, rest = match.groups()
+            tokens = rest.split()
+            if not tokens:
+                continue
+            if not tokens[-1].replace('.', '', 1).isdigit():
+                columns = tokens
+                continue
+            if columns is None or len(tokens) != len(columns):
+                continue
+            timestamp = parse_timestamp(f"{day} {clock} {meridiem}" if meridiem else f"{day} {clock}")
+            if timestamp is None:
+                continue
+            if previous is not None and timestamp + day_offset < previous - 43200:
+                day_offset += 86400.0
+            timestamp += day_offset
+            previous = timestamp
+            label, values = tokens[0], dict(zip(columns[1:], (float(token) for token in tokens[1:])))
+            sample = by_time.setdefault(timestamp, {})
+            if '%idle' in values:
+                busy = 100.0 - values['%idle']
+                if label == 'all':
+                    sample['cpu_percent'] = busy
+                    sample['iowait_percent'] = values.get('%iowait', 0.0)
+                else:
+                    sample['cpu_max_percent'] = max(sample.get('cpu_max_percent', 0.0), busy)
+            elif '%memused' in values:
+                sample['mem_used_percent'] = values['%memused']
+            elif columns[0] == 'DEV' and not label.startswith('dm-'):
+                # sysstat < 12 reports 512-byte sectors instead of kB
+                read = values.get('rkB/s', values.get('rd_sec/s', 0.0) / 2) * 1024 / 1e6
+                write = values.get('wkB/s', values.get('wr_sec/s', 0.0) / 2) * 1024 / 1e6
+                sample['disk_read_mbps'] = sample.get('disk_read_mbps', 0.0) + read
+                sample['disk_write_mbps'] = sample.get('disk_write_mbps', 0.0) + write
+                sample['disk_util_percent'] = max(sample.get('disk_util_percent', 0.0), values.get('%util', 0.0))
+            elif columns[0] == 'IFACE' and label != 'lo':
+                sample['net_rx_gbps'] = sample.get('net_rx_gbps', 0.0) + values.get('rxkB/s', 0.0) * 1024 * 8 / 1e9
+                sample['net_tx_gbps'] = sample.get('net_tx_gbps', 0.0) + values.get('txkB/s', 0.0) * 1024 * 8 / 1e9
+                if '%ifutil' in values:
+                    sample['net_util_percent'] = max(sample.get('net_util_percent', 0.0), values['%ifutil'])
+        timestamps = sorted(timestamp for timestamp, sample in by_time.items() if sample)
+        return timestamps, [by_time[timestamp] for timestamp in timestamps], None
+    
+    def window(self, start: float, end: float) -> Tuple[Dict[str, float], int]:
+        """Mean of each metric over samples taken in [start, end], and the sample count
+        
+        A window shorter than the sampling interval falls back to the first
+        sample after it, whose rates cover the window.
+        """
+        lo, hi = bisect_left(self.timestamps, start), bisect_right(self.timestamps, end)
+        if lo == hi:
+            if lo == len(self.timestamps) or self.timestamps[lo] - end > self.interval:
+                return {}, 0
+            hi = lo + 1
+        utilization = {}
+        for metric in RESOURCE_METRICS:
+            values = [sample[metric] for sample in self.samples[lo:hi] if metric in sample]
+            if values:
+                utilization[metric] = mean(values)
+        return utilization, hi - lo
+    
+    def run_utilization(self, result: 'TestResult') -> List[Dict[str, object]]:
+        """Per-run resource utilization and likely bottleneck; empty without a Start time"""
+        rows = []
+        for run, (start, end) in zip(result.runs, result.run_windows()):
+            utilization, samples = self.window(start, end)
+            rows.append({'run': run.run_number, 'gbps': run.gbps, 'samples': samples,
+                         'utilization': utilization, 'bottleneck': likely_bottleneck(utilization)})
+        return rows
+
+
+def likely_bottleneck(utilization: Dict[str, float]) -> Optional[str]:
+    """Resource furthest past its saturation threshold, 'none' if none is saturated,
+    None when there are no samples
+    """
+    if not utilization:
+        return None
+    scores = {resource: max((utilization[metric] / threshold for metric, threshold in metrics
+                             if metric in utilization), default=0.0)
+              for resource, metrics in RESOURCE_SATURATION.items()}
+    resource = max(scores, key=scores.get)
+    return resource if scores[resource] >= 1.0 else 'none'
+
+
+class ShardSummary:
+    """Mergeable partial summary of one shard of a multi-host analysis
+    
+    A summary carries the shard's results with their run arrays in the
+    snapshot encoding, so merging summaries reproduces a single-node scan
+    exactly, plus per-platform run aggregates (count, sum, sum of squares,
+    min and max of seconds and Gb/s, and a Gb/s quantile sketch) that merge
+    by addition without touching the runs. Layout: a header (magic, version,
+    metadata length), JSON metadata padded to 8 bytes, then a snapshot.
+    """
+    
+    MAGIC = b'PASUMRY\0'
+    VERSION = 1
+    HEADER = struct.Struct('<8sII')
+    METRICS = (('seconds', 'seconds'), ('gbps', 'gbps'))
+    
+    @classmethod
+    def aggregate(cls, results: Dict[str, List[TestResult]]) -> Dict[str, Dict[str, object]]:
+        """Per-platform result/run counts, moments and Gb/s sketch"""
+        aggregates = {}
+        for platform, tests in results.items():
+            runs = [run for result in tests for run in result.runs]
+            entry = {'results': len(tests), 'runs': len(runs)}
+            for name, attr in cls.METRICS:
+                values = [getattr(run, attr) for run in runs]
+                entry[name] = {'sum': fsum(values), 'sum_squares': fsum(v * v for v in values),
+                               'min': min(values, default=None), 'max': max(values, default=None)}
+            sketch = QuantileSketch()
+            for result in tests:
+                sketch.merge(result.sketches()[1])
+            entry['gbps_sketch'] = sketch.to_dict()
+            aggregates[platform] = entry
+        return aggregates
+    
+    @classmethod
+    def merge_aggregates(cls, into: Dict[str, Dict[str, object]], other: Dict[str, Dict[str, object]]) -> None:
+        for platform, entry in other.items():
+            if platform not in into:
+                into[platform] = json.loads(json.dumps(entry))
+                continue
+            merged = into[platform]
+            merged['results'] += entry['results']
+            merged['runs'] += entry['runs']
+            for name, _ in cls.METRICS:
+                moments, update = merged[name], entry[name]
+                moments['sum'] += update['sum']
+                moments['sum_squares'] += update['sum_squares']
+                bounds = [value for value in (moments['min'], update['min']) if value is not None]
+                moments['min'] = min(bounds, default=None)
+                bounds = [value for value in (moments['max'], update['max']) if value is not None]
+                moments['max'] = max(bounds, default=None)
+            sketch = QuantileSketch.from_dict(merged['gbps_sketch'])
+            sketch.merge(QuantileSketch.from_dict(entry['gbps_sketch']))
+            merged['gbps_sketch'] = sketch.to_dict()
+    
+    @classmethod
+    def write(cls, path: Path, results: Dict[str, List[TestResult]], shards: List[str]) -> int:
+        """Write a shard's results and aggregates; returns the summary size in bytes"""
+        metadata = {'shards': shards, 'created': time.time(), 'aggregates': cls.aggregate(results)}
+        return cls.write_merged(path, results, metadata)
+    
+    @classmethod
+    def write_merged(cls, path: Path, results: Dict[str, List[TestResult]], metadata: Dict[str, object]) -> int:
+        encoded = json.dumps(metadata).encode('utf-8')
+        encoded += b' ' * (-(cls.HEADER.size + len(encoded)) % 8)
+        parts = [cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(encoded)), encoded] + Snapshot.encode(results)
+        with open(path, 'wb') as f:
+            for part in parts:
+                f.write(part)
+        return sum(len(part) for part in parts)
+    
+    @classmethod
+    def read(cls, path: Path) -> Tuple[Dict[str, object], Dict[str, List[TestResult]]]:
+        """Metadata and results of a summary; raises ValueError on a bad or foreign file"""
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                if len(view) < cls.HEADER.size:
+                    raise ValueError("file too short for a summary header")
+                magic, version, metadata_len = cls.HEADER.unpack_from(view)
+                if magic != cls.MAGIC:
+                    raise ValueError("not a performance analyzer shard summary")
+                if version != cls.VERSION:
+                    raise ValueError(f"unsupported summary version {version} (expected {cls.VERSION})")
+                start = cls.HEADER.size + metadata_len
+                if len(view) < start:
+                    raise ValueError("summary is truncated")
+                metadata = json.loads(bytes(view[cls.HEADER.size:start]).decode('utf-8'))
+                with view[start:] as snapshot:
+                    return metadata, Snapshot._decode(snapshot)
+    
+    @classmethod
+    def merge(cls, summaries: List[Tuple[Dict[str, object], Dict[str, List[TestResult]]]]
+              ) -> Tuple[Dict[str, object], Dict[str, List[TestResult]], List[str]]:
+        """Combine summaries into (metadata, results, duplicate warnings)
+        
+        Platforms are ordered by name and each platform's results by log file
+        name, the order a single-node scan produces. A result present in more
+        than one shard (same platform and test) is kept from the first.
+        """
+        metadata = {'shards': [], 'created': time.time(), 'aggregates': {}}
+        results: Dict[str, Dict[str, TestResult]] = {}
+        duplicates = []
+        for shard_metadata, shard_results in summaries:
+            metadata['shards'].extend(shard_metadata['shards'])
+            cls.merge_aggregates(metadata['aggregates'], shard_metadata['aggregates'])
+            for platform, tests in shard_results.items():
+                merged = results.setdefault(platform, {})
+                for result in tests:
+                    if result.test_name in merged:
+                        duplicates.append(f"{platform}/{result.test_name}")
+                        continue
+                    merged[result.test_name] = result
+        if duplicates:
+            # Aggregates must describe exactly the merged results, so rebuild them
+            metadata['aggregates'] = None
+        ordered = {platform: [merged[name] for name in sorted(merged, key=lambda name: name + '.log')]
+                   for platform, merged in sorted(results.items())}
+        if metadata['aggregates'] is None:
+            metadata['aggregates'] = cls.aggregate(ordered)
+        return metadata, ordered, duplicates
+
+
+def format_merged_aggregates(metadata: Dict[str, object]) -> str:
+    """Fleet-wide per-platform run totals from merged summary aggregates"""
+    lines = [f"Merged {len(metadata['shards'])} shard summaries: {', '.join(metadata['shards'])}",
+             f"{'Platform':<30} {'Results':<9} {'Runs':<8} {'Mean (Gb/s)':<12} {'Std':<8} "
+             f"{'p50 (Gb/s)':<11} {'p99 (Gb/s)':<11} {'Total Secs'}"]
+    for platform, entry in sorted(metadata['aggregates'].items()):
+        count = entry['runs']
+        if not count:
+            continue
+        gbps = entry['gbps']
+        center = gbps['sum'] / count
+        variance = (gbps['sum_squares'] - count * center * center) / (count - 1) if count > 1 else 0.0
+        sketch = QuantileSketch.from_dict(entry['gbps_sketch'])
+        lines.append(f"{platform:<30} {entry['results']:<9} {count:<8} {center:<12.2f} {max(variance, 0.0) ** 0.5:<8.2f} "
+                     f"{sketch.quantile(0.5):<11.2f} {sketch.quantile(0.99):<11.2f} {entry['seconds']['sum']:.1f}")
+    return "\n".join(lines)
+
+
+class Profiler:
+    """Per-stage and per-file timing of an analyzer run, written as a Chrome trace
+    
+    Each stage records wall time, CPU time (including reaped worker
+    processes), call count, bytes read and the process's peak RSS so far;
+    each parsed file records its wall and CPU time and size. The trace is in
+    Chrome trace-event format (chrome://tracing, Perfetto): one complete
+    event per stage call and per file, on the process that did the work.
+    Optionally the whole run is also recorded with cProfile.
+    """
+    
+    def __init__(self, cprofile_path: Optional[str] = None):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        # name -> [calls, wall seconds, CPU seconds, bytes read, peak RSS MiB]
+        self.stages: Dict[str, List] = {}
+        self.events: List[Dict[str, object]] = []
+        self.files: List[Tuple[str, float, float, int]] = []
+        self.cprofile_path = cprofile_path
+        self.cprofile = None
+        if cprofile_path:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+    
+    @staticmethod
+    def cpu_time() -> float:
+        times = os.times()
+        return times.user + times.system + times.children_user + times.children_system
+    
+    @staticmethod
+    def peak_rss_mib() -> Optional[float]:
+        """High-water RSS of this process (ru_maxrss is KiB on Linux, bytes on macOS); None without resource"""
+        if resource is None:
+            return None
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss / 1024**2 if sys.platform == 'darwin' else maxrss / 1024
+    
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block; it may set the yielded record's 'bytes_read'"""
+        start, cpu = time.perf_counter(), self.cpu_time()
+        record = {'bytes_read': 0}
+        try:
+            yield record
+        finally:
+            wall, cpu = time.perf_counter() - start, self.cpu_time() - cpu
+            bytes_read = record['bytes_read']
+            peak = self.peak_rss_mib()
+            totals = self.stages.setdefault(name, [0, 0.0, 0.0, 0, None])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+            totals[3] += bytes_read
+            totals[4] = peak
+            self.events.append({'name': name, 'cat': 'stage', 'ph': 'X', 'pid': self.pid, 'tid': 0,
+                                'ts': (start - self.origin) * 1e6, 'dur': wall * 1e6,
+                                'args': {'cpu_secs': cpu, 'bytes_read': bytes_read, 'peak_rss_mib': peak}})
+    
+    def record_file(self, outcome: ParseOutcome) -> None:
+        start, wall, cpu, pid, size = outcome.timing
+        self.files.append((outcome.path, wall, cpu, size))
+        self.events.append({'name': Path(outcome.path).name, 'cat': 'parse', 'ph': 'X', 'pid': pid, 'tid': 0,
+                            'ts': (start - self.origin) * 1e6, 'dur': wall * 1e6,
+                            'args': {'path': outcome.path, 'cpu_secs': cpu, 'bytes': size,
+                                     'error': outcome.error}})
+    
+    def write_trace(self, filename: str) -> None:
+        names = {self.pid: 'analyzer'}
+        names.update((event['pid'], 'parse worker') for event in self.events if event['pid'] != self.pid)
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': name}}
+                    for pid, name in names.items()]
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}, f)
+    
+    def summary(self, top: int = 10) -> str:
+        """Stage table and the slowest parsed files"""
+        lines = ["=" * 80, "PROFILE", "=" * 80]
+        lines.append(f"{'Stage':<16} {'Calls':<7} {'Wall (s)':<10} {'CPU (s)':<10} {'Read (MiB)':<12} {'Peak RSS (MiB)'}")
+        for name, (calls, wall, cpu, bytes_read, peak) in self.stages.items():
+            lines.append(f"{name:<16} {calls:<7} {wall:<10.4f} {cpu:<10.4f} "
+                         f"{f'{bytes_read / 1024**2:.2f}' if bytes_read else '-':<12} "
+                         f"{f'{peak:.1f}' if peak is not None else '-'}")
+        if self.files:
+            lines.append("")
+            lines.append(f"Slowest files (top {min(top, len(self.files))} of {len(self.files)} parsed)")
+            lines.append(f"{'File':<60} {'Wall (s)':<10} {'CPU (s)':<10} {'Size (KiB)':<11} {'MiB/s'}")
+            for path, wall, cpu, size in sorted(self.files, key=lambda f: f[1], reverse=True)[:top]:
+                rate = f"{size / 1024**2 / wall:.1f}" if wall else "-"
+                lines.append(f"{path[-60:]:<60} {wall:<10.4f} {cpu:<10.4f} {size / 1024:<11.1f} {rate}")
+        return "\n".join(lines)
+    
+    def finish(self, trace_filename: str, top: int = 10) -> None:
+        """Stop cProfile, write the trace (and cProfile dump) and print the summary"""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.cprofile_path)
+        self.write_trace(trace_filename)
+        print()
+        print(self.summary(top))
+        print(f"\nProfile trace written to: {trace_filename}")
+        if self.cprofile is not None:
+            print(f"cProfile stats written to: {self.cprofile_path} (python -m pstats {self.cprofile_path})")
+
+
+class PerformanceAnalyzer:
+    """Analyzes and compares performance test results"""
+    
+    def __init__(self, parser: str = 'streaming', pair_on: str = 'with_response_apis',
+                 columnar: bool = False, significance: Optional[SignificanceTester] = None,
+                 estimator: str = 'mean', compare: Optional[str] = None,
+                 compare_to: Optional[str] = None, profiler: Optional[Profiler] = None):
+        self.parser_name = parser
+        self.profiler = profiler
+        self.estimator = estimator
+        # Pivot dimension and baseline value of a comparison matrix; when set,
+        # the exporters write the matrix instead of the pair comparisons
+        self.compare = compare
+        self.compare_to = compare_to
+        self.columnar = columnar
+        self.significance = significance
+        self.parser = PARSERS[parser]()
+        self.pair_axis = PAIR_AXES[pair_on]
+        self.results: Dict[str, List[TestResult]] = {}
+        self.pair_index: Optional[Dict[str, List[Tuple[TestResult, TestResult]]]] = None
+        self.model: Optional[ComparisonModel] = None
+        self.matrix: Optional[ComparisonMatrix] = None
+        self.index: Optional[ResultIndex] = None
+        self.run_store: Optional[RunStore] = None
+        self.run_store_stats: Optional[Dict[int, Dict[str, float]]] = None
+        # Resource sidecar per (platform, test name), loaded on request
+        self.resource_traces: Dict[Tuple[str, str], ResourceTrace] = {}
+    
+    def stage(self, name: str):
+        """Context manager timing a pipeline stage when profiling (a no-op yielding None otherwise)"""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.stage(name)
+    
+    def discover_log_files(self, base_path: Path) -> List[Tuple[str, List[Path]]]:
+        """List platform directories and their (possibly compressed) logs in a stable (sorted) order"""
+        platforms = []
+        for platform_dir in sorted(base_path.iterdir()):
+            if platform_dir.is_dir():
+                platforms.append((platform_dir.name, list_log_files(platform_dir)))
+        return platforms
+    
+    def scan_directories(self, base_path: Path, jobs: int = 1,
+                         cache: Optional[ParseCache] = None) -> None:
+        """Scan for platform directories and log files
+        
+        With jobs > 1 (or 0 for one per CPU) files are parsed in a process pool;
+        results, error messages and ordering are identical to the serial path.
+        With a cache, only new or modified files are parsed.
+        """
+        with self.stage('discover'):
+            platforms = self.discover_log_files(base_path)
+        files = [f for _, log_files in platforms for f in log_files]
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        
+        outcomes: List[Optional[ParseOutcome]] = [None] * len(files)
+        identities = {}
+        pending = []
+        with self.stage('cache_lookup'):
+            for index, log_file in enumerate(files):
+                if cache is not None:
+                    result, identities[index] = cache.lookup(log_file)
+                    if result is not None:
+                        outcomes[index] = ParseOutcome(str(log_file), result=result)
+                        continue
+                pending.append(index)
+        
+        pending_files = [files[index] for index in pending]
+        timed = self.profiler is not None
+        with self.stage('parse') as stage:
+            if jobs > 1:
+                parsed = self._parse_parallel(pending_files, jobs)
+            elif timed:
+                parsed = [timed_parse(self.parser, log_file) for log_file in pending_files]
+            else:
+                parsed = [self.parser.try_parse_log_file(log_file) for log_file in pending_files]
+            if timed:
+                for outcome in parsed:
+                    self.profiler.record_file(outcome)
+                stage['bytes_read'] = sum(outcome.timing[4] for outcome in parsed)
+        
+        with self.stage('cache_store'):
+            for index, outcome in zip(pending, parsed):
+                outcomes[index] = outcome
+                if cache is not None and outcome.result:
+                    cache.store(base_path, files[index], identities[index], outcome.result)
+            if cache is not None:
+                cache.evict_missing(base_path, files)
+        
+        position = 0
+        for platform_name, log_files in platforms:
+            self.results[platform_name] = []
+            
+            for outcome in outcomes[position:position + len(log_files)]:
+                if outcome.error is not None:
+                    print(outcome.error)
+                if outcome.result:
+                    self.results[platform_name].append(outcome.result)
+            position += len(log_files)
+            
+            print(f"Found {len(self.results[platform_name])} log files in {platform_name}/")
+        
+        self.store_runs()
+        with self.stage('pair'):
+            self.build_pair_index()
+    
+    def query_index(self) -> ResultIndex:
+        """Secondary indexes over every result, built on first use"""
+        if self.index is None:
+            self.index = ResultIndex([result for results in self.results.values() for result in results])
+        return self.index
+    
+    def filter_results(self, predicates: List[Tuple[str, str, Tuple]]) -> None:
+        """Keep only the results matching every predicate, for all later reports and exports"""
+        selected = {id(result) for result in self.query_index().select(predicates)}
+        self.results = {platform: [result for result in results if id(result) in selected]
+                        for platform, results in self.results.items()}
+        self.build_pair_index()
+    
+    def query(self, predicates: List[Tuple[str, str, Tuple]], group_by: List[str],
+              aggregates: List[str]) -> List[Dict[str, object]]:
+        """Filter through the indexes, then group and aggregate the matching results"""
+        return ResultIndex.aggregate(self.query_index().select(predicates), group_by, aggregates)
+    
+    def load_snapshot(self, filename: str) -> None:
+        """Load results from a binary snapshot instead of scanning logs"""
+        with self.stage('load_snapshot') as stage:
+            self.results = Snapshot.read(Path(filename))
+            if stage is not None:
+                stage['bytes_read'] = Path(filename).stat().st_size
+        for platform_name, results in self.results.items():
+            print(f"Loaded {len(results)} results for {platform_name}/ from {filename}")
+        self.store_runs()
+        with self.stage('pair'):
+            self.build_pair_index()
+    
+    def export_snapshot(self, filename: str) -> None:
+        """Export every parsed result to a binary snapshot"""
+        size = Snapshot.write(Path(filename), self.results)
+        print(f"Snapshot exported to: {filename} ({size / 1024:.1f} KiB)")
+    
+    def emit_summary(self, filename: str, shards: List[str]) -> None:
+        """Write every parsed result as a mergeable summary of the given shards"""
+        size = ShardSummary.write(Path(filename), self.results, shards)
+        print(f"Shard summary exported to: {filename} ({size / 1024:.1f} KiB)")
+    
+    def merge_summaries(self, filenames: List[str]) -> Dict[str, object]:
+        """Load results from shard summaries instead of scanning logs; returns the merged metadata"""
+        with self.stage('load_snapshot') as stage:
+            summaries = [ShardSummary.read(Path(filename)) for filename in filenames]
+            metadata, self.results, duplicates = ShardSummary.merge(summaries)
+            if stage is not None:
+                stage['bytes_read'] = sum(Path(filename).stat().st_size for filename in filenames)
+        for duplicate in duplicates:
+            print(f"Warning: {duplicate} appears in more than one shard, keeping the first")
+        for platform_name, results in self.results.items():
+            print(f"Merged {len(results)} results for {platform_name}/")
+        self.store_runs()
+        with self.stage('pair'):
+            self.build_pair_index()
+        return metadata
+    
+    def _parse_parallel(self, files: List[Path], jobs: int) -> List[ParseOutcome]:
+        """Parse files across a process pool, returning outcomes in input order"""
+        batches = make_parse_batches(files)
+        if not batches:
+            return []
+        outcomes: List[ParseOutcome] = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batches))) as executor:
+            parser_names = [self.parser_name] * len(batches)
+            timed = [self.profiler is not None] * len(batches)
+            for batch_outcomes in executor.map(_parse_batch, batches, parser_names, timed):
+                outcomes.extend(batch_outcomes)
+        return outcomes
+    
+    def build_pair_index(self) -> None:
+        """Pair every platform's results along the pair axis in one O(n) pass
+        
+        Variant-side results are hashed on the configuration tuple (size, the
+        other boolean dimension, repeat count, task signature); each baseline
+        result then finds its partner with a single lookup. The first variant
+        seen for a key wins, and pairs follow the baseline results' order.
+        """
+        axis = self.pair_axis
+        self.pair_index = {}
+        self.model = None
+        self.matrix = None
+        self.index = None
+        self.run_store_stats = None
+        for platform, tests in self.results.items():
+            variants: Dict[Tuple, TestResult] = {}
+            for test in tests:
+                if getattr(test, axis.dimension):
+                    variants.setdefault(axis.pair_key(test), test)
+            
+            pairs = []
+            for test in tests:
+                if not getattr(test, axis.dimension):
+                    partner = variants.get(axis.pair_key(test))
+                    if partner is not None:
+                        pairs.append((test, partner))
+            self.pair_index[platform] = pairs
+    
+    def find_test_pairs(self, platform: str) -> List[Tuple[TestResult, TestResult]]:
+        """Find matching (baseline, variant) test pairs, e.g. regular vs WithResponse APIs"""
+        if self.pair_index is None:
+            self.build_pair_index()
+        return self.pair_index.get(platform, [])
+    
+    def store_runs(self) -> None:
+        """With columnar storage, move every result's runs into one RunStore as the corpus is loaded"""
+        self.run_store = None
+        if self.columnar:
+            with self.stage('store_runs'):
+                self.run_store = RunStore.from_results([result for tests in self.results.values()
+                                                        for result in tests if result.runs], move=True)
+    
+    def columnar_stats(self) -> Dict[int, Dict[str, float]]:
+        """Per-result statistics (keyed by id) from one RunStore pass, computed once per corpus"""
+        if self.run_store_stats is None:
+            store = self.run_store
+            if store is None:
+                # Without columnar storage a temporary store copies the runs
+                store = RunStore.from_results([result for tests in self.results.values() for result in tests
+                                               if result.runs])
+            self.run_store_stats = {id(result): stats for result, stats in zip(store.results, store.compute_stats())}
+        return self.run_store_stats
+    
+    def comparison_model(self) -> ComparisonModel:
+        """Return the comparison model for the current scan, building it on first use"""
+        if self.model is None:
+            if self.pair_index is None:
+                self.build_pair_index()
+            axis = self.pair_axis
+            stats: Dict[int, Dict[str, float]] = {}
+            if self.columnar:
+                stats = dict(self.columnar_stats())
+            
+            def stats_for(result: TestResult) -> Dict[str, float]:
+                key = id(result)
+                if key not in stats:
+                    stats[key] = result.get_stats()
+                return stats[key]
+            
+            robust: Dict[int, Dict[str, object]] = {}
+            
+            def robust_for(result: TestResult) -> Dict[str, object]:
+                key = id(result)
+                if key not in robust:
+                    robust[key] = result.get_robust_stats()
+                return robust[key]
+            
+            pairs = {}
+            for platform, platform_pairs in self.pair_index.items():
+                comparisons = []
+                for baseline, variant in platform_pairs:
+                    baseline_stats, variant_stats = stats_for(baseline), stats_for(variant)
+                    baseline_robust, variant_robust = robust_for(baseline), robust_for(variant)
+                    metrics = self.calculate_improvement(baseline, variant,
+                                                         {**baseline_stats, **baseline_robust},
+                                                         {**variant_stats, **variant_robust})
+                    faster = (axis.baseline_label
+                              if metrics[f'{axis.baseline_key}_mean_throughput'] > metrics[f'{axis.variant_key}_mean_throughput']
+                              else axis.variant_label)
+                    significance = None
+                    if self.significance is not None:
+                        # The steady-state estimator also tests only the post-warm-up runs
+                        skip_baseline = baseline_robust['warmup_runs'] if self.estimator == 'steady_state' else 0
+                        skip_variant = variant_robust['warmup_runs'] if self.estimator == 'steady_state' else 0
+                        significance = self.significance.test(
+                            f"{platform}/{baseline.test_name}/{variant.test_name}",
+                            baseline.column('gbps')[skip_baseline:],
+                            variant.column('gbps')[skip_variant:],
+                            ESTIMATOR_STATISTICS[self.estimator])
+                        # Only declare a winner when the difference is significant
+                        if not significance['significant']:
+                            faster = SignificanceTester.INCONCLUSIVE
+                    comparisons.append(PairComparison(platform, baseline, variant, baseline_stats,
+                                                      variant_stats, metrics, faster, significance,
+                                                      baseline_robust, variant_robust,
+                                                      baseline.get_tail_stats(), variant.get_tail_stats()))
+                pairs[platform] = tuple(comparisons)
+            self.model = ComparisonModel(axis, pairs, len(stats))
+        return self.model
+    
+    def compare_values(self, dimension: str) -> List[str]:
+        """Sorted distinct values of a pivot dimension across the corpus"""
+        value_of = COMPARE_DIMENSIONS[dimension]
+        return sorted({value_of(result) for results in self.results.values() for result in results})
+    
+    def comparison_matrix(self) -> ComparisonMatrix:
+        """Ratio matrix of the --compare dimension against its baseline value, built on first use
+        
+        Central throughputs for the whole corpus come from one columnar pass
+        (vectorized with NumPy) for the mean and median estimators, and from
+        the robust stats otherwise. Results are indexed on their values for
+        every non-pivot dimension in a single pass; the first result seen for
+        a (match, pivot value) cell wins.
+        """
+        if self.matrix is None:
+            dimension, baseline_value = self.compare, self.compare_to
+            value_of = COMPARE_DIMENSIONS[dimension]
+            dimensions = match_dimensions(dimension)
+            results = [result for tests in self.results.values() for result in tests if result.runs]
+            throughput_key = ESTIMATORS[self.estimator][1]
+            if throughput_key in STATS_KEYS:
+                columnar = self.columnar_stats()
+                central = [columnar[id(result)][throughput_key] for result in results]
+            else:
+                central = [result.get_robust_stats()[throughput_key] for result in results]
+            
+            grid: Dict[Tuple, Dict[str, Tuple[TestResult, float]]] = {}
+            for result, throughput in zip(results, central):
+                match = tuple((d, MATCH_VALUES[d](result)) for d in dimensions)
+                grid.setdefault(match, {}).setdefault(value_of(result), (result, throughput))
+            
+            rows = []
+            for match in sorted(grid):
+                cells = grid[match]
+                if baseline_value not in cells or len(cells) < 2:
+                    continue
+                base_result, base_throughput = cells[baseline_value]
+                row_cells = {}
+                for value, (result, throughput) in sorted(cells.items()):
+                    if value == baseline_value:
+                        continue
+                    significance = None
+                    if self.significance is not None:
+                        # The steady-state estimator also tests only the post-warm-up runs
+                        skip_base = base_result.get_robust_stats()['warmup_runs'] if self.estimator == 'steady_state' else 0
+                        skip = result.get_robust_stats()['warmup_runs'] if self.estimator == 'steady_state' else 0
+                        significance = self.significance.test(
+                            f"{dimension}/{base_result.platform}/{base_result.test_name}/{result.platform}/{result.test_name}",
+                            base_result.column('gbps')[skip_base:],
+                            result.column('gbps')[skip:],
+                            ESTIMATOR_STATISTICS[self.estimator])
+                    row_cells[value] = MatrixCell(result, throughput, throughput / base_throughput, significance)
+                rows.append(MatrixRow(match, MatrixCell(base_result, base_throughput, 1.0), row_cells))
+            
+            values = tuple(sorted({value for row in rows for value in row.cells}))
+            self.matrix = ComparisonMatrix(dimension, baseline_value, values, dimensions, tuple(rows))
+        return self.matrix
+    
+    def matrix_match_label(self, row: MatrixRow) -> str:
+        """Human-readable description of a matrix row's matching configuration"""
+        return ' '.join(self.format_file_size(value) if dimension == 'size' else str(value)
+                        for dimension, value in row.match)
+    
+    def calculate_improvement(self, regular: TestResult, withresponse: TestResult,
+                              regular_stats: Optional[Dict[str, float]] = None,
+                              withresponse_stats: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Calculate performance comparison metrics between regular and WithResponse APIs
+        
+        With another pair axis the arguments are its baseline and variant sides
+        and the per-side keys use the axis labels (e.g. 'ram_mean_time').
+        Precomputed stats may be passed in to avoid recomputing them. The
+        analyzer's estimator picks the central value; the '*_mean_*' keys keep
+        their names for compatibility and 'estimator' records which was used.
+        """
+        if regular_stats is None:
+            regular_stats = {**regular.get_stats(), **regular.get_robust_stats()}
+        if withresponse_stats is None:
+            withresponse_stats = {**withresponse.get_stats(), **withresponse.get_robust_stats()}
+        time_key, throughput_key = ESTIMATORS[self.estimator]
+        
+        # Calculate difference ratios showing how much better WithResponse is compared to Regular
+        # Values > 1 mean WithResponse is better
+        time_ratio = regular_stats[time_key] / withresponse_stats[time_key]  # Higher = WithResponse is faster
+        throughput_ratio = withresponse_stats[throughput_key] / regular_stats[throughput_key]  # Higher = WithResponse has better throughput
+        
+        baseline, variant = self.pair_axis.baseline_key, self.pair_axis.variant_key
+        return {
+            'time_ratio': time_ratio,
+            'throughput_ratio': throughput_ratio,
+            'time_difference_percent': ((withresponse_stats[time_key] - regular_stats[time_key]) / regular_stats[time_key]) * 100,
+            'throughput_difference_percent': ((withresponse_stats[throughput_key] - regular_stats[throughput_key]) / regular_stats[throughput_key]) * 100,
+            f'{baseline}_mean_time': regular_stats[time_key],
+            f'{variant}_mean_time': withresponse_stats[time_key],
+            f'{baseline}_mean_throughput': regular_stats[throughput_key],
+            f'{variant}_mean_throughput': withresponse_stats[throughput_key],
+            'estimator': self.estimator
+        }
+    
+    def format_file_size(self, size_bytes: int) -> str:
+        """Format file size in human readable format"""
+        if size_bytes >= 1024**3:
+            return f"{size_bytes / (1024**3):.1f}GiB"
+        elif size_bytes >= 1024**2:
+            return f"{size_bytes / (1024**2):.1f}MiB"
+        else:
+            return f"{size_bytes}B"
+    
+    def generate_report(self, platform: str = None) -> str:
+        """Generate a comprehensive performance comparison report"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        platforms_to_process = [platform] if platform else list(self.results.keys())
+        report_lines = []
+        axis = self.pair_axis
+        baseline_key, variant_key = axis.baseline_key, axis.variant_key
+        
+        report_lines.append("=" * 80)
+        report_lines.append("PERFORMANCE ANALYSIS REPORT")
+        report_lines.append(f"{axis.baseline_name} vs {axis.variant_name} Comparison")
+        if self.estimator != 'mean':
+            report_lines.append(f"Comparison estimator: {ESTIMATOR_LABELS[self.estimator]}")
+        report_lines.append("=" * 80)
+        
+        for plat in platforms_to_process:
+            if not self.results[plat]:
+                continue
+                
+            report_lines.append(f"\n{'='*20} {plat.upper()} PLATFORM RESULTS {'='*20}")
+            
+            pairs = self.comparison_model().pairs_for(plat)
+            if not pairs:
+                report_lines.append(f"No matching {baseline_key}/{variant_key} test pairs found for {plat}")
+                continue
+            
+            # Summary table header
+            report_lines.append("\nSUMMARY TABLE:")
+            report_lines.append("-" * 130)
+            header = f"{'Test Type':<30} {'File Size':<12} {axis.context_header:<8} {axis.baseline_label + ' (Gb/s)':<16} {axis.variant_short + ' (Gb/s)':<16} {'Difference':<15} {axis.faster_header:<15}"
+            if self.significance is not None:
+                header += f" {'Ratio CI':<16} {'p-value':<8}"
+            report_lines.append(header)
+            report_lines.append("-" * 130)
+            
+            for pair in pairs:
+                regular, withresponse = pair.baseline, pair.variant
+                comparison = pair.metrics
+                storage_type = axis.context_label(regular)
+                file_size = self.format_file_size(regular.file_size_bytes)
+                
+                base_name = axis.base_name(regular.test_name)
+                
+                # Determine which is faster
+                if comparison[f'{baseline_key}_mean_throughput'] > comparison[f'{variant_key}_mean_throughput']:
+                    diff_pct = comparison['throughput_difference_percent']
+                else:
+                    diff_pct = -comparison['throughput_difference_percent']
+                faster = pair.faster
+                
+                line = (
+                    f"{base_name:<30} {file_size:<12} {storage_type:<8} "
+                    f"{comparison[f'{baseline_key}_mean_throughput']:<16.2f} "
+                    f"{comparison[f'{variant_key}_mean_throughput']:<16.2f} "
+                    f"{abs(diff_pct):<15.1f}% "
+                    f"{faster:<15}"
+                )
+                if pair.significance is not None:
+                    sig = pair.significance
+                    ci = f"[{sig['ratio_ci_low']:.2f}, {sig['ratio_ci_high']:.2f}]"
+                    line += f" {ci:<16} {sig['p_value']:<8.3f}"
+                report_lines.append(line)
+            
+            # Detailed breakdown
+            report_lines.append(f"\nDETAILED BREAKDOWN for {plat.upper()}:")
+            report_lines.append("=" * 60)
+            
+            for pair in pairs:
+                regular, withresponse = pair.baseline, pair.variant
+                comparison = pair.metrics
+                storage_type = axis.context_phrase(regular)
+                file_size = self.format_file_size(regular.file_size_bytes)
+                
+                report_lines.append(f"\n📊 {file_size} Download {storage_type}")
+                report_lines.append("-" * 40)
+                report_lines.append(f"{axis.baseline_name + ':':<17} {comparison[f'{baseline_key}_mean_throughput']:8.2f} Gb/s ({ESTIMATOR_LABELS[self.estimator].lower()} {comparison[f'{baseline_key}_mean_time']:6.1f}s)")
+                report_lines.append(f"{axis.variant_name + ':':<17} {comparison[f'{variant_key}_mean_throughput']:8.2f} Gb/s ({ESTIMATOR_LABELS[self.estimator].lower()} {comparison[f'{variant_key}_mean_time']:6.1f}s)")
+                for name, robust in ((axis.baseline_label, pair.baseline_robust), (axis.variant_label, pair.variant_robust)):
+                    if robust['warmup_runs']:
+                        report_lines.append(f"Warm-up:          {name} {robust['warmup_runs']} run(s), cold start {robust['cold_start_throughput']:.2f} Gb/s, steady state {robust['steady_state_throughput']:.2f} Gb/s")
+                    if robust['outlier_runs']:
+                        report_lines.append(f"Outliers:         {name} run(s) {', '.join(str(n) for n in robust['outlier_runs'])}")
+                
+                if comparison['throughput_ratio'] >= 1.0:
+                    # WithResponse is better (ratio >= 1)
+                    report_lines.append(f"Result:           {axis.variant_label} is {comparison['throughput_ratio']:.1f}x faster ({comparison['throughput_difference_percent']:.1f}% better throughput)")
+                else:
+                    # Regular is better (ratio < 1)
+                    report_lines.append(f"Result:           {axis.baseline_label} is {1/comparison['throughput_ratio']:.1f}x faster ({-comparison['throughput_difference_percent']:.1f}% better throughput)")
+                if pair.significance is not None:
+                    sig = pair.significance
+                    verdict = SignificanceTester.verdict(sig)
+                    report_lines.append(f"Significance:     ratio {sig['confidence']:.0%} CI [{sig['ratio_ci_low']:.2f}, {sig['ratio_ci_high']:.2f}], p = {sig['p_value']:.4f} ({verdict})")
+        
+        return "\n".join(report_lines)
+    
+    def concurrency_scaling(self, platform: str) -> Dict[Tuple[int, bool, bool], List[Tuple[int, float]]]:
+        """Aggregate throughput per concurrency level, grouped by (task size, files on disk, API variant)
+        
+        The logged Gb/s covers all of a run's bytes, so it is the aggregate
+        throughput; the analyzer's estimator picks the central value.
+        """
+        throughput_key = ESTIMATORS[self.estimator][1]
+        groups: Dict[Tuple[int, bool, bool], Dict[int, float]] = {}
+        for result in self.results.get(platform, []):
+            if not result.runs:
+                continue
+            stats = {**result.get_stats(), **result.get_robust_stats()}
+            key = (task_size(result), result.files_on_disk, result.with_response_apis)
+            groups.setdefault(key, {}).setdefault(result.concurrency, stats[throughput_key])
+        return {key: sorted(levels.items()) for key, levels in sorted(groups.items())}
+    
+    def generate_scaling_report(self, platform: str = None) -> str:
+        """Aggregate Gb/s against concurrency (1x, 2x, 4x, ...) with scaling efficiency and knee"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        platforms_to_process = [platform] if platform else list(self.results.keys())
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append("CONCURRENCY SCALING")
+        report_lines.append(f"Aggregate {ESTIMATOR_LABELS[self.estimator].lower()} throughput by concurrency; "
+                            f"knee = last level before the next adds < {SCALING_KNEE_GAIN:.0%}")
+        report_lines.append("=" * 80)
+        
+        for plat in platforms_to_process:
+            scaling = self.concurrency_scaling(plat)
+            if not scaling:
+                continue
+            report_lines.append(f"\n{'='*20} {plat.upper()} {'='*20}")
+            single_level = 0
+            for (size, files_on_disk, with_response), levels in scaling.items():
+                if len(levels) < 2:
+                    single_level += 1
+                    continue
+                storage = 'Disk' if files_on_disk else 'RAM'
+                api = 'WithResponse APIs' if with_response else 'Regular APIs'
+                report_lines.append(f"\n{self.format_file_size(size)} per task, {storage}, {api}")
+                report_lines.append(f"  {'Concurrency':<12} {'Aggregate (Gb/s)':<17} {'Per Task (Gb/s)':<16} "
+                                    f"{'Speedup':<9} {'Efficiency':<11}")
+                base_level, base = levels[0]
+                peak = max(aggregate for _, aggregate in levels)
+                for level, aggregate in levels:
+                    # Efficiency relative to linear scaling from the lowest measured level
+                    speedup = aggregate / base
+                    efficiency = speedup / (level / base_level) * 100
+                    bar = '█' * max(1, round(aggregate / peak * 30))
+                    report_lines.append(f"  {f'{level}x':<12} {aggregate:<17.2f} {aggregate / level:<16.2f} "
+                                        f"{f'{speedup:.2f}x':<9} {f'{efficiency:.1f}%':<11} {bar}")
+                knee = find_scaling_knee(levels)
+                if knee == levels[-1][0]:
+                    report_lines.append(f"  Knee: not reached (still gaining at {knee}x)")
+                else:
+                    report_lines.append(f"  Knee: {knee}x")
+            if single_level:
+                report_lines.append(f"\n{single_level} configuration(s) measured at a single concurrency level only")
+        
+        return "\n".join(report_lines)
+    
+    def size_models(self, platform: str) -> Dict[Tuple[int, bool, bool], SizeModel]:
+        """Size-scaling fit per (concurrency, files on disk, API variant) across a platform's object sizes
+        
+        Every run contributes a (bytes per run, seconds) point; with the
+        steady-state estimator detected warm-up runs are left out.
+        """
+        points: Dict[Tuple[int, bool, bool], Tuple[List[int], List[float]]] = {}
+        for result in self.results.get(platform, []):
+            skip = result.get_robust_stats()['warmup_runs'] if self.estimator == 'steady_state' and result.runs else 0
+            sizes, seconds = points.setdefault((result.concurrency, result.files_on_disk, result.with_response_apis),
+                                               ([], []))
+            size = bytes_per_run(result)
+            for run in result.runs[skip:]:
+                sizes.append(size)
+                seconds.append(run.seconds)
+        models = {}
+        for key, (sizes, seconds) in sorted(points.items()):
+            model = fit_size_model(sizes, seconds)
+            if model is not None:
+                models[key] = model
+        return models
+    
+    def generate_size_model_report(self, platform: str = None, sizes: Optional[List[int]] = None) -> str:
+        """Fixed overhead, asymptotic Gb/s and fit quality per configuration, with predicted throughput by size"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        sizes = sorted(sizes or PREDICTION_SIZES)
+        platforms_to_process = [platform] if platform else list(self.results.keys())
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append("SIZE-SCALING MODEL")
+        report_lines.append("time = overhead + bytes / bandwidth, least-squares fit over every run across object sizes;")
+        report_lines.append("overhead dominates below the half-bandwidth size")
+        report_lines.append("=" * 80)
+        
+        def describe(key: Tuple[int, bool, bool]) -> str:
+            concurrency, files_on_disk, with_response = key
+            return f"{'Disk' if files_on_disk else 'RAM'}, {'WithResponse' if with_response else 'Regular'} APIs, {concurrency}x"
+        
+        for plat in platforms_to_process:
+            models = self.size_models(plat)
+            if not models:
+                continue
+            report_lines.append(f"\n{'='*20} {plat.upper()} {'='*20}")
+            report_lines.append(f"{'Configuration':<32} {'Sizes':<6} {'Runs':<6} {'Overhead (s)':<13} "
+                                f"{'Bandwidth (Gb/s)':<17} {'R²':<8} {'Half-BW Size'}")
+            for key, model in models.items():
+                bandwidth = f"{model.bandwidth_gbps:.2f}" if model.bandwidth_gbps else "-"
+                half = self.format_file_size(round(model.half_bandwidth_bytes)) if model.half_bandwidth_bytes else "-"
+                report_lines.append(f"{describe(key):<32} {len(model.sizes):<6} {model.runs:<6} "
+                                    f"{model.overhead_secs:<13.3f} {bandwidth:<17} {model.r_squared:<8.4f} {half}")
+            
+            report_lines.append("")
+            report_lines.append("Predicted throughput (Gb/s)")
+            report_lines.append(f"{'Configuration':<32} " + " ".join(f"{self.format_file_size(size):<10}" for size in sizes))
+            for key, model in models.items():
+                predictions = [model.predict_gbps(size) for size in sizes]
+                report_lines.append(f"{describe(key):<32} " + " ".join(
+                    f"{f'{gbps:.2f}' if gbps is not None else '-':<10}" for gbps in predictions))
+            
+            # Which API variant wins at each size, for each storage mode and concurrency level
+            winner_lines = []
+            for (concurrency, files_on_disk, with_response), regular in models.items():
+                if with_response or (concurrency, files_on_disk, True) not in models:
+                    continue
+                variant = models[(concurrency, files_on_disk, True)]
+                winners = []
+                for size in sizes:
+                    regular_gbps, variant_gbps = regular.predict_gbps(size) or 0.0, variant.predict_gbps(size) or 0.0
+                    winners.append('WithResponse' if variant_gbps > regular_gbps else 'Regular')
+                line = (f"{'Disk' if files_on_disk else 'RAM'}, {concurrency}x: "
+                        + ", ".join(f"{self.format_file_size(size)} {winner}" for size, winner in zip(sizes, winners)))
+                if regular.secs_per_byte != variant.secs_per_byte:
+                    crossover = (variant.overhead_secs - regular.overhead_secs) / (regular.secs_per_byte - variant.secs_per_byte)
+                    if crossover > 0:
+                        line += f" (crossover at {self.format_file_size(round(crossover))})"
+                winner_lines.append(line)
+            if winner_lines:
+                report_lines.append("")
+                report_lines.append("Predicted faster API by size")
+                report_lines.extend(winner_lines)
+            
+            fitted_sizes = sorted({size for model in models.values() for size in model.sizes})
+            report_lines.append(f"\nFitted on {', '.join(self.format_file_size(size) for size in fitted_sizes)} per run; "
+                                f"predictions outside that range are extrapolated")
+        
+        if len(report_lines) == 5:
+            report_lines.append("\nNo configuration was measured at two or more object sizes")
+        return "\n".join(line.rstrip() for line in report_lines)
+    
+    def generate_sample_size_report(self, advisor: SampleSizeAdvisor, platform: str = None) -> str:
+        """Runs each test actually needed, recommended repeat counts and the machine time they would save"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        platforms_to_process = [platform] if platform else list(self.results.keys())
+        axis = self.pair_axis
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append("SAMPLE-SIZE ADVISOR")
+        report_lines.append(f"Target: ±{advisor.target_precision:.1%} relative {advisor.confidence:.0%} CI of mean throughput "
+                            f"over steady-state runs (at least {advisor.min_runs} runs)")
+        report_lines.append("=" * 80)
+        
+        total_measured = total_saved = 0.0
+        for plat in platforms_to_process:
+            results = [result for result in self.results[plat] if result.runs]
+            if not results:
+                continue
+            report_lines.append(f"\n{'='*20} {plat.upper()} {'='*20}")
+            report_lines.append(f"{'Test':<40} {'Runs':<6} {'Warm-up':<8} {'CV':<8} {'±CI':<9} "
+                                f"{'Stop At':<8} {'Recommend':<10} {'Saved (s)'}")
+            for result in results:
+                advice = advisor.advise(result)
+                overhead = result.get_overhead_stats()
+                total_measured += overhead['wall_clock_secs'] or overhead['measured_secs']
+                total_saved += advice['saved_secs']
+                cv = f"{advice['cv_percent']:.2f}%" if advice['cv_percent'] is not None else "-"
+                precision = f"{advice['precision_percent']:.2f}%" if advice['precision_percent'] != float('inf') else "-"
+                stop = advice['stopped_at_run'] if advice['stopped_at_run'] is not None else "-"
+                report_lines.append(f"{result.test_name:<40} {advice['runs']:<6} {advice['warmup_runs']:<8} {cv:<8} "
+                                    f"{precision:<9} {stop:<8} {advice['recommended_runs']:<10} {advice['saved_secs']:.1f}")
+            
+            decisions = []
+            for baseline, variant in self.find_test_pairs(plat):
+                decided = advisor.decision_run(baseline.column('gbps'), variant.column('gbps'))
+                decisions.append(f"{baseline.task_signature:<30} {axis.context_label(baseline):<8} "
+                                 f"{decided if decided is not None else 'not decided':<14} "
+                                 f"{min(len(baseline.runs), len(variant.runs))}")
+            if decisions:
+                report_lines.append("")
+                report_lines.append(f"{axis.baseline_label} vs {axis.variant_label} decision "
+                                    f"(Welch t, alpha {advisor.alpha:g} split over every look)")
+                report_lines.append(f"{'Workload':<30} {axis.context_header:<8} {'Decided At':<14} {'Runs'}")
+                report_lines.extend(decisions)
+        
+        if total_measured:
+            report_lines.append(f"\nRecommended repeat counts would save {total_saved:.0f}s of {total_measured:.0f}s "
+                                f"benchmark time ({total_saved / total_measured:.1%})")
+        return "\n".join(report_lines)
+    
+    def generate_overhead_report(self, platform: str = None) -> str:
+        """Per-test harness overhead, wall-clock efficiency and stop reason from Start/End times"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        platforms_to_process = [platform] if platform else list(self.results.keys())
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append("HARNESS OVERHEAD AND WALL-CLOCK UTILIZATION")
+        report_lines.append("=" * 80)
+        
+        for plat in platforms_to_process:
+            if not self.results[plat]:
+                continue
+            report_lines.append(f"\n{'='*20} {plat.upper()} {'='*20}")
+            report_lines.append("-" * 130)
+            report_lines.append(f"{'Test':<40} {'Runs':<8} {'Wall (s)':<11} {'Measured (s)':<13} {'Overhead (s)':<13} "
+                                f"{'Per Run (s)':<12} {'Efficiency':<11} {'Stopped By'}")
+            report_lines.append("-" * 130)
+            
+            total_wall = total_measured = 0.0
+            timed = time_limited = 0
+            for result in self.results[plat]:
+                overhead = result.get_overhead_stats()
+                runs = f"{len(result.runs)}/{result.max_repeat_count}"
+                stopped = {'count': 'MaxRepeatCount', 'time': f"MaxRepeatSecs ({result.max_repeat_secs}s)",
+                           'incomplete': 'incomplete'}[overhead['stop_reason']]
+                if overhead['stop_reason'] == 'time':
+                    time_limited += 1
+                if overhead['wall_clock_secs'] is None:
+                    report_lines.append(f"{result.test_name:<40} {runs:<8} {'-':<11} {overhead['measured_secs']:<13.1f} "
+                                        f"{'-':<13} {'-':<12} {'-':<11} {stopped}")
+                    continue
+                timed += 1
+                total_wall += overhead['wall_clock_secs']
+                total_measured += overhead['measured_secs']
+                per_run = overhead['overhead_per_run_secs']
+                efficiency = overhead['efficiency_percent']
+                report_lines.append(
+                    f"{result.test_name:<40} {runs:<8} {overhead['wall_clock_secs']:<11.0f} "
+                    f"{overhead['measured_secs']:<13.1f} {overhead['overhead_secs']:<13.1f} "
+                    f"{per_run if per_run is not None else 0.0:<12.2f} "
+                    f"{f'{efficiency:.1f}%' if efficiency is not None else '-':<11} {stopped}"
+                )
+            
+            report_lines.append("")
+            if timed and total_wall:
+                outside = total_wall - total_measured
+                report_lines.append(f"Machine time: {total_wall:.0f}s wall, {total_measured:.1f}s measured, "
+                                    f"{outside:.1f}s ({outside / total_wall * 100:.1f}%) outside measured transfers "
+                                    f"across {timed} timed tests")
+            else:
+                report_lines.append("No Start/End times found; wall-clock utilization unavailable")
+            if time_limited:
+                report_lines.append(f"⚠️  {time_limited} test(s) hit MaxRepeatSecs before MaxRepeatCount")
+        
+        report_lines.append("\nTimestamps have one-second resolution; short tests carry up to ~1s of error.")
+        return "\n".join(report_lines)
     
-    def generate_report(self, platform: str = None) -> str:
-        """Generate a comprehensive performance comparison report"""
+    def load_resource_traces(self, base_path: Path) -> None:
+        """Read the resource sidecar next to each result's log, where one exists"""
+        self.resource_traces = {}
+        for plat, results in self.results.items():
+            for result in results:
+                path = ResourceTrace.find(base_path / plat, result.test_name)
+                if path is None:
+                    continue
+                try:
+                    self.resource_traces[(plat, result.test_name)] = ResourceTrace.read(path)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Warning: skipping resource trace {path}: {e}")
+    
+    def generate_resource_report(self, platform: str = None) -> str:
+        """Per-run host resource utilization from sidecar traces, with the likely bottleneck"""
         if platform and platform not in self.results:
             return f"No results found for platform: {platform}"
         
+        def cell(utilization: Dict[str, float], metric: str, digits: int = 1) -> str:
+            return f"{utilization[metric]:.{digits}f}" if metric in utilization else "-"
+        
         platforms_to_process = [platform] if platform else list(self.results.keys())
         report_lines = []
-        
         report_lines.append("=" * 80)
-        report_lines.append("PERFORMANCE ANALYSIS REPORT")
-        report_lines.append("Regular APIs vs WithResponse APIs Comparison")
+        report_lines.append("HOST RESOURCE UTILIZATION PER RUN")
         report_lines.append("=" * 80)
         
         for plat in platforms_to_process:
             if not self.results[plat]:
                 continue
-                
-            report_lines.append(f"\n{'='*20} {plat.upper()} PLATFORM RESULTS {'='*20}")
-            
-            pairs = self.find_test_pairs(plat)
-            if not pairs:
-                report_lines.append(f"No matching regular/withresponse test pairs found for {plat}")
-                continue
-            
-            # Summary table header
-            report_lines.append("\nSUMMARY TABLE:")
-            report_lines.append("-" * 130)
-            report_lines.append(f"{'Test Type':<30} {'File Size':<12} {'Storage':<8} {'Regular (Gb/s)':<16} {'WithResp (Gb/s)':<16} {'Difference':<15} {'Faster API':<15}")
-            report_lines.append("-" * 130)
-            
-            for regular, withresponse in pairs:
-                comparison = self.calculate_improvement(regular, withresponse)
-                storage_type = "Disk" if regular.files_on_disk else "RAM"
-                file_size = self.format_file_size(regular.file_size_bytes)
-                
-                # Extract base test name
-                base_name = regular.test_name.replace('-regular', '').replace('-1x', '').replace('GiB-', 'GiB ')
-                if '-ram' in base_name:
-                    base_name = base_name.replace('-ram', ' (RAM)')
-                
-                # Determine which is faster
-                if comparison['regular_mean_throughput'] > comparison['withresponse_mean_throughput']:
-                    faster = "Regular"
-                    diff_pct = comparison['throughput_difference_percent']
-                else:
-                    faster = "WithResponse"
-                    diff_pct = -comparison['throughput_difference_percent']
-                
-                report_lines.append(
-                    f"{base_name:<30} {file_size:<12} {storage_type:<8} "
-                    f"{comparison['regular_mean_throughput']:<16.2f} "
-                    f"{comparison['withresponse_mean_throughput']:<16.2f} "
-                    f"{abs(diff_pct):<15.1f}% "
-                    f"{faster:<15}"
-                )
-            
-            # Detailed breakdown
-            report_lines.append(f"\nDETAILED BREAKDOWN for {plat.upper()}:")
-            report_lines.append("=" * 60)
-            
-            for regular, withresponse in pairs:
-                comparison = self.calculate_improvement(regular, withresponse)
-                storage_type = "to Disk" if regular.files_on_disk else "to RAM"
-                file_size = self.format_file_size(regular.file_size_bytes)
-                
-                report_lines.append(f"\n📊 {file_size} Download {storage_type}")
-                report_lines.append("-" * 40)
-                report_lines.append(f"Regular APIs:     {comparison['regular_mean_throughput']:8.2f} Gb/s (avg {comparison['regular_mean_time']:6.1f}s)")
-                report_lines.append(f"WithResponse APIs: {comparison['withresponse_mean_throughput']:8.2f} Gb/s (avg {comparison['withresponse_mean_time']:6.1f}s)")
-                
-                if comparison['throughput_ratio'] >= 1.0:
-                    # WithResponse is better (ratio >= 1)
-                    report_lines.append(f"Result:           WithResponse is {comparison['throughput_ratio']:.1f}x faster ({comparison['throughput_difference_percent']:.1f}% better throughput)")
-                else:
-                    # Regular is better (ratio < 1)
-                    report_lines.append(f"Result:           Regular is {1/comparison['throughput_ratio']:.1f}x faster ({-comparison['throughput_difference_percent']:.1f}% better throughput)")
+            report_lines.append(f"\n{'='*20} {plat.upper()} {'='*20}")
+            untraced = []
+            for result in self.results[plat]:
+                trace = self.resource_traces.get((plat, result.test_name))
+                if trace is None:
+                    untraced.append(result.test_name)
+                    continue
+                report_lines.append(f"\n{result.test_name} ({trace.path.name}, {len(trace.samples)} samples "
+                                    f"every {trace.interval:g}s)")
+                if result.start_time is None:
+                    report_lines.append("  No Start time in the log; runs cannot be aligned to the trace")
+                    continue
+                report_lines.append("-" * 130)
+                report_lines.append(f"{'Run':<5} {'Gb/s':<9} {'Samples':<8} {'CPU %':<7} {'Core %':<7} {'IOwait %':<9} "
+                                    f"{'Mem %':<7} {'Read MB/s':<10} {'Write MB/s':<11} {'Disk %':<7} "
+                                    f"{'RX Gb/s':<8} {'TX Gb/s':<8} {'NIC %':<7} {'Bottleneck'}")
+                report_lines.append("-" * 130)
+                bottlenecks: Dict[str, int] = {}
+                for row in trace.run_utilization(result):
+                    utilization = row['utilization']
+                    bottleneck = row['bottleneck'] or 'no samples'
+                    bottlenecks[bottleneck] = bottlenecks.get(bottleneck, 0) + 1
+                    report_lines.append(
+                        f"{row['run']:<5} {row['gbps']:<9.3f} {row['samples']:<8} {cell(utilization, 'cpu_percent'):<7} "
+                        f"{cell(utilization, 'cpu_max_percent'):<7} {cell(utilization, 'iowait_percent'):<9} "
+                        f"{cell(utilization, 'mem_used_percent'):<7} {cell(utilization, 'disk_read_mbps'):<10} "
+                        f"{cell(utilization, 'disk_write_mbps'):<11} {cell(utilization, 'disk_util_percent'):<7} "
+                        f"{cell(utilization, 'net_rx_gbps', 2):<8} {cell(utilization, 'net_tx_gbps', 2):<8} "
+                        f"{cell(utilization, 'net_util_percent'):<7} {bottleneck}"
+                    )
+                verdict = max(bottlenecks, key=bottlenecks.get)
+                report_lines.append(f"Likely bottleneck: {verdict} ({bottlenecks[verdict]}/{len(result.runs)} runs)")
+            if untraced:
+                report_lines.append(f"\n{len(untraced)} test(s) without a resource trace "
+                                    f"({'/'.join(RESOURCE_SUFFIXES)} next to the log)")
         
+        report_lines.append("\nRun windows are estimated from the Start/End times (one-second resolution) and run "
+                            "durations; 'none' means no host resource was saturated "
+                            "(latency- or remote-bound).")
         return "\n".join(report_lines)
     
+    def matrix_cell_text(self, cell: Optional[MatrixCell]) -> str:
+        """Ratio of a matrix cell, starred when significant; '-' when the value was not measured"""
+        if cell is None:
+            return "-"
+        marker = "*" if cell.significance is not None and cell.significance['significant'] else ""
+        return f"{cell.ratio:.2f}x{marker}"
+    
+    def matrix_description(self, matrix: ComparisonMatrix) -> str:
+        return (f"{ESTIMATOR_LABELS[self.estimator]} throughput of each {matrix.dimension} relative to "
+                f"{matrix.baseline}, matched on {', '.join(matrix.match_dimensions)}")
+    
+    def generate_matrix_report(self, platform: str = None) -> str:
+        """Ratio matrix of the --compare dimension against its baseline value"""
+        if platform and platform not in self.results:
+            return f"No results found for platform: {platform}"
+        
+        matrix = self.comparison_matrix()
+        rows = matrix.rows_for(platform)
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append(f"COMPARISON MATRIX: {matrix.dimension.upper()} (baseline: {matrix.baseline})")
+        report_lines.append(self.matrix_description(matrix))
+        legend = "Ratios above 1.00x are faster than the baseline"
+        if self.significance is not None:
+            legend += f"; * marks a significant difference (p < {self.significance.alpha:g})"
+        report_lines.append(legend)
+        report_lines.append("=" * 80)
+        if not rows:
+            report_lines.append(f"\nNo configurations measured for both {matrix.baseline} and another {matrix.dimension}")
+            return "\n".join(report_lines)
+        
+        labels = [self.matrix_match_label(row) for row in rows]
+        match_width = max(len('Match'), *(len(label) for label in labels)) + 2
+        baseline_header = f"{matrix.baseline} (Gb/s)"
+        widths = [max(len(value), 8) + 2 for value in matrix.values]
+        report_lines.append("")
+        report_lines.append(f"{'Match':<{match_width}} {baseline_header:<{len(baseline_header) + 2}}"
+                            + "".join(f"{value:<{width}}" for value, width in zip(matrix.values, widths)))
+        report_lines.append("-" * (match_width + len(baseline_header) + 3 + sum(widths)))
+        for label, row in zip(labels, rows):
+            report_lines.append(f"{label:<{match_width}} {row.baseline.throughput:<{len(baseline_header) + 2}.2f}"
+                                + "".join(f"{self.matrix_cell_text(row.cells.get(value)):<{width}}"
+                                          for value, width in zip(matrix.values, widths)))
+        report_lines.append("-" * (match_width + len(baseline_header) + 3 + sum(widths)))
+        means = ComparisonMatrix.geometric_mean_ratios(rows, matrix.values)
+        report_lines.append(f"{'Geometric mean':<{match_width}} {'':<{len(baseline_header) + 2}}"
+                            + "".join(f"{f'{means[value]:.2f}x' if means[value] else '-':<{width}}"
+                                      for value, width in zip(matrix.values, widths)))
+        report_lines.append(f"\n{len(rows)} matching configurations")
+        return "\n".join(line.rstrip() for line in report_lines)
+    
+    def csv_fieldnames(self) -> List[str]:
+        """Column names of the CSV export"""
+        axis = self.pair_axis
+        baseline, variant = axis.baseline_label, axis.variant_label
+        fieldnames = [
+            'Platform', 'Test_Type', 'File_Size_GB', f'{axis.context_header}_Type', 
+            f'{baseline}_Throughput_Gbps', f'{variant}_Throughput_Gbps', 
+            'Throughput_Ratio', 'Throughput_Difference_Percent',
+            f'{baseline}_Mean_Time', f'{variant}_Mean_Time', f'Faster_{axis.singular_noun}', 'Estimator',
+            f'{baseline}_Warmup_Runs', f'{variant}_Warmup_Runs',
+            f'{baseline}_Steady_State_Gbps', f'{variant}_Steady_State_Gbps',
+            f'{baseline}_Outlier_Runs', f'{variant}_Outlier_Runs'
+        ]
+        if self.significance is not None:
+            fieldnames += ['Ratio_CI_Low', 'Ratio_CI_High', 'P_Value', 'Significant']
+        return fieldnames
+    
+    def csv_row(self, platform: str, pair: PairComparison) -> Dict[str, object]:
+        """One CSV export row for a comparison pair"""
+        axis = self.pair_axis
+        baseline_key, variant_key = axis.baseline_key, axis.variant_key
+        baseline, variant = axis.baseline_label, axis.variant_label
+        regular = pair.baseline
+        comparison = pair.metrics
+        
+        row = {
+            'Platform': platform,
+            'Test_Type': regular.test_name.replace('-regular', '').replace('-withresponse', '').replace('-1x', '').replace('-ram', '_RAM'),
+            'File_Size_GB': regular.file_size_bytes / (1024**3),
+            f'{axis.context_header}_Type': axis.context_label(regular),
+            f'{baseline}_Throughput_Gbps': comparison[f'{baseline_key}_mean_throughput'],
+            f'{variant}_Throughput_Gbps': comparison[f'{variant_key}_mean_throughput'],
+            'Throughput_Ratio': comparison['throughput_ratio'],
+            'Throughput_Difference_Percent': comparison['throughput_difference_percent'],
+            f'{baseline}_Mean_Time': comparison[f'{baseline_key}_mean_time'],
+            f'{variant}_Mean_Time': comparison[f'{variant_key}_mean_time'],
+            f'Faster_{axis.singular_noun}': pair.faster,
+            'Estimator': self.estimator,
+            f'{baseline}_Warmup_Runs': pair.baseline_robust['warmup_runs'],
+            f'{variant}_Warmup_Runs': pair.variant_robust['warmup_runs'],
+            f'{baseline}_Steady_State_Gbps': pair.baseline_robust['steady_state_throughput'],
+            f'{variant}_Steady_State_Gbps': pair.variant_robust['steady_state_throughput'],
+            f'{baseline}_Outlier_Runs': len(pair.baseline_robust['outlier_runs']),
+            f'{variant}_Outlier_Runs': len(pair.variant_robust['outlier_runs'])
+        }
+        if pair.significance is not None:
+            row.update({
+                'Ratio_CI_Low': pair.significance['ratio_ci_low'],
+                'Ratio_CI_High': pair.significance['ratio_ci_high'],
+                'P_Value': pair.significance['p_value'],
+                'Significant': pair.significance['significant'],
+            })
+        return row
+    
+    def json_pair(self, pair: PairComparison) -> Dict[str, object]:
+        """JSON export object for a comparison pair, including every run"""
+        axis = self.pair_axis
+        baseline_key, variant_key = axis.baseline_key, axis.variant_key
+        noun = axis.noun.lower()
+        regular, withresponse = pair.baseline, pair.variant
+        
+        pair_data = {
+            'test_name': regular.test_name,
+            'file_size_bytes': regular.file_size_bytes,
+            'file_size_formatted': self.format_file_size(regular.file_size_bytes),
+            f'{axis.context_header.lower()}_type': axis.context_label(regular).lower(),
+            f'{baseline_key}_{noun}': {
+                'stats': pair.baseline_stats,
+                'robust_stats': pair.baseline_robust,
+                'tail_stats': pair.baseline_tail,
+                'runs': [{'run': r.run_number, 'time': r.seconds, 'throughput': r.gbps} for r in regular.runs]
+            },
+            f'{variant_key}_{noun}': {
+                'stats': pair.variant_stats,
+                'robust_stats': pair.variant_robust,
+                'tail_stats': pair.variant_tail,
+                'runs': [{'run': r.run_number, 'time': r.seconds, 'throughput': r.gbps} for r in withresponse.runs]
+            },
+            'comparison_metrics': pair.metrics,
+            f'faster_{axis.singular_noun.lower()}': pair.faster
+        }
+        if pair.significance is not None:
+            pair_data['significance'] = pair.significance
+        return pair_data
+    
+    def matrix_csv_fieldnames(self, matrix: ComparisonMatrix) -> List[str]:
+        """Column names of the CSV export of a comparison matrix, one row per non-baseline cell"""
+        fieldnames = (['Dimension', 'Baseline', 'Variant'] + [MATCH_COLUMNS[d] for d in matrix.match_dimensions]
+                      + ['Baseline_Test', 'Variant_Test', 'Baseline_Throughput_Gbps', 'Variant_Throughput_Gbps',
+                         'Throughput_Ratio', 'Throughput_Difference_Percent', 'Estimator'])
+        if self.significance is not None:
+            fieldnames += ['Ratio_CI_Low', 'Ratio_CI_High', 'P_Value', 'Significant']
+        return fieldnames
+    
+    def matrix_csv_row(self, matrix: ComparisonMatrix, row: MatrixRow, value: str) -> Dict[str, object]:
+        """One CSV export row for a matrix cell"""
+        cell = row.cells[value]
+        csv_row = {'Dimension': matrix.dimension, 'Baseline': matrix.baseline, 'Variant': value}
+        csv_row.update((MATCH_COLUMNS[dimension], match_value) for dimension, match_value in row.match)
+        csv_row.update({
+            'Baseline_Test': f"{row.baseline.result.platform}/{row.baseline.result.test_name}",
+            'Variant_Test': f"{cell.result.platform}/{cell.result.test_name}",
+            'Baseline_Throughput_Gbps': row.baseline.throughput,
+            'Variant_Throughput_Gbps': cell.throughput,
+            'Throughput_Ratio': cell.ratio,
+            'Throughput_Difference_Percent': (cell.ratio - 1) * 100,
+            'Estimator': self.estimator,
+        })
+        if cell.significance is not None:
+            csv_row.update({
+                'Ratio_CI_Low': cell.significance['ratio_ci_low'],
+                'Ratio_CI_High': cell.significance['ratio_ci_high'],
+                'P_Value': cell.significance['p_value'],
+                'Significant': cell.significance['significant'],
+            })
+        return csv_row
+    
+    def matrix_json_row(self, row: MatrixRow) -> Dict[str, object]:
+        """JSON export object for a matrix row: its match, the baseline and every other value's cell"""
+        def cell_data(cell: MatrixCell) -> Dict[str, object]:
+            data = {'platform': cell.result.platform, 'test_name': cell.result.test_name,
+                    'throughput': cell.throughput}
+            if cell is not row.baseline:
+                data['throughput_ratio'] = cell.ratio
+                data['throughput_difference_percent'] = (cell.ratio - 1) * 100
+                if cell.significance is not None:
+                    data['significance'] = cell.significance
+            return data
+        
+        return {
+            'match': dict(row.match),
+            'baseline': cell_data(row.baseline),
+            'variants': {value: cell_data(cell) for value, cell in row.cells.items()},
+        }
+    
+    def matrix_markdown_header(self, matrix: ComparisonMatrix) -> List[str]:
+        """Title, explanation and column rows of the Markdown comparison matrix"""
+        lines = [f"# Comparison Matrix: {matrix.dimension}", "",
+                 f"{self.matrix_description(matrix)}. Ratios above 1.00x are faster than the baseline"
+                 + (f"; * marks a significant difference (p < {self.significance.alpha:g})."
+                    if self.significance is not None else "."), ""]
+        lines.append(f"| Match | {matrix.baseline} (Gb/s) | " + " | ".join(matrix.values) + " |")
+        lines.append("|-------|" + "------|" * (len(matrix.values) + 1))
+        return lines
+    
+    def matrix_markdown_row(self, matrix: ComparisonMatrix, row: MatrixRow) -> str:
+        return (f"| {self.matrix_match_label(row)} | {row.baseline.throughput:.2f} | "
+                + " | ".join(self.matrix_cell_text(row.cells.get(value)) for value in matrix.values) + " |")
+    
     def export_csv(self, filename: str, platform: str = None) -> None:
         """Export results to CSV format"""
-        platforms_to_process = [platform] if platform else list(self.results.keys())
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Platform', 'Test_Type', 'File_Size_GB', 'Storage_Type', 
-                'Regular_Throughput_Gbps', 'WithResponse_Throughput_Gbps', 
-                'Throughput_Ratio', 'Throughput_Difference_Percent',
-                'Regular_Mean_Time', 'WithResponse_Mean_Time', 'Faster_API'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for plat in platforms_to_process:
-                pairs = self.find_test_pairs(plat)
-                for regular, withresponse in pairs:
-                    comparison = self.calculate_improvement(regular, withresponse)
-                    storage_type = "Disk" if regular.files_on_disk else "RAM"
-                    
-                    # Determine which is faster
-                    if comparison['regular_mean_throughput'] > comparison['withresponse_mean_throughput']:
-                        faster = "Regular"
-                    else:
-                        faster = "WithResponse"
-                    
-                    writer.writerow({
-                        'Platform': plat,
-                        'Test_Type': regular.test_name.replace('-regular', '').replace('-1x', '').replace('-ram', '_RAM'),
-                        'File_Size_GB': regular.file_size_bytes / (1024**3),
-                        'Storage_Type': storage_type,
-                        'Regular_Throughput_Gbps': comparison['regular_mean_throughput'],
-                        'WithResponse_Throughput_Gbps': comparison['withresponse_mean_throughput'],
-                        'Throughput_Ratio': comparison['throughput_ratio'],
-                        'Throughput_Difference_Percent': comparison['throughput_difference_percent'],
-                        'Regular_Mean_Time': comparison['regular_mean_time'],
-                        'WithResponse_Mean_Time': comparison['withresponse_mean_time'],
-                        'Faster_API': faster
-                    })
-        
-        print(f"CSV report exported to: {filename}")
+        self.export(platform, csv_filename=filename)
     
     def export_json(self, filename: str, platform: str = None) -> None:
         """Export results to JSON format"""
-        platforms_to_process = [platform] if platform else list(self.results.keys())
+        self.export(platform, json_filename=filename)
+    
+    def export_jsonl(self, filename: str, platform: str = None) -> None:
+        """Export results to JSON Lines format, one comparison pair per line"""
+        self.export(platform, jsonl_filename=filename)
+    
+    def markdown_summary_header(self, platform: str) -> List[str]:
+        """Heading and column rows of a platform's Markdown summary table"""
+        axis = self.pair_axis
+        lines = [f"## {platform.upper()} Platform Results", ""]
+        if self.significance is not None:
+            lines.append(f"| Test Type | File Size | {axis.context_header} | {axis.baseline_label} (Gb/s) | {axis.variant_short} (Gb/s) | Difference | {axis.faster_header} | Ratio {self.significance.confidence:.0%} CI | p-value |")
+            lines.append("|-----------|-----------|---------|----------------|-----------------|------------|------------|--------------|---------|")
+        else:
+            lines.append(f"| Test Type | File Size | {axis.context_header} | {axis.baseline_label} (Gb/s) | {axis.variant_short} (Gb/s) | Difference | {axis.faster_header} |")
+            lines.append("|-----------|-----------|---------|----------------|-----------------|------------|------------|")
+        return lines
+    
+    def markdown_summary_row(self, pair: PairComparison) -> str:
+        """One Markdown summary table row for a comparison pair"""
+        axis = self.pair_axis
+        baseline_key, variant_key = axis.baseline_key, axis.variant_key
+        regular = pair.baseline
+        comparison = pair.metrics
+        storage_type = axis.context_label(regular)
+        file_size = self.format_file_size(regular.file_size_bytes)
         
-        json_data = {}
-        for plat in platforms_to_process:
-            json_data[plat] = {
-                'test_pairs': [],
-                'summary': {
-                    'total_pairs': 0,
-                    'avg_throughput_ratio': 0
-                }
-            }
-            
-            pairs = self.find_test_pairs(plat)
-            ratios = []
-            
-            for regular, withresponse in pairs:
-                comparison = self.calculate_improvement(regular, withresponse)
-                ratios.append(comparison['throughput_ratio'])
-                
-                # Determine which is faster
-                if comparison['regular_mean_throughput'] > comparison['withresponse_mean_throughput']:
-                    faster = "Regular"
-                else:
-                    faster = "WithResponse"
-                
-                pair_data = {
-                    'test_name': regular.test_name,
-                    'file_size_bytes': regular.file_size_bytes,
-                    'file_size_formatted': self.format_file_size(regular.file_size_bytes),
-                    'storage_type': "disk" if regular.files_on_disk else "ram",
-                    'regular_apis': {
-                        'stats': regular.get_stats(),
-                        'runs': [{'run': r.run_number, 'time': r.seconds, 'throughput': r.gbps} for r in regular.runs]
-                    },
-                    'withresponse_apis': {
-                        'stats': withresponse.get_stats(),
-                        'runs': [{'run': r.run_number, 'time': r.seconds, 'throughput': r.gbps} for r in withresponse.runs]
-                    },
-                    'comparison_metrics': comparison,
-                    'faster_api': faster
-                }
-                json_data[plat]['test_pairs'].append(pair_data)
-            
-            json_data[plat]['summary']['total_pairs'] = len(pairs)
-            json_data[plat]['summary']['avg_throughput_ratio'] = mean(ratios) if ratios else 0
+        base_name = axis.base_name(regular.test_name)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2)
+        # Determine which is faster
+        if comparison[f'{baseline_key}_mean_throughput'] > comparison[f'{variant_key}_mean_throughput']:
+            diff_pct = comparison['throughput_difference_percent']
+        else:
+            diff_pct = -comparison['throughput_difference_percent']
+        faster = pair.faster
         
-        print(f"JSON report exported to: {filename}")
+        line = (
+            f"| {base_name} | {file_size} | {storage_type} | "
+            f"{comparison[f'{baseline_key}_mean_throughput']:.2f} | "
+            f"{comparison[f'{variant_key}_mean_throughput']:.2f} | "
+            f"{abs(diff_pct):.1f}% | "
+            f"{faster} |"
+        )
+        if pair.significance is not None:
+            sig = pair.significance
+            line += f" [{sig['ratio_ci_low']:.2f}, {sig['ratio_ci_high']:.2f}] | {sig['p_value']:.3f} |"
+        return line
     
     def generate_markdown_summary_table(self, platform: str) -> str:
         """Generate a markdown summary table for a specific platform"""
-        pairs = self.find_test_pairs(platform)
+        pairs = self.comparison_model().pairs_for(platform)
+        axis = self.pair_axis
         if not pairs:
-            return f"No matching regular/withresponse test pairs found for {platform}"
+            return f"No matching {axis.baseline_key}/{axis.variant_key} test pairs found for {platform}"
+        
+        markdown_lines = self.markdown_summary_header(platform)
+        markdown_lines.extend(self.markdown_summary_row(pair) for pair in pairs)
+        return "\n".join(markdown_lines)
+    
+    def markdown_detail_lines(self, pair: PairComparison) -> List[str]:
+        """Markdown detailed breakdown section for a comparison pair"""
+        axis = self.pair_axis
+        baseline_key, variant_key = axis.baseline_key, axis.variant_key
+        regular = pair.baseline
+        comparison = pair.metrics
+        storage_type = axis.context_phrase(regular)
+        file_size = self.format_file_size(regular.file_size_bytes)
         
         markdown_lines = []
-        markdown_lines.append(f"## {platform.upper()} Platform Results")
+        markdown_lines.append(f"### {file_size} Download {storage_type}")
         markdown_lines.append("")
-        markdown_lines.append("| Test Type | File Size | Storage | Regular (Gb/s) | WithResp (Gb/s) | Difference | Faster API |")
-        markdown_lines.append("|-----------|-----------|---------|----------------|-----------------|------------|------------|")
-        
-        for regular, withresponse in pairs:
-            comparison = self.calculate_improvement(regular, withresponse)
-            storage_type = "Disk" if regular.files_on_disk else "RAM"
-            file_size = self.format_file_size(regular.file_size_bytes)
-            
-            # Extract base test name
-            base_name = regular.test_name.replace('-regular', '').replace('-1x', '').replace('GiB-', 'GiB ')
-            if '-ram' in base_name:
-                base_name = base_name.replace('-ram', ' (RAM)')
-            
-            # Determine which is faster
-            if comparison['regular_mean_throughput'] > comparison['withresponse_mean_throughput']:
-                faster = "Regular"
-                diff_pct = comparison['throughput_difference_percent']
-            else:
-                faster = "WithResponse"
-                diff_pct = -comparison['throughput_difference_percent']
-            
-            markdown_lines.append(
-                f"| {base_name} | {file_size} | {storage_type} | "
-                f"{comparison['regular_mean_throughput']:.2f} | "
-                f"{comparison['withresponse_mean_throughput']:.2f} | "
-                f"{abs(diff_pct):.1f}% | "
-                f"{faster} |"
-            )
+        markdown_lines.append(f"| Metric | {axis.baseline_name} | {axis.variant_name} | Comparison |")
+        markdown_lines.append("|--------|--------------|-------------------|------------|")
+        markdown_lines.append(f"| **Throughput (Gb/s)** | {comparison[f'{baseline_key}_mean_throughput']:.2f} | {comparison[f'{variant_key}_mean_throughput']:.2f} | {comparison['throughput_ratio']:.2f}x |")
+        markdown_lines.append(f"| **{ESTIMATOR_LABELS[self.estimator]} Time (s)** | {comparison[f'{baseline_key}_mean_time']:.1f} | {comparison[f'{variant_key}_mean_time']:.1f} | {comparison['time_ratio']:.2f}x |")
+        if pair.significance is not None:
+            sig = pair.significance
+            verdict = SignificanceTester.verdict(sig)
+            markdown_lines.append(f"| **Throughput Ratio {sig['confidence']:.0%} CI** | | | [{sig['ratio_ci_low']:.2f}, {sig['ratio_ci_high']:.2f}] |")
+            markdown_lines.append(f"| **Permutation p-value** | | | {sig['p_value']:.4f} ({verdict}) |")
         
-        return "\n".join(markdown_lines)
+        # Add statistical details
+        regular_stats = pair.baseline_stats
+        withresponse_stats = pair.variant_stats
+        
+        markdown_lines.append("")
+        markdown_lines.append("#### Statistical Details")
+        markdown_lines.append("")
+        markdown_lines.append(f"| Statistic | {axis.baseline_name} | {axis.variant_name} |")
+        markdown_lines.append("|-----------|--------------|-------------------|")
+        markdown_lines.append(f"| **Min Time (s)** | {regular_stats['min_time']:.2f} | {withresponse_stats['min_time']:.2f} |")
+        markdown_lines.append(f"| **Max Time (s)** | {regular_stats['max_time']:.2f} | {withresponse_stats['max_time']:.2f} |")
+        markdown_lines.append(f"| **Std Dev Time** | {regular_stats['std_time']:.2f} | {withresponse_stats['std_time']:.2f} |")
+        markdown_lines.append(f"| **Min Throughput (Gb/s)** | {regular_stats['min_throughput']:.2f} | {withresponse_stats['min_throughput']:.2f} |")
+        markdown_lines.append(f"| **Max Throughput (Gb/s)** | {regular_stats['max_throughput']:.2f} | {withresponse_stats['max_throughput']:.2f} |")
+        markdown_lines.append(f"| **Std Dev Throughput** | {regular_stats['std_throughput']:.2f} | {withresponse_stats['std_throughput']:.2f} |")
+        regular_robust, withresponse_robust = pair.baseline_robust, pair.variant_robust
+        markdown_lines.append(f"| **Warm-up Runs** | {regular_robust['warmup_runs']} | {withresponse_robust['warmup_runs']} |")
+        markdown_lines.append(f"| **Cold-start Throughput (Gb/s)** | {regular_robust['cold_start_throughput']:.2f} | {withresponse_robust['cold_start_throughput']:.2f} |")
+        markdown_lines.append(f"| **Steady-state Throughput (Gb/s)** | {regular_robust['steady_state_throughput']:.2f} | {withresponse_robust['steady_state_throughput']:.2f} |")
+        markdown_lines.append(f"| **Trimmed Mean Throughput (Gb/s)** | {regular_robust['trimmed_mean_throughput']:.2f} | {withresponse_robust['trimmed_mean_throughput']:.2f} |")
+        markdown_lines.append(f"| **MAD Throughput** | {regular_robust['mad_throughput']:.2f} | {withresponse_robust['mad_throughput']:.2f} |")
+        outliers = [', '.join(str(n) for n in robust['outlier_runs']) or '-'
+                    for robust in (regular_robust, withresponse_robust)]
+        markdown_lines.append(f"| **Outlier Runs** | {outliers[0]} | {outliers[1]} |")
+        for name, _ in TAIL_QUANTILES:
+            label = name.replace('_', '.')
+            markdown_lines.append(f"| **{label} Time (s)** | {pair.baseline_tail['time_percentiles'][name]:.2f} | {pair.variant_tail['time_percentiles'][name]:.2f} |")
+        for name, _ in TAIL_QUANTILES:
+            label = name.replace('_', '.')
+            markdown_lines.append(f"| **{label} Throughput (Gb/s)** | {pair.baseline_tail['throughput_percentiles'][name]:.2f} | {pair.variant_tail['throughput_percentiles'][name]:.2f} |")
+        histograms = [self.markdown_histogram(tail['throughput_histogram']) for tail in (pair.baseline_tail, pair.variant_tail)]
+        markdown_lines.append(f"| **Throughput Histogram (Gb/s)** | {histograms[0]} | {histograms[1]} |")
+        markdown_lines.append("")
+        return markdown_lines
+    
+    @staticmethod
+    def markdown_histogram(bins: List[Dict[str, float]]) -> str:
+        """One-cell histogram: a bar per bin scaled to the fullest, the bin range and the bin counts"""
+        if not bins:
+            return "-"
+        peak = max(b['count'] for b in bins)
+        bars = ''.join(' ▁▂▃▄▅▆▇█'[ceil(b['count'] / peak * 8)] for b in bins)
+        counts = ' '.join(str(b['count']) for b in bins)
+        return f"`{bars}` {bins[0]['low']:.2f}–{bins[-1]['high']:.2f} ({counts})"
     
     def generate_markdown_detailed_table(self, platform: str) -> str:
         """Generate a markdown detailed breakdown table for a specific platform"""
-        pairs = self.find_test_pairs(platform)
+        pairs = self.comparison_model().pairs_for(platform)
+        axis = self.pair_axis
         if not pairs:
-            return f"No matching regular/withresponse test pairs found for {platform}"
-        
-        markdown_lines = []
-        markdown_lines.append(f"## Detailed Performance Breakdown - {platform.upper()}")
-        markdown_lines.append("")
-        
-        for regular, withresponse in pairs:
-            comparison = self.calculate_improvement(regular, withresponse)
-            storage_type = "to Disk" if regular.files_on_disk else "to RAM"
-            file_size = self.format_file_size(regular.file_size_bytes)
-            
-            markdown_lines.append(f"### {file_size} Download {storage_type}")
-            markdown_lines.append("")
-            markdown_lines.append("| Metric | Regular APIs | WithResponse APIs | Comparison |")
-            markdown_lines.append("|--------|--------------|-------------------|------------|")
-            markdown_lines.append(f"| **Throughput (Gb/s)** | {comparison['regular_mean_throughput']:.2f} | {comparison['withresponse_mean_throughput']:.2f} | {comparison['throughput_ratio']:.2f}x |")
-            markdown_lines.append(f"| **Average Time (s)** | {comparison['regular_mean_time']:.1f} | {comparison['withresponse_mean_time']:.1f} | {comparison['time_ratio']:.2f}x |")
-            
-            # Add statistical details
-            regular_stats = regular.get_stats()
-            withresponse_stats = withresponse.get_stats()
-            
-            markdown_lines.append("")
-            markdown_lines.append("#### Statistical Details")
-            markdown_lines.append("")
-            markdown_lines.append("| Statistic | Regular APIs | WithResponse APIs |")
-            markdown_lines.append("|-----------|--------------|-------------------|")
-            markdown_lines.append(f"| **Min Time (s)** | {regular_stats['min_time']:.2f} | {withresponse_stats['min_time']:.2f} |")
-            markdown_lines.append(f"| **Max Time (s)** | {regular_stats['max_time']:.2f} | {withresponse_stats['max_time']:.2f} |")
-            markdown_lines.append(f"| **Std Dev Time** | {regular_stats['std_time']:.2f} | {withresponse_stats['std_time']:.2f} |")
-            markdown_lines.append(f"| **Min Throughput (Gb/s)** | {regular_stats['min_throughput']:.2f} | {withresponse_stats['min_throughput']:.2f} |")
-            markdown_lines.append(f"| **Max Throughput (Gb/s)** | {regular_stats['max_throughput']:.2f} | {withresponse_stats['max_throughput']:.2f} |")
-            markdown_lines.append(f"| **Std Dev Throughput** | {regular_stats['std_throughput']:.2f} | {withresponse_stats['std_throughput']:.2f} |")
-            markdown_lines.append("")
+            return f"No matching {axis.baseline_key}/{axis.variant_key} test pairs found for {platform}"
         
+        markdown_lines = [f"## Detailed Performance Breakdown - {platform.upper()}", ""]
+        for pair in pairs:
+            markdown_lines.extend(self.markdown_detail_lines(pair))
         return "\n".join(markdown_lines)
     
     def generate_markdown_overview(self) -> str:
         """Generate cross-platform overview section"""
-        markdown_lines = []
-        
-        markdown_lines.append("## Executive Overview - Cross-Platform Comparison")
-        markdown_lines.append("")
-        
-        # Collect all test results across platforms
-        all_pairs = []
-        for platform in self.results.keys():
-            if not self.results[platform]:
-                continue
-            pairs = self.find_test_pairs(platform)
-            for regular, withresponse in pairs:
-                comparison = self.calculate_improvement(regular, withresponse)
-                storage_type = "Disk" if regular.files_on_disk else "RAM"
-                file_size = self.format_file_size(regular.file_size_bytes)
-                
-                faster = "Regular" if comparison['regular_mean_throughput'] > comparison['withresponse_mean_throughput'] else "WithResponse"
-                diff_pct = abs(comparison['throughput_difference_percent'])
-                
-                all_pairs.append({
-                    'platform': platform,
-                    'file_size': file_size,
-                    'storage': storage_type,
-                    'regular_throughput': comparison['regular_mean_throughput'],
-                    'withresponse_throughput': comparison['withresponse_mean_throughput'],
-                    'difference': diff_pct,
-                    'faster': faster
-                })
-        
-        if not all_pairs:
+        overview = MarkdownOverview(self.pair_axis, self.significance, self.format_file_size)
+        rows = [overview.add(platform, pair)
+                for platform in self.results.keys() if self.results[platform]
+                for pair in self.comparison_model().pairs_for(platform)]
+        if not rows:
             return "No test data available for overview."
+        return "\n".join(overview.header_lines() + rows + overview.insight_lines())
+    
+    def generate_markdown_report(self, platform: str = None) -> str:
+        """Generate a comprehensive markdown performance comparison report"""
+        buffer = io.StringIO()
+        ReportWriter(self, markdown_file=buffer).write(platform)
+        return buffer.getvalue()
+    
+    def export_markdown(self, filename: str, platform: str = None) -> None:
+        """Export results to Markdown format"""
+        self.export(platform, markdown_filename=filename)
+    
+    def export(self, platform: str = None, csv_filename: str = None, json_filename: str = None,
+               jsonl_filename: str = None, markdown_filename: str = None) -> None:
+        """Write any combination of export formats in a single pass over the comparison pairs"""
+        targets = [('CSV', csv_filename, 'csv_file'), ('JSON', json_filename, 'json_file'),
+                   ('JSON Lines', jsonl_filename, 'jsonl_file'), ('Markdown', markdown_filename, 'markdown_file')]
+        targets = [target for target in targets if target[1]]
+        with contextlib.ExitStack() as stack:
+            files = {keyword: stack.enter_context(open(filename, 'w', newline='' if label == 'CSV' else None,
+                                                       encoding='utf-8'))
+                     for label, filename, keyword in targets}
+            with self.stage('export'):
+                ReportWriter(self, **files).write(platform)
         
-        # Create comprehensive overview table
-        markdown_lines.append("### Summary Table - All Platforms")
-        markdown_lines.append("")
-        markdown_lines.append("| Platform | File Size | Storage | Regular (Gb/s) | WithResp (Gb/s) | Difference | Faster API |")
-        markdown_lines.append("|----------|-----------|---------|----------------|-----------------|------------|------------|")
-        
-        for pair in all_pairs:
-            markdown_lines.append(
-                f"| {pair['platform']} | {pair['file_size']} | {pair['storage']} | "
-                f"{pair['regular_throughput']:.2f} | {pair['withresponse_throughput']:.2f} | "
-                f"{pair['difference']:.1f}% | {pair['faster']} |"
-            )
-        
-        markdown_lines.append("")
-        
-        # Add key insights
-        markdown_lines.append("### Key Insights")
-        markdown_lines.append("")
+        for label, filename, _ in targets:
+            print(f"{label} report exported to: {filename}")
+
+
+class MarkdownOverview:
+    """Running tallies behind the cross-platform Markdown overview, fed one pair at a time"""
+    
+    def __init__(self, axis: PairAxis, significance: Optional[SignificanceTester], format_file_size):
+        self.axis = axis
+        self.significance = significance
+        self.format_file_size = format_file_size
+        self.total = 0
+        self.baseline_wins = 0
+        self.variant_wins = 0
+        # platform -> [pairs, variant wins, baseline wins, variant throughput sum, baseline throughput sum]
+        self.platforms: Dict[str, List] = {}
+        # context label -> [pairs, variant wins]
+        self.contexts: Dict[str, List[int]] = {}
+    
+    def add(self, platform: str, pair: PairComparison) -> str:
+        """Tally a pair and return its row of the all-platforms summary table"""
+        axis = self.axis
+        comparison = pair.metrics
+        storage_type = axis.context_label(pair.baseline)
+        baseline_throughput = comparison[f'{axis.baseline_key}_mean_throughput']
+        variant_throughput = comparison[f'{axis.variant_key}_mean_throughput']
+        baseline_won = pair.faster == axis.baseline_label
+        variant_won = pair.faster == axis.variant_label
         
-        # Count wins for each API type
-        regular_wins = sum(1 for p in all_pairs if p['faster'] == 'Regular')
-        withresponse_wins = sum(1 for p in all_pairs if p['faster'] == 'WithResponse')
+        self.total += 1
+        self.baseline_wins += baseline_won
+        self.variant_wins += variant_won
+        tally = self.platforms.setdefault(platform, [0, 0, 0, 0, 0])
+        tally[0] += 1
+        tally[1] += variant_won
+        tally[2] += baseline_won
+        tally[3] += variant_throughput
+        tally[4] += baseline_throughput
+        context = self.contexts.setdefault(storage_type, [0, 0])
+        context[0] += 1
+        context[1] += variant_won
         
-        markdown_lines.append(f"- **Total Test Scenarios:** {len(all_pairs)}")
-        markdown_lines.append(f"- **WithResponse API Wins:** {withresponse_wins} scenarios ({withresponse_wins/len(all_pairs)*100:.1f}%)")
-        markdown_lines.append(f"- **Regular API Wins:** {regular_wins} scenarios ({regular_wins/len(all_pairs)*100:.1f}%)")
+        return (
+            f"| {platform} | {self.format_file_size(pair.baseline.file_size_bytes)} | {storage_type} | "
+            f"{baseline_throughput:.2f} | {variant_throughput:.2f} | "
+            f"{abs(comparison['throughput_difference_percent']):.1f}% | {pair.faster} |"
+        )
+    
+    def header_lines(self) -> List[str]:
+        axis = self.axis
+        return [
+            "## Executive Overview - Cross-Platform Comparison",
+            "",
+            "### Summary Table - All Platforms",
+            "",
+            f"| Platform | File Size | {axis.context_header} | {axis.baseline_label} (Gb/s) | {axis.variant_short} (Gb/s) | Difference | {axis.faster_header} |",
+            "|----------|-----------|---------|----------------|-----------------|------------|------------|",
+        ]
+    
+    def insight_lines(self) -> List[str]:
+        """Key insights, per-platform observations and storage impact from the tallies"""
+        axis = self.axis
+        total = self.total
+        markdown_lines = ["", "### Key Insights", ""]
+        markdown_lines.append(f"- **Total Test Scenarios:** {total}")
+        markdown_lines.append(f"- **{axis.variant_label} {axis.singular_noun} Wins:** {self.variant_wins} scenarios ({self.variant_wins/total*100:.1f}%)")
+        markdown_lines.append(f"- **{axis.baseline_label} {axis.singular_noun} Wins:** {self.baseline_wins} scenarios ({self.baseline_wins/total*100:.1f}%)")
+        if self.significance is not None:
+            inconclusive = total - self.baseline_wins - self.variant_wins
+            markdown_lines.append(f"- **Inconclusive (p >= {self.significance.alpha:g}):** {inconclusive} scenarios ({inconclusive/total*100:.1f}%)")
         markdown_lines.append("")
         
         # Analyze platform performance
         markdown_lines.append("#### Platform-Specific Observations")
         markdown_lines.append("")
-        
-        for platform in sorted(self.results.keys()):
-            if not self.results[platform]:
-                continue
-            platform_pairs = [p for p in all_pairs if p['platform'] == platform]
-            platform_withresp_wins = sum(1 for p in platform_pairs if p['faster'] == 'WithResponse')
-            platform_regular_wins = sum(1 for p in platform_pairs if p['faster'] == 'Regular')
-            
-            avg_withresp_throughput = sum(p['withresponse_throughput'] for p in platform_pairs) / len(platform_pairs)
-            avg_regular_throughput = sum(p['regular_throughput'] for p in platform_pairs) / len(platform_pairs)
-            
+        for platform in sorted(self.platforms):
+            pairs, variant_wins, baseline_wins, variant_sum, baseline_sum = self.platforms[platform]
             markdown_lines.append(f"**{platform.upper()}:**")
-            markdown_lines.append(f"- WithResponse wins: {platform_withresp_wins}/{len(platform_pairs)} scenarios")
-            markdown_lines.append(f"- Regular wins: {platform_regular_wins}/{len(platform_pairs)} scenarios")
-            markdown_lines.append(f"- Average WithResponse throughput: {avg_withresp_throughput:.2f} Gb/s")
-            markdown_lines.append(f"- Average Regular throughput: {avg_regular_throughput:.2f} Gb/s")
+            markdown_lines.append(f"- {axis.variant_label} wins: {variant_wins}/{pairs} scenarios")
+            markdown_lines.append(f"- {axis.baseline_label} wins: {baseline_wins}/{pairs} scenarios")
+            markdown_lines.append(f"- Average {axis.variant_label} throughput: {variant_sum / pairs:.2f} Gb/s")
+            markdown_lines.append(f"- Average {axis.baseline_label} throughput: {baseline_sum / pairs:.2f} Gb/s")
             markdown_lines.append("")
         
         # Storage impact analysis
-        ram_pairs = [p for p in all_pairs if p['storage'] == 'RAM']
-        disk_pairs = [p for p in all_pairs if p['storage'] == 'Disk']
-        
-        if ram_pairs:
-            ram_withresp_wins = sum(1 for p in ram_pairs if p['faster'] == 'WithResponse')
-            markdown_lines.append("#### Storage Type Impact")
-            markdown_lines.append("")
-            markdown_lines.append(f"**RAM Storage:**")
-            markdown_lines.append(f"- WithResponse wins: {ram_withresp_wins}/{len(ram_pairs)} scenarios ({ram_withresp_wins/len(ram_pairs)*100:.1f}%)")
-            markdown_lines.append("")
-        
-        if disk_pairs:
-            disk_withresp_wins = sum(1 for p in disk_pairs if p['faster'] == 'WithResponse')
-            markdown_lines.append(f"**Disk Storage:**")
-            markdown_lines.append(f"- WithResponse wins: {disk_withresp_wins}/{len(disk_pairs)} scenarios ({disk_withresp_wins/len(disk_pairs)*100:.1f}%)")
+        for index, label in enumerate(axis.context_labels):
+            if label not in self.contexts:
+                continue
+            pairs, variant_wins = self.contexts[label]
+            if index == 0:
+                markdown_lines.append(f"#### {axis.context_header} Type Impact")
+                markdown_lines.append("")
+            markdown_lines.append(f"**{label} {axis.context_header}:**")
+            markdown_lines.append(f"- {axis.variant_label} wins: {variant_wins}/{pairs} scenarios ({variant_wins/pairs*100:.1f}%)")
             markdown_lines.append("")
         
         markdown_lines.append("---")
         markdown_lines.append("")
+        return markdown_lines
+
+
+class ReportWriter:
+    """Single-pass streaming writer for the CSV, JSON, JSON Lines and Markdown exports
+    
+    The comparison model is walked once and each pair is written to every open
+    output as it is visited, so no per-format copy of the corpus is built in
+    memory. Markdown content that must precede text produced later in the pass
+    (the overview, each platform's detailed breakdown) is spooled to temporary
+    files and copied into place at the end.
+    """
+    
+    def __init__(self, analyzer: 'PerformanceAnalyzer', csv_file=None, json_file=None,
+                 jsonl_file=None, markdown_file=None):
+        self.analyzer = analyzer
+        self.csv_file = csv_file
+        self.json_file = json_file
+        self.jsonl_file = jsonl_file
+        self.markdown_file = markdown_file
+    
+    @staticmethod
+    def _indent(text: str, depth: int) -> str:
+        """Re-indent a json.dumps(indent=2) value nested ``depth`` levels deep"""
+        return text.replace('\n', '\n' + '  ' * depth)
+    
+    def write(self, platform: str = None) -> None:
+        analyzer = self.analyzer
+        if analyzer.compare is not None:
+            self.write_matrix(platform)
+            return
+        platforms_to_process = [platform] if platform else list(analyzer.results.keys())
+        model = analyzer.comparison_model()
         
-        return "\n".join(markdown_lines)
+        csv_writer = None
+        if self.csv_file is not None:
+            csv_writer = csv.DictWriter(self.csv_file, fieldnames=analyzer.csv_fieldnames())
+            csv_writer.writeheader()
+        markdown = None
+        if self.markdown_file is not None:
+            if platform and platform not in analyzer.results:
+                self.markdown_file.write(f"No results found for platform: {platform}")
+            else:
+                markdown = MarkdownStream(analyzer, self.markdown_file, overview=not platform)
+        if self.json_file is not None:
+            self.json_file.write('{')
+        
+        for platform_index, plat in enumerate(platforms_to_process):
+            pairs = model.pairs_for(plat)
+            if self.json_file is not None:
+                self.json_file.write(f'{"," if platform_index else ""}\n  {json.dumps(plat)}: {{\n    "test_pairs": [')
+            if markdown is not None:
+                markdown.begin_platform(plat, bool(analyzer.results.get(plat)), bool(pairs))
+            
+            ratio_total = Fraction(0)
+            for pair_index, pair in enumerate(pairs):
+                ratio_total += Fraction(pair.metrics['throughput_ratio'])
+                if csv_writer is not None:
+                    csv_writer.writerow(analyzer.csv_row(plat, pair))
+                if self.json_file is not None or self.jsonl_file is not None:
+                    pair_data = analyzer.json_pair(pair)
+                    if self.json_file is not None:
+                        self.json_file.write(f'{"," if pair_index else ""}\n      '
+                                             f'{self._indent(json.dumps(pair_data, indent=2), 3)}')
+                    if self.jsonl_file is not None:
+                        self.jsonl_file.write(json.dumps({'platform': plat, **pair_data}) + '\n')
+                if markdown is not None:
+                    markdown.add(plat, pair)
+            
+            if self.json_file is not None:
+                # Exact running sum, so the average matches statistics.mean
+                summary = {'total_pairs': len(pairs),
+                           'avg_throughput_ratio': float(ratio_total / len(pairs)) if pairs else 0}
+                self.json_file.write(f'{chr(10) + "    " if pairs else ""}],\n    "summary": '
+                                     f'{self._indent(json.dumps(summary, indent=2), 2)}\n  }}')
+            if markdown is not None:
+                markdown.end_platform()
+        
+        if self.json_file is not None:
+            self.json_file.write('\n}' if platforms_to_process else '}')
+        if markdown is not None:
+            markdown.finish()
+
+    def write_matrix(self, platform: str = None) -> None:
+        """Write the comparison matrix, one matrix row at a time, to every open output"""
+        analyzer = self.analyzer
+        matrix = analyzer.comparison_matrix()
+        rows = matrix.rows_for(platform)
+        markdown_file = self.markdown_file
+        if markdown_file is not None and platform and platform not in analyzer.results:
+            markdown_file.write(f"No results found for platform: {platform}")
+            markdown_file = None
+        
+        csv_writer = None
+        if self.csv_file is not None:
+            csv_writer = csv.DictWriter(self.csv_file, fieldnames=analyzer.matrix_csv_fieldnames(matrix))
+            csv_writer.writeheader()
+        if self.json_file is not None:
+            header = {'dimension': matrix.dimension, 'baseline': matrix.baseline,
+                      'estimator': analyzer.estimator, 'match_dimensions': list(matrix.match_dimensions),
+                      'values': list(matrix.values)}
+            self.json_file.write(json.dumps(header, indent=2)[:-2] + ',\n  "rows": [')
+        if markdown_file is not None:
+            markdown_file.write("\n".join(analyzer.matrix_markdown_header(matrix)))
+        
+        for row_index, row in enumerate(rows):
+            if csv_writer is not None:
+                for value in row.cells:
+                    csv_writer.writerow(analyzer.matrix_csv_row(matrix, row, value))
+            if self.json_file is not None or self.jsonl_file is not None:
+                row_data = analyzer.matrix_json_row(row)
+                if self.json_file is not None:
+                    self.json_file.write(f'{"," if row_index else ""}\n    '
+                                         f'{self._indent(json.dumps(row_data, indent=2), 2)}')
+                if self.jsonl_file is not None:
+                    self.jsonl_file.write(json.dumps({'dimension': matrix.dimension,
+                                                      'baseline': matrix.baseline, **row_data}) + '\n')
+            if markdown_file is not None:
+                markdown_file.write("\n" + analyzer.matrix_markdown_row(matrix, row))
+        
+        means = ComparisonMatrix.geometric_mean_ratios(rows, matrix.values)
+        if self.json_file is not None:
+            summary = {'rows': len(rows), 'geometric_mean_ratio': means}
+            self.json_file.write(f'{chr(10) + "  " if rows else ""}],\n  "summary": '
+                                 f'{self._indent(json.dumps(summary, indent=2), 1)}\n}}')
+        if markdown_file is not None:
+            ratios = " | ".join(f"{means[value]:.2f}x" if means[value] else "-" for value in matrix.values)
+            markdown_file.write(f"\n| **Geometric mean** | | {ratios} |\n\n{len(rows)} matching configurations\n")
+
+
+class MarkdownStream:
+    """Markdown report writer fed one pair at a time, spooling out-of-order sections to disk"""
     
-    def generate_markdown_report(self, platform: str = None) -> str:
-        """Generate a comprehensive markdown performance comparison report"""
-        if platform and platform not in self.results:
-            return f"No results found for platform: {platform}"
+    def __init__(self, analyzer: 'PerformanceAnalyzer', out, overview: bool):
+        self.analyzer = analyzer
+        self.out = out
+        self.started = False
+        self.overview = MarkdownOverview(analyzer.pair_axis, analyzer.significance,
+                                         analyzer.format_file_size) if overview else None
+        self.overview_rows = tempfile.TemporaryFile('w+', encoding='utf-8') if overview else None
+        # With an overview first, platform sections are spooled until the pass ends
+        self.sections = tempfile.TemporaryFile('w+', encoding='utf-8') if overview else None
+        self.details = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self.platform = None
         
-        platforms_to_process = [platform] if platform else list(self.results.keys())
-        markdown_lines = []
+        axis = analyzer.pair_axis
+        self.emit("# Performance Analysis Report")
+        self.emit("")
+        self.emit(f"This report compares {axis.baseline_name} vs {axis.variant_name} download performance across different platforms.")
+        self.emit("")
+    
+    def emit(self, line: str) -> None:
+        """Write one line to the report; lines are newline-separated, without a trailing newline"""
+        self.out.write(f"\n{line}" if self.started else line)
+        self.started = True
+    
+    def section(self, line: str) -> None:
+        if self.sections is not None:
+            self.sections.write(line + '\n')
+        else:
+            self.emit(line)
+    
+    def replay(self, spool, sink) -> None:
+        spool.seek(0)
+        for line in spool:
+            sink(line[:-1])
+        spool.seek(0)
+        spool.truncate()
+    
+    def begin_platform(self, platform: str, has_results: bool, has_pairs: bool) -> None:
+        self.platform = platform if has_results else None
+        if self.platform is None:
+            return
+        if not has_pairs:
+            axis = self.analyzer.pair_axis
+            message = f"No matching {axis.baseline_key}/{axis.variant_key} test pairs found for {platform}"
+            for line in (message, "", message, ""):
+                self.section(line)
+            self.platform = None
+            return
+        for line in self.analyzer.markdown_summary_header(platform):
+            self.section(line)
+        self.details.write(f"## Detailed Performance Breakdown - {platform.upper()}\n\n")
+    
+    def add(self, platform: str, pair: PairComparison) -> None:
+        if self.overview is not None:
+            self.overview_rows.write(self.overview.add(platform, pair) + '\n')
+        if self.platform is None:
+            return
+        self.section(self.analyzer.markdown_summary_row(pair))
+        for line in self.analyzer.markdown_detail_lines(pair):
+            self.details.write(line + '\n')
+    
+    def end_platform(self) -> None:
+        if self.platform is None:
+            return
+        self.section("")
+        self.replay(self.details, self.section)
+        self.section("")
+        self.platform = None
+    
+    def finish(self) -> None:
+        if self.overview is not None:
+            if self.overview.total:
+                for line in self.overview.header_lines():
+                    self.emit(line)
+                self.replay(self.overview_rows, self.emit)
+                for line in self.overview.insight_lines():
+                    self.emit(line)
+            else:
+                self.emit("No test data available for overview.")
+            self.replay(self.sections, self.emit)
+        for spool in (self.overview_rows, self.sections, self.details):
+            if spool is not None:
+                spool.close()
+
+
+class RunningStats:
+    """Online count/mean/variance (Welford) with min and max, in constant memory"""
+    
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0 with fewer than two values, like get_stats)"""
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+
+class LiveLogState:
+    """Incremental parse state for one log file that may still be growing
+    
+    Each poll reads only the bytes appended since the previous one, in the
+    parser's chunk size; complete lines go through the streaming parser and new runs are folded into
+    running statistics and a quantile sketch of run times, so nothing is
+    re-read and runs are not retained.
+    A file that shrinks is assumed to have been restarted and is re-read.
+    """
+    
+    def __init__(self, path: Path, parser: StreamingLogParser):
+        self.path = path
+        self.parser = parser
+        self.reset()
+    
+    def reset(self) -> None:
+        self.offset = 0
+        self.encoding: Optional[str] = None
+        self.pending = b''
+        self.header: Dict[str, bytes] = {}
+        self.remaining = [field for field, _ in self.parser.HEADER_TEMPLATES]
+        self.result: Optional[TestResult] = None
+        self.time_stats = RunningStats()
+        self.throughput_stats = RunningStats()
+        self.time_sketch = QuantileSketch()
+        self.last_run = 0
+    
+    def poll(self) -> int:
+        """Consume newly appended bytes; returns the number of new runs"""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return 0
+        if size < self.offset:
+            self.reset()
+        if size == self.offset:
+            return 0
         
-        markdown_lines.append("# Performance Analysis Report")
-        markdown_lines.append("")
-        markdown_lines.append("This report compares Regular APIs vs WithResponse APIs download performance across different platforms.")
-        markdown_lines.append("")
+        new_runs = 0
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            while self.offset < size:
+                data = f.read(min(self.parser.CHUNK_SIZE, size - self.offset))
+                if not data:
+                    break
+                self.offset += len(data)
+                new_runs += self.consume(data)
+        return new_runs
+    
+    def consume(self, data: bytes) -> int:
+        """Fold one piece of appended bytes into the state; returns the number of new runs"""
+        self.pending += data
+        if self.encoding is None:
+            # Wait for enough bytes to tell a UTF-8 BOM from the start of a UTF-16 one
+            if len(self.pending) < 4:
+                return 0
+            self.encoding, bom_length = detect_encoding(self.pending)
+            self.pending = self.pending[bom_length:]
         
-        # Add overview section only if processing all platforms
-        if not platform:
-            overview = self.generate_markdown_overview()
-            markdown_lines.append(overview)
+        newline = self.parser._patterns_for(self.encoding)[0]
+        block, self.pending = self.parser.split_complete_lines(self.pending, newline)
+        if not block:
+            return 0
         
-        # Add detailed sections for each platform
-        for plat in platforms_to_process:
-            if not self.results[plat]:
+        runs: List[TestRun] = []
+        self.parser.scan_block(block, self.encoding, self.header, self.remaining, runs)
+        for run in runs:
+            self.time_stats.add(run.seconds)
+            self.throughput_stats.add(run.gbps)
+            self.time_sketch.add(run.seconds)
+            self.last_run = run.run_number
+        if self.result is None and all(field in self.parser.OPTIONAL_FIELDS for field in self.remaining):
+            self.result = self.parser.build_result(self.path, self.header, [])
+        return len(runs)
+
+
+class LogWatcher:
+    """Tails platform directories and keeps a live pairwise comparison table"""
+    
+    def __init__(self, base_path: Path, axis: PairAxis, platform: Optional[str] = None,
+                 interval: float = 2.0, advisor: Optional[SampleSizeAdvisor] = None):
+        self.base_path = base_path
+        self.axis = axis
+        self.advisor = advisor or SampleSizeAdvisor()
+        self.platform = platform
+        self.interval = interval
+        self.parser = StreamingLogParser()
+        self.states: Dict[Path, LiveLogState] = {}
+    
+    def poll(self) -> int:
+        """Pick up new files and appended bytes; returns the number of changes seen"""
+        changes = 0
+        seen = set()
+        for platform_dir in sorted(self.base_path.iterdir()):
+            if not platform_dir.is_dir() or (self.platform and platform_dir.name != self.platform):
                 continue
+            for log_file in sorted(platform_dir.glob("*.log")):
+                seen.add(log_file)
+                if log_file not in self.states:
+                    self.states[log_file] = LiveLogState(log_file, self.parser)
+                    changes += 1
+        # Forget logs deleted since the last poll
+        for path in [path for path in self.states if path not in seen]:
+            del self.states[path]
+            changes += 1
+        for state in self.states.values():
+            changes += state.poll()
+        return changes
+    
+    def render(self) -> str:
+        """Render per-log progress and the live baseline/variant comparison"""
+        axis = self.axis
+        lines = [f"LIVE {axis.baseline_name.upper()} vs {axis.variant_name.upper()} "
+                 f"({time.strftime('%H:%M:%S')}, polling every {self.interval:g}s)"]
+        
+        by_platform: Dict[str, List[LiveLogState]] = {}
+        for path, state in sorted(self.states.items()):
+            by_platform.setdefault(path.parent.name, []).append(state)
+        
+        for platform, states in by_platform.items():
+            lines.append(f"\n{'='*20} {platform.upper()} {'='*20}")
+            lines.append(f"{'Log':<40} {'Runs':<8} {'Mean (Gb/s)':<12} {'Std':<8} {'Min':<8} {'Max':<8} "
+                         f"{'p99 Time (s)':<13} {'±CI':<9} {'Samples'}")
+            for state in states:
+                stats = state.throughput_stats
+                runs = f"{stats.count}/{state.result.max_repeat_count}" if state.result else f"{stats.count}/?"
+                if stats.count:
+                    precision = self.advisor.half_width(stats.count, stats.mean, stats.std)
+                    if state.result and stats.count >= state.result.max_repeat_count:
+                        enough = "done"
+                    elif self.advisor.enough(stats.count, stats.mean, stats.std):
+                        enough = "enough"
+                    else:
+                        enough = "collecting"
+                    lines.append(f"{state.path.stem:<40} {runs:<8} {stats.mean:<12.2f} {stats.std:<8.2f} "
+                                 f"{stats.min:<8.2f} {stats.max:<8.2f} {state.time_sketch.quantile(0.99):<13.2f} "
+                                 f"{f'{precision:.2%}' if precision != float('inf') else '-':<9} {enough}")
+                else:
+                    status = "waiting for runs" if state.result else "header incomplete"
+                    lines.append(f"{state.path.stem:<40} {runs:<8} {status}")
             
-            # Add summary table
-            summary_table = self.generate_markdown_summary_table(plat)
-            markdown_lines.append(summary_table)
-            markdown_lines.append("")
-            
-            # Add detailed breakdown
-            detailed_table = self.generate_markdown_detailed_table(plat)
-            markdown_lines.append(detailed_table)
-            markdown_lines.append("")
+            variants = {}
+            for state in states:
+                if state.result and getattr(state.result, axis.dimension):
+                    variants.setdefault(axis.pair_key(state.result), state)
+            pair_lines = []
+            for state in states:
+                if not state.result or getattr(state.result, axis.dimension):
+                    continue
+                partner = variants.get(axis.pair_key(state.result))
+                if partner is None or not state.throughput_stats.count or not partner.throughput_stats.count:
+                    continue
+                baseline_mean = state.throughput_stats.mean
+                variant_mean = partner.throughput_stats.mean
+                difference = (variant_mean - baseline_mean) / baseline_mean * 100
+                faster = axis.baseline_label if baseline_mean > variant_mean else axis.variant_label
+                pair_lines.append(
+                    f"{state.result.task_signature:<30} {axis.context_label(state.result):<8} "
+                    f"{baseline_mean:<16.2f} {variant_mean:<16.2f} {abs(difference):<14.1f}% {faster}"
+                )
+            if pair_lines:
+                lines.append("")
+                lines.append(f"{'Workload':<30} {axis.context_header:<8} {axis.baseline_label + ' (Gb/s)':<16} "
+                             f"{axis.variant_short + ' (Gb/s)':<16} {'Difference':<15} {axis.faster_header}")
+                lines.extend(pair_lines)
         
-        return "\n".join(markdown_lines)
+        if not by_platform:
+            lines.append("\nNo log files found yet")
+        return "\n".join(lines)
     
-    def export_markdown(self, filename: str, platform: str = None) -> None:
-        """Export results to Markdown format"""
-        markdown_content = self.generate_markdown_report(platform)
+    def run(self, iterations: Optional[int] = None) -> None:
+        """Poll and redraw until interrupted (or for a fixed number of iterations)"""
+        count = 0
+        try:
+            while iterations is None or count < iterations:
+                if self.poll() or count == 0:
+                    # Clear the terminal before redrawing the table
+                    print("\033[2J\033[H" + self.render(), flush=True)
+                count += 1
+                if iterations is None or count < iterations:
+                    time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+
+
+class AnalysisServer:
+    """Resident HTTP service answering report and export queries from a warm corpus
+    
+    The tree is polled for new, modified and deleted logs; only changed files
+    are re-parsed (or fetched from the parse cache) and a fresh analyzer with
+    its comparison model is swapped in, so requests never parse or recompute.
+    Rendered responses are memoized per corpus generation, making repeat
+    queries a dictionary lookup.
+    
+    Endpoints (GET): ``/report``, ``/export?format=csv|json|jsonl|markdown``,
+    ``/platforms`` and ``/status``; all but the last two accept ``platform``.
+    """
+    
+    EXPORT_LABELS = {'csv': 'CSV', 'json': 'JSON', 'jsonl': 'JSON Lines', 'markdown': 'Markdown'}
+    CONTENT_TYPES = {
+        'csv': 'text/csv; charset=utf-8',
+        'json': 'application/json',
+        'jsonl': 'application/x-ndjson',
+        'markdown': 'text/markdown; charset=utf-8',
+    }
+    
+    def __init__(self, base_path: Path, analyzer_options: Dict[str, object], interval: float = 2.0,
+                 jobs: int = 1, cache: Optional[ParseCache] = None):
+        self.base_path = base_path
+        self.analyzer_options = analyzer_options
+        self.interval = interval
+        self.jobs = jobs
+        self.cache = cache
+        self.loader = PerformanceAnalyzer(**analyzer_options)
+        # path -> ((size, mtime_ns), parsed result or None)
+        self.entries: Dict[Path, Tuple[Tuple[int, int], Optional[TestResult]]] = {}
+        # (generation, analyzer, memoized responses, refreshed at), swapped as a whole
+        self.state: Optional[Tuple[int, PerformanceAnalyzer, Dict[Tuple, Tuple[str, bytes]], float]] = None
+    
+    def refresh(self) -> bool:
+        """Re-parse changed logs and swap in a new analyzer; returns whether anything changed"""
+        platforms = self.loader.discover_log_files(self.base_path)
+        identities = {}
+        for _, log_files in platforms:
+            for log_file in log_files:
+                try:
+                    stat = log_file.stat()
+                except FileNotFoundError:
+                    continue
+                identities[log_file] = (stat.st_size, stat.st_mtime_ns)
+        changed = [path for path, identity in identities.items()
+                   if path not in self.entries or self.entries[path][0] != identity]
+        removed = [path for path in self.entries if path not in identities]
+        if self.state is not None and not changed and not removed:
+            return False
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        for path in removed:
+            del self.entries[path]
+        pending = []
+        cache_identities = {}
+        for path in changed:
+            result = None
+            if self.cache is not None:
+                result, cache_identities[path] = self.cache.lookup(path)
+            if result is not None:
+                self.entries[path] = (identities[path], result)
+            else:
+                pending.append(path)
+        if self.jobs > 1:
+            outcomes = self.loader._parse_parallel(pending, self.jobs)
+        else:
+            outcomes = [self.loader.parser.try_parse_log_file(path) for path in pending]
+        for path, outcome in zip(pending, outcomes):
+            if outcome.error is not None:
+                print(outcome.error)
+            self.entries[path] = (identities[path], outcome.result)
+            if self.cache is not None and outcome.result:
+                self.cache.store(self.base_path, path, cache_identities[path], outcome.result)
+        if self.cache is not None:
+            if removed:
+                self.cache.evict_missing(self.base_path, list(identities))
+            self.cache.commit()
+        
+        analyzer = PerformanceAnalyzer(**self.analyzer_options)
+        for platform_name, log_files in platforms:
+            analyzer.results[platform_name] = [self.entries[path][1] for path in log_files
+                                               if path in self.entries and self.entries[path][1]]
+        analyzer.store_runs()
+        analyzer.comparison_model()
+        generation = self.state[0] + 1 if self.state is not None else 1
+        self.state = (generation, analyzer, {}, time.time())
+        print(f"[{time.strftime('%H:%M:%S')}] generation {generation}: "
+              f"{len(pending)} parsed, {len(changed) - len(pending)} from cache, {len(removed)} removed")
+        return True
+    
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[int, str, bytes]:
+        """Answer a request from the current generation as (status, content type, body)"""
+        generation, analyzer, responses, refreshed_at = self.state
+        platform = query.get('platform') or None
+        if path == '/status':
+            body = json.dumps({'generation': generation, 'refreshed_at': refreshed_at,
+                               'files': len(self.entries),
+                               'results': sum(len(r) for r in analyzer.results.values())})
+            return 200, 'application/json', body.encode('utf-8')
+        if platform is not None and platform not in analyzer.results:
+            return 404, 'text/plain; charset=utf-8', f"No results found for platform: {platform}".encode('utf-8')
         
-        print(f"Markdown report exported to: {filename}")
+        key = (path, platform, query.get('format'))
+        if key not in responses:
+            if path == '/report':
+                responses[key] = ('text/plain; charset=utf-8', analyzer.generate_report(platform).encode('utf-8'))
+            elif path == '/platforms':
+                counts = {name: len(results) for name, results in analyzer.results.items()}
+                responses[key] = ('application/json', json.dumps(counts).encode('utf-8'))
+            elif path == '/export' and query.get('format') in self.CONTENT_TYPES:
+                buffer = io.StringIO()
+                ReportWriter(analyzer, **{f"{query['format']}_file": buffer}).write(platform)
+                responses[key] = (self.CONTENT_TYPES[query['format']], buffer.getvalue().encode('utf-8'))
+            else:
+                return 404, 'text/plain; charset=utf-8', b"Unknown endpoint or export format"
+        content_type, body = responses[key]
+        return 200, content_type, body
+    
+    def serve(self, host: str, port: int) -> None:
+        """Load the corpus, serve requests on a background thread and poll until interrupted"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qsl, urlsplit
+        service = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                status, content_type, body = service.respond(url.path, dict(parse_qsl(url.query)))
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('X-Corpus-Generation', str(service.state[0]))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.refresh()
+        httpd = ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        print(f"Serving {self.base_path} on http://{host}:{httpd.server_address[1]}/ "
+              f"(polling every {self.interval:g}s, Ctrl+C to stop)", flush=True)
+        try:
+            while True:
+                time.sleep(self.interval)
+                self.refresh()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+
+# Options (argparse dests) the --server client forwards to AnalysisServer.respond; the
+# server's own --parser, --estimator, significance and similar settings govern the rest
+SERVER_CLIENT_OPTIONS = ('server', 'platform', 'export_csv', 'export_json', 'export_jsonl', 'export_markdown')
+
+
+def query_server(url: str, endpoint: str, params: Dict[str, str]) -> bytes:
+    """GET an endpoint of a running analysis server; exits with its error message on failure"""
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urlencode
+    from urllib.request import urlopen
+    query = urlencode({key: value for key, value in params.items() if value})
+    try:
+        with urlopen(f"{url.rstrip('/')}{endpoint}{'?' + query if query else ''}") as response:
+            return response.read()
+    except HTTPError as e:
+        print(f"Error from server: {e.read().decode('utf-8', 'replace')}")
+    except URLError as e:
+        print(f"Error: cannot reach analysis server at {url}: {e.reason}")
+    sys.exit(1)
 
 
 def main():
@@ -617,6 +4674,29 @@ Examples:
   python performance_analyzer.py --export-csv results.csv
   python performance_analyzer.py --export-json results.json
   python performance_analyzer.py --export-markdown results.md
+  python performance_analyzer.py --export-csv r.csv --export-jsonl r.jsonl --export-markdown r.md  # One pass
+  python performance_analyzer.py --jobs 8           # Parse logs with 8 worker processes
+  python performance_analyzer.py --pair-on files_on_disk  # Compare RAM vs Disk instead of API variants
+  python performance_analyzer.py --where size>=5GiB --group-by platform,storage --agg p50_gbps,p99_secs
+  python performance_analyzer.py --where storage=RAM --where api=WithResponse --export-csv ram.csv
+  python performance_analyzer.py --base-path shard1 --emit-summary shard1.summary  # On each host
+  python performance_analyzer.py --merge shard1.summary shard2.summary --export-json all.json
+  python performance_analyzer.py --compare platform --baseline linux_netstandard  # Ratio matrix vs one platform
+  python performance_analyzer.py --compare runtime --baseline netstandard --export-csv matrix.csv
+  python performance_analyzer.py --scaling-report   # Aggregate Gb/s vs 1x/2x/4x... concurrency
+  python performance_analyzer.py --overhead-report  # Time spent outside measured transfers
+  python performance_analyzer.py --resource-report  # CPU/disk/NIC per run from .resources/.vmstat/.sar sidecars
+  python performance_analyzer.py --sample-size-report --target-precision 0.02  # Runs actually needed per test
+  python performance_analyzer.py --size-model --predict-sizes 10MiB 2GiB 50GiB  # Fixed overhead vs bandwidth
+  python performance_analyzer.py --watch            # Live table for benchmarks still running
+  python performance_analyzer.py --record-baseline build-1234
+  python performance_analyzer.py --compare-baseline build-1234  # Exit 1 on a throughput regression
+  python performance_analyzer.py --export-snapshot corpus.snap  # Archive parsed results
+  python performance_analyzer.py --load-snapshot corpus.snap    # Re-render without parsing logs
+  python performance_analyzer.py --serve 8765      # Keep the corpus hot and answer queries over HTTP
+  python performance_analyzer.py --server http://127.0.0.1:8765 --platform linux_netstandard --export-csv r.csv
+  python performance_analyzer.py --no-cache         # Re-parse every log, ignoring the parse cache
+  python performance_analyzer.py --no-cache --jobs 4 --profile trace.json  # Per-stage timing, open in Perfetto
         """
     )
     
@@ -626,56 +4706,345 @@ Examples:
                       help='Export results to CSV file')
     parser.add_argument('--export-json', type=str, metavar='FILENAME', 
                       help='Export results to JSON file')
+    parser.add_argument('--export-jsonl', type=str, metavar='FILENAME',
+                      help='Export results to JSON Lines file, one comparison pair per line')
     parser.add_argument('--export-markdown', type=str, metavar='FILENAME',
                       help='Export results to Markdown file')
+    parser.add_argument('--export-snapshot', type=str, metavar='FILENAME',
+                      help='Export parsed results to a compact binary snapshot')
+    parser.add_argument('--load-snapshot', type=str, metavar='FILENAME',
+                      help='Load results from a binary snapshot instead of parsing logs')
+    parser.add_argument('--emit-summary', type=str, metavar='FILENAME',
+                      help='Write a mergeable shard summary of the parsed results')
+    parser.add_argument('--shard-name', type=str,
+                      help='Shard label stored in --emit-summary (default: HOSTNAME:BASE_PATH)')
+    parser.add_argument('--merge', type=str, nargs='+', metavar='SUMMARY',
+                      help='Merge shard summaries and report on them instead of parsing logs')
     parser.add_argument('--base-path', type=str, default='.',
                       help='Base directory containing platform folders (default: current directory)')
+    parser.add_argument('--parser', choices=sorted(PARSERS), default='streaming',
+                      help='Log parser implementation (default: streaming)')
+    parser.add_argument('--pair-on', choices=sorted(PAIR_AXES), default='with_response_apis',
+                      help='Configuration dimension compared within each pair (default: with_response_apis)')
+    parser.add_argument('--columnar', action='store_true',
+                      help='Hold runs in a columnar store instead of per-run objects and compute the basic '
+                           'statistics in one pass (vectorized when NumPy is installed)')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                      help='Parse logs with N worker processes (0 = one per CPU, default: 1)')
+    parser.add_argument('--where', type=argument_type(parse_predicate), action='append', default=[], metavar='EXPR',
+                      help='Only analyze results matching FIELD OP VALUE, e.g. size>=5GiB or storage=RAM '
+                           f"(repeatable; fields: {', '.join(QUERY_FIELDS)})")
+    parser.add_argument('--group-by', type=argument_type(parse_fields), metavar='FIELDS',
+                      help='Print an aggregate table grouped by these comma-separated fields instead of the report')
+    parser.add_argument('--agg', type=argument_type(lambda text: [parse_aggregate(a.strip()) for a in text.split(',')]),
+                      metavar='AGGS', help='Comma-separated aggregates for --group-by: count, runs or STAT_METRIC, '
+                                           'e.g. p50_gbps,max_secs (default: count,runs,mean_gbps)')
+    parser.add_argument('--compare', choices=sorted(COMPARE_DIMENSIONS), metavar='DIM',
+                      help='Build a ratio matrix across this dimension instead of comparing pairs '
+                           f"(one of: {', '.join(sorted(COMPARE_DIMENSIONS))}); exports write the matrix")
+    parser.add_argument('--baseline', type=str, metavar='VALUE',
+                      help='Value of the --compare dimension every other value is compared against')
+    parser.add_argument('--scaling-report', action='store_true',
+                      help='Also report aggregate throughput against concurrency (1x, 2x, 4x, ...)')
+    parser.add_argument('--overhead-report', action='store_true',
+                      help='Also report harness overhead and wall-clock efficiency from Start/End times')
+    parser.add_argument('--resource-report', action='store_true',
+                      help='Also report per-run CPU, memory, disk and NIC utilization and the likely bottleneck '
+                           'from resource sidecars next to the logs (see sample_resources.py)')
+    parser.add_argument('--sample-size-report', action='store_true',
+                      help='Also report how many runs each test needed and recommended repeat counts')
+    parser.add_argument('--target-precision', type=float, default=0.01,
+                      help='Relative CI half-width of mean throughput that counts as enough samples (default: 0.01)')
+    parser.add_argument('--min-runs', type=int, default=3,
+                      help='Fewest runs the sample-size advisor may recommend (default: 3)')
+    parser.add_argument('--size-model', action='store_true',
+                      help='Also fit time = overhead + bytes / bandwidth across object sizes and predict throughput')
+    parser.add_argument('--predict-sizes', type=argument_type(parse_size), nargs='+', metavar='SIZE',
+                      help='Object sizes for --size-model predictions, e.g. 10MiB 50GiB (default: 1MiB to 100GiB)')
+    parser.add_argument('--estimator', choices=sorted(ESTIMATORS), default='mean',
+                      help='Central value used to compare the two sides of a pair (default: mean)')
+    parser.add_argument('--no-significance', action='store_true',
+                      help='Skip bootstrap/permutation testing and always name the faster side')
+    parser.add_argument('--bootstrap-resamples', type=int, default=5000, metavar='N',
+                      help='Resamples for bootstrap CIs and permutation tests (default: 5000)')
+    parser.add_argument('--confidence', type=float, default=0.95,
+                      help='Confidence level of the throughput ratio interval (default: 0.95)')
+    parser.add_argument('--alpha', type=float, default=0.05,
+                      help='Significance level required to declare a winner (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=0,
+                      help='Random seed for resampling (default: 0)')
+    parser.add_argument('--baseline-db', type=str, default=str(default_cache_dir() / BaselineStore.FILENAME),
+                      help='SQLite file holding recorded baselines (default: %(default)s)')
+    parser.add_argument('--record-baseline', type=str, metavar='LABEL',
+                      help='Record this corpus as a baseline under a build label')
+    parser.add_argument('--compare-baseline', type=str, metavar='LABEL',
+                      help='Compare this corpus with a recorded baseline; exit 1 on a regression')
+    parser.add_argument('--list-baselines', action='store_true',
+                      help='List recorded baselines and exit')
+    parser.add_argument('--regression-threshold', type=float, default=0.05,
+                      help='Relative throughput drop that counts as a regression (default: 0.05)')
+    parser.add_argument('--regression-sigmas', type=float, default=2.0,
+                      help='Drop must also exceed this many standard errors (default: 2.0)')
+    parser.add_argument('--serve', type=argument_type(parse_listen_address), metavar='[HOST:]PORT',
+                      help='Run a resident analysis server that keeps parsed results in memory')
+    parser.add_argument('--server', type=str, metavar='URL',
+                      help='Fetch the report and exports from a running analysis server')
+    parser.add_argument('--profile', type=str, metavar='TRACE.json',
+                      help='Time each pipeline stage and parsed file; write a Chrome trace and print the slowest files')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                      help='Slowest files listed by --profile (default: 10)')
+    parser.add_argument('--profile-cprofile', type=str, metavar='FILE',
+                      help='Also record the run with cProfile and dump pstats to FILE')
+    parser.add_argument('--watch', action='store_true',
+                      help='Tail the platform directories and show live statistics until interrupted')
+    parser.add_argument('--watch-interval', type=float, default=2.0, metavar='SECS',
+                      help='Polling interval for --watch and --serve (default: 2.0)')
+    parser.add_argument('--cache-dir', type=str, default=str(default_cache_dir()),
+                      help='Directory holding the persistent parse cache (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Do not read or write the parse cache')
+    parser.add_argument('--rebuild-cache', action='store_true',
+                      help='Discard the parse cache and re-parse every log')
+    parser.add_argument('--cache-verify-hash', action='store_true',
+                      help='Also require a matching content hash before reusing a cache entry')
     
     args = parser.parse_args()
+    if args.bootstrap_resamples < 1:
+        parser.error("--bootstrap-resamples must be at least 1")
+    for option, value in (('--confidence', args.confidence), ('--alpha', args.alpha)):
+        if not 0 < value < 1:
+            parser.error(f"{option} must be between 0 and 1 (exclusive)")
+    if args.target_precision <= 0:
+        parser.error("--target-precision must be greater than 0")
+    if args.min_runs < 2:
+        parser.error("--min-runs must be at least 2")
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.watch and (args.load_snapshot or args.merge):
+        # Snapshots and summaries are fixed inputs; there is no log to tail
+        parser.error("--watch cannot be combined with --load-snapshot or --merge")
+    if args.server:
+        # Any other option changed from its default would be silently ignored
+        unsupported = [action.option_strings[0] for action in parser._actions
+                       if action.option_strings and action.dest not in SERVER_CLIENT_OPTIONS + ('help',)
+                       and getattr(args, action.dest) != action.default]
+        if unsupported:
+            parser.error(f"--server cannot be combined with {', '.join(unsupported)}")
     
     # Initialize analyzer
-    analyzer = PerformanceAnalyzer()
+    significance = None
+    if not args.no_significance:
+        significance = SignificanceTester(args.bootstrap_resamples, args.confidence, args.alpha, args.seed)
+    if bool(args.compare) != bool(args.baseline):
+        print("Error: --compare and --baseline must be given together")
+        sys.exit(1)
+    advisor = SampleSizeAdvisor(args.target_precision, args.confidence, args.alpha, args.min_runs)
+    profiler = None
+    if args.profile or args.profile_cprofile:
+        profiler = Profiler(args.profile_cprofile)
+        # Written at exit so runs that stop early (e.g. exit 1 on a regression) are profiled too
+        atexit.register(profiler.finish, args.profile or 'profile_trace.json', args.profile_top)
+    analyzer = PerformanceAnalyzer(parser=args.parser, pair_on=args.pair_on, columnar=args.columnar,
+                                   significance=significance, estimator=args.estimator,
+                                   compare=args.compare, compare_to=args.baseline, profiler=profiler)
+    
+    if args.list_baselines:
+        try:
+            store = BaselineStore(Path(args.baseline_db))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        for label, recorded_at, path, estimator, count in store.builds():
+            print(f"{label:<30} {recorded_at}  {count:>6} results  estimator={estimator}  {path}")
+        store.close()
+        return
+    
+    if args.server:
+        print(query_server(args.server, '/report', {'platform': args.platform}).decode('utf-8'))
+        for export_format, filename in (('csv', args.export_csv), ('json', args.export_json),
+                                        ('jsonl', args.export_jsonl), ('markdown', args.export_markdown)):
+            if filename:
+                if args.platform:
+                    base, ext = os.path.splitext(filename)
+                    filename = f"{base}_{args.platform}{ext}"
+                body = query_server(args.server, '/export', {'format': export_format, 'platform': args.platform})
+                with open(filename, 'wb') as f:
+                    f.write(body)
+                print(f"{AnalysisServer.EXPORT_LABELS[export_format]} report exported to: {filename}")
+        return
     
     # Scan for log files
     base_path = Path(args.base_path)
-    if not base_path.exists():
+    loaded = args.load_snapshot or args.merge
+    merged = None
+    if args.load_snapshot and args.merge:
+        print("Error: --load-snapshot and --merge cannot be combined")
+        sys.exit(1)
+    if args.load_snapshot:
+        try:
+            analyzer.load_snapshot(args.load_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Error loading snapshot {args.load_snapshot}: {e}")
+            sys.exit(1)
+    elif args.merge:
+        try:
+            merged = analyzer.merge_summaries(args.merge)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error merging shard summaries: {e}")
+            sys.exit(1)
+    elif not base_path.exists():
         print(f"Error: Base path '{base_path}' does not exist")
         sys.exit(1)
     
-    analyzer.scan_directories(base_path)
+    if args.watch:
+        LogWatcher(base_path, PAIR_AXES[args.pair_on], args.platform, args.watch_interval, advisor).run()
+        return
+    
+    cache = None
+    if not args.no_cache and not loaded:
+        cache = ParseCache(Path(args.cache_dir), verify_hash=args.cache_verify_hash, parser=args.parser)
+        if args.rebuild_cache:
+            cache.clear()
+    
+    if args.serve:
+        options = {'parser': args.parser, 'pair_on': args.pair_on, 'columnar': args.columnar,
+                   'significance': significance, 'estimator': args.estimator}
+        try:
+            AnalysisServer(base_path, options, args.watch_interval, args.jobs, cache).serve(*args.serve)
+        finally:
+            if cache is not None:
+                cache.close()
+        return
+    
+    if not loaded:
+        try:
+            analyzer.scan_directories(base_path, jobs=args.jobs, cache=cache)
+        finally:
+            if cache is not None:
+                cache.close()
+                print(cache.summary())
     
     if not any(analyzer.results.values()):
-        print("No log files found. Make sure you have platform directories (linux/, windows/, etc.) with .log files")
+        print("No log files found. Make sure you have platform directories (linux/, windows/, etc.) with .log (or .log.gz/.xz/.bz2/.zst) files")
         sys.exit(1)
     
+    if args.where:
+        with analyzer.stage('filter'):
+            analyzer.filter_results(args.where)
+        if not any(analyzer.results.values()):
+            print("No results match the --where filters")
+            sys.exit(1)
+    
+    if args.compare:
+        values = analyzer.compare_values(args.compare)
+        if args.baseline not in values:
+            print(f"Error: no results with {args.compare} '{args.baseline}' (available: {', '.join(values)})")
+            sys.exit(1)
+    
+    with analyzer.stage('statistics'):
+        if args.compare:
+            analyzer.comparison_matrix()
+        else:
+            analyzer.comparison_model()
+    
     # Generate and display report
-    report = analyzer.generate_report(args.platform)
+    with analyzer.stage('report'):
+        if args.group_by or args.agg:
+            group_by = args.group_by or []
+            aggregates = args.agg or ['count', 'runs', 'mean_gbps']
+            platforms = [args.platform] if args.platform else []
+            rows = analyzer.query([('platform', '=', tuple(platforms))] if platforms else [], group_by, aggregates)
+            report = format_query_table(rows, group_by + aggregates, analyzer.format_file_size)
+        elif args.compare:
+            report = analyzer.generate_matrix_report(args.platform)
+        else:
+            report = analyzer.generate_report(args.platform)
+    if merged is not None:
+        print(format_merged_aggregates(merged))
+        print()
     print(report)
+    if args.scaling_report:
+        print()
+        with analyzer.stage('scaling_report'):
+            print(analyzer.generate_scaling_report(args.platform))
+    if args.overhead_report:
+        print()
+        with analyzer.stage('overhead_report'):
+            print(analyzer.generate_overhead_report(args.platform))
+    if args.resource_report:
+        print()
+        with analyzer.stage('resource_report'):
+            analyzer.load_resource_traces(base_path)
+            print(analyzer.generate_resource_report(args.platform))
+    if args.sample_size_report:
+        print()
+        with analyzer.stage('sample_size_report'):
+            print(analyzer.generate_sample_size_report(advisor, args.platform))
+    if args.size_model:
+        print()
+        with analyzer.stage('size_model'):
+            print(analyzer.generate_size_model_report(args.platform, args.predict_sizes))
+    
+    # Export data if requested, writing every requested format in one pass
+    exports = {}
+    for keyword, filename in (('csv_filename', args.export_csv), ('json_filename', args.export_json),
+                              ('jsonl_filename', args.export_jsonl), ('markdown_filename', args.export_markdown)):
+        if filename:
+            if args.platform:
+                # Add platform to filename
+                base, ext = os.path.splitext(filename)
+                filename = f"{base}_{args.platform}{ext}"
+            exports[keyword] = filename
+    if exports:
+        analyzer.export(args.platform, **exports)
     
-    # Export data if requested
-    if args.export_csv:
-        filename = args.export_csv
-        if args.platform:
-            # Add platform to filename
-            base, ext = os.path.splitext(filename)
-            filename = f"{base}_{args.platform}{ext}"
-        analyzer.export_csv(filename, args.platform)
-    
-    if args.export_json:
-        filename = args.export_json
-        if args.platform:
-            # Add platform to filename  
-            base, ext = os.path.splitext(filename)
-            filename = f"{base}_{args.platform}{ext}"
-        analyzer.export_json(filename, args.platform)
-    
-    if args.export_markdown:
-        filename = args.export_markdown
-        if args.platform:
-            # Add platform to filename
-            base, ext = os.path.splitext(filename)
-            filename = f"{base}_{args.platform}{ext}"
-        analyzer.export_markdown(filename, args.platform)
+    if args.export_snapshot:
+        with analyzer.stage('export_snapshot'):
+            analyzer.export_snapshot(args.export_snapshot)
+    if args.emit_summary:
+        with analyzer.stage('export_snapshot'):
+            shards = merged['shards'] if merged is not None else [args.shard_name or f"{socket.gethostname()}:{base_path.resolve()}"]
+            analyzer.emit_summary(args.emit_summary, shards)
+    
+    if args.record_baseline or args.compare_baseline:
+        try:
+            store = BaselineStore(Path(args.baseline_db))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        try:
+            if args.record_baseline:
+                all_results = [r for results in analyzer.results.values() for r in results]
+                source = Path(args.load_snapshot or args.merge[0]) if loaded else base_path
+                skipped = store.record(args.record_baseline, source, all_results, args.estimator)
+                for result in skipped:
+                    print(f"Warning: {result.platform}/{result.test_name} has the same configuration as an "
+                          f"earlier result and was not recorded")
+                print(f"Recorded baseline '{args.record_baseline}' ({len(all_results) - len(skipped)} results) "
+                      f"in {args.baseline_db}")
+            
+            if args.compare_baseline:
+                platforms = [args.platform] if args.platform else list(analyzer.results.keys())
+                current = [r for plat in platforms for r in analyzer.results.get(plat, [])]
+                try:
+                    recorded_estimator = store.estimator_of(args.compare_baseline)
+                    rows = store.compare(args.compare_baseline, current,
+                                         args.regression_threshold, args.regression_sigmas)
+                except KeyError:
+                    print(f"Error: no baseline recorded as '{args.compare_baseline}'")
+                    sys.exit(2)
+                if recorded_estimator != args.estimator:
+                    print(f"\nNote: '{args.compare_baseline}' was recorded with the {recorded_estimator} estimator; "
+                          f"current results are summarized with it too (not {args.estimator})")
+                if args.platform:
+                    rows = [row for row in rows if row['key'][0] == args.platform]
+                if args.where:
+                    rows = store.filter_rows(rows, args.where)
+                print(format_baseline_comparison(args.compare_baseline, rows))
+                if any(row['status'] == 'REGRESSION' for row in rows):
+                    sys.exit(1)
+        finally:
+            store.close()
 
 
 if __name__ == "__main__":
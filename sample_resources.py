@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Host Resource Sampler
+Samples CPU, memory, disk and NIC counters from Linux /proc and /sys at a
+fixed interval and writes the resource sidecar read by
+performance_analyzer.py --resource-report. Name the output after the log it
+accompanies (download-5GiB-1x-regular.log -> download-5GiB-1x-regular.resources)
+and either wrap the benchmark command or sample for a fixed duration
+"""
+
+import argparse
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from performance_analyzer import RESOURCE_METRICS, RESOURCE_TRACE_HEADER
+
+
+# Block devices that never carry benchmark files
+IGNORED_DEVICE_PREFIXES = ('loop', 'ram', 'zram', 'dm-', 'md', 'sr')
+# /proc/diskstats counts 512-byte sectors regardless of the device's sector size
+SECTOR_BYTES = 512
+
+
+def read_cpu_times() -> Dict[str, Tuple[int, int, int]]:
+    """(total, idle, iowait) jiffies per CPU line of /proc/stat ('cpu' is the aggregate)"""
+    times = {}
+    with open('/proc/stat') as f:
+        for line in f:
+            if not line.startswith('cpu'):
+                break
+            name, *fields = line.split()
+            values = [int(value) for value in fields[:8]]
+            # user nice system idle iowait irq softirq steal; guest time is already in user
+            times[name] = (sum(values), values[3] + values[4], values[4])
+    return times
+
+
+def read_memory_used_percent() -> float:
+    """Memory in use (MemTotal - MemAvailable) as a percentage of MemTotal"""
+    info = {}
+    with open('/proc/meminfo') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            info[key] = int(value.split()[0])
+    return (info['MemTotal'] - info['MemAvailable']) / info['MemTotal'] * 100
+
+
+def default_devices() -> List[str]:
+    """Whole block devices, excluding loop, RAM, device-mapper and optical devices"""
+    return sorted(path.name for path in Path('/sys/block').iterdir()
+                  if not path.name.startswith(IGNORED_DEVICE_PREFIXES))
+
+
+def read_disk_counters(devices: List[str]) -> Dict[str, Tuple[int, int, int]]:
+    """(bytes read, bytes written, milliseconds busy) per device from /proc/diskstats"""
+    counters = {}
+    with open('/proc/diskstats') as f:
+        for line in f:
+            fields = line.split()
+            if fields[2] in devices:
+                counters[fields[2]] = (int(fields[5]) * SECTOR_BYTES, int(fields[9]) * SECTOR_BYTES, int(fields[12]))
+    return counters
+
+
+def default_interfaces() -> List[str]:
+    """Physical network interfaces (those backed by a device)"""
+    return sorted(path.name for path in Path('/sys/class/net').iterdir() if (path / 'device').exists())
+
+
+def link_speed_gbps(interface: str) -> Optional[float]:
+    """Negotiated link speed, or None when the driver does not report one"""
+    try:
+        speed = int(Path(f'/sys/class/net/{interface}/speed').read_text())
+    except (OSError, ValueError):
+        return None
+    return speed / 1000 if speed > 0 else None
+
+
+def read_net_counters(interfaces: List[str]) -> Dict[str, Tuple[int, int]]:
+    """(bytes received, bytes sent) per interface from /proc/net/dev"""
+    counters = {}
+    with open('/proc/net/dev') as f:
+        for line in f.readlines()[2:]:
+            name, _, fields = line.partition(':')
+            name, fields = name.strip(), fields.split()
+            if name in interfaces:
+                counters[name] = (int(fields[0]), int(fields[8]))
+    return counters
+
+
+class ResourceSampler:
+    """Turns successive counter readings into per-interval utilization samples"""
+
+    def __init__(self, devices: List[str], interfaces: List[str]):
+        self.devices = devices
+        self.interfaces = interfaces
+        self.speeds = {interface: link_speed_gbps(interface) for interface in interfaces}
+        self.previous = self.read()
+
+    def read(self):
+        return (time.monotonic(), read_cpu_times(), read_disk_counters(self.devices),
+                read_net_counters(self.interfaces))
+
+    def sample(self) -> Dict[str, float]:
+        """Utilization since the previous call"""
+        current = self.read()
+        (then, cpu_then, disk_then, net_then), (now, cpu_now, disk_now, net_now) = self.previous, current
+        self.previous = current
+        elapsed = now - then
+
+        busy = {}
+        for name, (total, idle, _) in cpu_now.items():
+            total_delta = total - cpu_then[name][0]
+            busy[name] = (1 - (idle - cpu_then[name][1]) / total_delta) * 100 if total_delta else 0.0
+        total_delta = cpu_now['cpu'][0] - cpu_then['cpu'][0]
+        sample = {
+            'cpu_percent': busy.pop('cpu'),
+            'cpu_max_percent': max(busy.values(), default=0.0),
+            'iowait_percent': (cpu_now['cpu'][2] - cpu_then['cpu'][2]) / total_delta * 100 if total_delta else 0.0,
+            'mem_used_percent': read_memory_used_percent(),
+        }
+        if self.devices:
+            deltas = [tuple(b - a for a, b in zip(disk_then[device], disk_now[device]))
+                      for device in disk_now if device in disk_then]
+            sample['disk_read_mbps'] = sum(delta[0] for delta in deltas) / elapsed / 1e6
+            sample['disk_write_mbps'] = sum(delta[1] for delta in deltas) / elapsed / 1e6
+            sample['disk_util_percent'] = min(100.0, max((delta[2] for delta in deltas), default=0) / elapsed / 10)
+        if self.interfaces:
+            utilization = []
+            rx = tx = 0.0
+            for interface in net_now:
+                if interface not in net_then:
+                    continue
+                rx_gbps = (net_now[interface][0] - net_then[interface][0]) * 8 / elapsed / 1e9
+                tx_gbps = (net_now[interface][1] - net_then[interface][1]) * 8 / elapsed / 1e9
+                rx, tx = rx + rx_gbps, tx + tx_gbps
+                if self.speeds[interface]:
+                    utilization.append(max(rx_gbps, tx_gbps) / self.speeds[interface] * 100)
+            sample['net_rx_gbps'], sample['net_tx_gbps'] = rx, tx
+            if utilization:
+                sample['net_util_percent'] = max(utilization)
+        return sample
+
+
+def sample_to_file(output: Path, interval: float, devices: List[str], interfaces: List[str],
+                   command: List[str] = None, duration: float = None) -> int:
+    """Write samples until the command exits, the duration elapses or Ctrl-C; returns the command's exit code"""
+    sampler = ResourceSampler(devices, interfaces)
+    process = subprocess.Popen(command) if command else None
+    deadline = time.monotonic() + duration if duration else None
+    samples = 0
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(f"{RESOURCE_TRACE_HEADER} interval={interval:g} host={socket.gethostname()} "
+                f"devices={','.join(devices)} interfaces={','.join(interfaces)}\n")
+        f.write(','.join(('timestamp',) + RESOURCE_METRICS) + '\n')
+        try:
+            while True:
+                time.sleep(interval)
+                sample = sampler.sample()
+                # Epoch seconds (UTC), matching the logs' Start/End times
+                f.write(','.join([f"{time.time():.3f}"] + [f"{sample[metric]:.3f}" if metric in sample else ''
+                                                           for metric in RESOURCE_METRICS]) + '\n')
+                f.flush()
+                samples += 1
+                if process is not None and process.poll() is not None:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        except KeyboardInterrupt:
+            pass
+    print(f"Wrote {samples} samples to {output}", file=sys.stderr)
+    return process.wait() if process is not None else 0
+
+
+def main():
+    """Main function with command line interface"""
+    parser = argparse.ArgumentParser(
+        description="Sample host CPU, memory, disk and NIC utilization into a performance_analyzer.py resource sidecar",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python sample_resources.py linux/download-5GiB-1x-regular.resources -- ./run-benchmark.sh download-5GiB-1x
+  python sample_resources.py trace.resources --duration 600 --device nvme0n1 --interface eth0
+""")
+    parser.add_argument('output', type=str,
+                      help='Sidecar file to write (.resources next to the log); a command to run while '
+                           'sampling may follow --')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between samples (default: 1)')
+    parser.add_argument('--duration', type=float, help='Stop after this many seconds (default: until Ctrl-C)')
+    parser.add_argument('--device', action='append',
+                      help='Block device to monitor, repeatable (default: all whole disks)')
+    parser.add_argument('--interface', action='append',
+                      help='Network interface to monitor, repeatable (default: all physical interfaces)')
+    argv = sys.argv[1:]
+    # Everything after -- is the command to run while sampling; sampling stops when it exits
+    split = argv.index('--') if '--' in argv else len(argv)
+    args, command = parser.parse_args(argv[:split]), argv[split + 1:]
+
+    if not Path('/proc/stat').exists():
+        print("Error: sampling needs Linux /proc")
+        sys.exit(1)
+    sys.exit(sample_to_file(Path(args.output), args.interval, args.device or default_devices(),
+                            args.interface or default_interfaces(), command, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""The comparison model computes each result's statistics exactly once,
+however many reports and exports are rendered from it"""
+
+import contextlib
+import io
+from collections import Counter
+
+import pytest
+
+from generate_logs import generate_corpus
+import performance_analyzer
+
+
+COUNTED_METHODS = ('get_stats', 'get_robust_stats')
+
+
+@pytest.fixture
+def call_counts(monkeypatch):
+    """Per-(method, result) call counts of the TestResult statistics methods"""
+    counts = Counter()
+    for name in COUNTED_METHODS:
+        original = getattr(performance_analyzer.TestResult, name)
+
+        def counted(self, _name=name, _original=original):
+            counts[(_name, id(self))] += 1
+            return _original(self)
+
+        monkeypatch.setattr(performance_analyzer.TestResult, name, counted)
+    return counts
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    corpus = tmp_path / 'corpus'
+    generate_corpus(corpus, platforms=2, configurations=2, runs=5, encodings=['utf-8'])
+    analyzer = performance_analyzer.PerformanceAnalyzer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer.scan_directories(corpus)
+    return analyzer
+
+
+def test_statistics_computed_once_per_result(analyzer, call_counts, tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer.generate_report()
+        analyzer.export_csv(str(tmp_path / 'report.csv'))
+        analyzer.export_json(str(tmp_path / 'report.json'))
+        analyzer.export_markdown(str(tmp_path / 'report.md'))
+        analyzer.export(csv_filename=str(tmp_path / 'all.csv'), json_filename=str(tmp_path / 'all.json'),
+                        markdown_filename=str(tmp_path / 'all.md'))
+
+    results = [result for results in analyzer.results.values() for result in results]
+    assert len(results) == 16
+    for name in COUNTED_METHODS:
+        per_result = [call_counts[(name, id(result))] for result in results]
+        assert per_result == [1] * len(results), name
+
+
+def test_platform_report_reuses_model(analyzer, call_counts):
+    platform = next(iter(analyzer.results))
+    analyzer.generate_report(platform)
+    analyzer.generate_report()
+
+    assert call_counts
+    assert set(call_counts.values()) == {1}
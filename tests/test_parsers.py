@@ -0,0 +1,33 @@
+"""The streaming parser extracts exactly what the regex parser does, whatever the encoding"""
+
+import pytest
+
+from generate_logs import ENCODINGS, generate_corpus
+import performance_analyzer
+
+
+@pytest.mark.parametrize('compress', [None, 'gz', 'xz'])
+def test_streaming_parser_matches_regex_parser(tmp_path, compress):
+    # Encodings are assigned round-robin, so every configuration sees UTF-8, UTF-8-BOM and UTF-16-LE/BE
+    generate_corpus(tmp_path, platforms=1, configurations=4, runs=7, encodings=list(ENCODINGS),
+                    compress=compress, concurrency=[1, 2])
+    files = performance_analyzer.list_log_files(tmp_path / 'platform_000')
+    assert len(files) == 32
+
+    regex, streaming = performance_analyzer.LogParser(), performance_analyzer.StreamingLogParser()
+    for log_file in files:
+        expected = regex.try_parse_log_file(log_file)
+        actual = streaming.try_parse_log_file(log_file)
+        assert expected.error is None and actual.error is None, log_file
+        assert actual.result == expected.result, log_file
+        assert len(actual.result.runs) == 7
+        assert actual.result.get_tail_stats() == expected.result.get_tail_stats(), log_file
+
+
+def test_streaming_parser_handles_runs_across_chunks(tmp_path, monkeypatch):
+    # Chunks far smaller than a line force every record to straddle chunk boundaries
+    monkeypatch.setattr(performance_analyzer.StreamingLogParser, 'CHUNK_SIZE', 7)
+    generate_corpus(tmp_path, platforms=1, configurations=1, runs=25, encodings=['utf-16-le', 'utf-8-sig'])
+    regex, streaming = performance_analyzer.LogParser(), performance_analyzer.StreamingLogParser()
+    for log_file in performance_analyzer.list_log_files(tmp_path / 'platform_000'):
+        assert streaming.try_parse_log_file(log_file).result == regex.try_parse_log_file(log_file).result
@@ -0,0 +1,79 @@
+"""QuantileSketch keeps its relative-accuracy bound and merges exactly"""
+
+import random
+
+import pytest
+
+from performance_analyzer import QuantileSketch
+
+
+QUANTILES = [0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999, 1]
+
+
+def lognormal_values(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(0, 1.5) for _ in range(count)]
+
+
+def state(sketch):
+    return sketch.buckets, sketch.zeros, sketch.count, sketch.min, sketch.max
+
+
+def assert_within(sketch, values, quantiles):
+    ordered = sorted(values)
+    for q in quantiles:
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= sketch.relative_accuracy * exact * (1 + 1e-9), q
+
+
+@pytest.mark.parametrize('relative_accuracy', [0.0005, 0.01, 0.05])
+def test_quantiles_within_relative_accuracy(relative_accuracy):
+    values = lognormal_values(20000)
+    # Room for every bucket, so nothing is collapsed
+    sketch = QuantileSketch(relative_accuracy, max_buckets=100000)
+    for value in values:
+        sketch.add(value)
+    assert_within(sketch, values, QUANTILES)
+
+
+def test_collapsing_only_costs_low_end_accuracy():
+    # Spans far more than the default bucket budget at the default accuracy
+    values = lognormal_values(20000)
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    assert len(sketch.buckets) == sketch.max_buckets
+    assert_within(sketch, values, [q for q in QUANTILES if q >= 0.25])
+
+
+@pytest.mark.parametrize('max_buckets', [4096, 64])
+def test_merge_equals_one_sketch(max_buckets):
+    values = lognormal_values(9000, seed=1) + [0.0] * 5
+    whole = QuantileSketch(0.01, max_buckets)
+    for value in values:
+        whole.add(value)
+
+    merged = QuantileSketch(0.01, max_buckets)
+    for start in range(0, len(values), 2000):
+        part = QuantileSketch(0.01, max_buckets)
+        for value in values[start:start + 2000]:
+            part.add(value)
+        merged.merge(part)
+
+    assert state(merged) == state(whole)
+    assert [merged.quantile(q) for q in QUANTILES] == [whole.quantile(q) for q in QUANTILES]
+    assert merged.histogram() == whole.histogram()
+
+
+def test_extend_equals_repeated_add():
+    values = lognormal_values(5000, seed=2) + [0.0, -1.0]
+    added, extended = QuantileSketch(0.01, 64), QuantileSketch(0.01, 64)
+    for value in values:
+        added.add(value)
+    extended.extend(values)
+    assert state(extended) == state(added)
+
+
+def test_merge_rejects_different_accuracy():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
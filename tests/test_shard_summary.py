@@ -0,0 +1,53 @@
+"""Merging shard summaries reproduces a single-node analysis exactly"""
+
+import contextlib
+import io
+import shutil
+
+from generate_logs import generate_corpus
+import performance_analyzer
+
+
+def make_analyzer():
+    significance = performance_analyzer.SignificanceTester(resamples=200, seed=0)
+    return performance_analyzer.PerformanceAnalyzer(significance=significance)
+
+
+def json_export(analyzer, path):
+    analyzer.export_json(str(path))
+    return path.read_text(encoding='utf-8')
+
+
+def test_merged_shards_match_single_node(tmp_path):
+    corpus = tmp_path / 'corpus'
+    generate_corpus(corpus, platforms=2, configurations=3, runs=6, encodings=['utf-8', 'utf-16-le'])
+
+    # Alternate each platform's logs between two hosts, so both shards hold every platform
+    shards = [tmp_path / 'host_a', tmp_path / 'host_b']
+    for platform_dir in sorted(corpus.iterdir()):
+        for index, log_file in enumerate(sorted(platform_dir.iterdir())):
+            target = shards[index % 2] / platform_dir.name
+            target.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(log_file, target / log_file.name)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        summaries = []
+        for shard in shards:
+            analyzer = make_analyzer()
+            analyzer.scan_directories(shard)
+            summary = tmp_path / f'{shard.name}.sum'
+            analyzer.emit_summary(str(summary), [shard.name])
+            summaries.append(str(summary))
+
+        merged = make_analyzer()
+        metadata = merged.merge_summaries(summaries)
+        single = make_analyzer()
+        single.scan_directories(corpus)
+        merged_json = json_export(merged, tmp_path / 'merged.json')
+        single_json = json_export(single, tmp_path / 'single.json')
+
+    assert metadata['shards'] == ['host_a', 'host_b']
+    assert merged_json == single_json
+    aggregates = metadata['aggregates']
+    assert sum(entry['results'] for entry in aggregates.values()) == 24
+    assert sum(entry['runs'] for entry in aggregates.values()) == 24 * 6
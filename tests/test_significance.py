@@ -0,0 +1,59 @@
+"""Seeded bootstrap CIs and permutation tests separate real differences from noise"""
+
+import random
+
+import pytest
+
+import performance_analyzer
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def tester(request, monkeypatch):
+    """A seeded tester on the vectorized path and on the statistics-module fallback"""
+    if request.param == 'numpy' and performance_analyzer.np is None:
+        pytest.skip("NumPy is not installed")
+    if request.param == 'python':
+        monkeypatch.setattr(performance_analyzer, 'np', None)
+    return performance_analyzer.SignificanceTester(resamples=2000, seed=0)
+
+
+def throughputs(center, count, seed):
+    rng = random.Random(seed)
+    return [rng.gauss(center, center * 0.03) for _ in range(count)]
+
+
+@pytest.mark.parametrize('statistic', ['mean', 'median', 'trimmed_mean'])
+def test_clearly_different_pair_is_significant(tester, statistic):
+    baseline, variant = throughputs(1.0, 12, seed=1), throughputs(2.0, 12, seed=2)
+    result = tester.test('pair', baseline, variant, statistic)
+
+    assert result['decided_by'] == 'permutation'
+    assert result['p_value'] < tester.alpha
+    stat = performance_analyzer.SignificanceTester.STATISTICS[statistic]
+    assert 1.0 < result['ratio_ci_low'] <= stat(variant) / stat(baseline) <= result['ratio_ci_high']
+    assert result['significant']
+
+
+def test_identical_samples_are_not_significant(tester):
+    samples = throughputs(5.0, 10, seed=3)
+    result = tester.test('pair', samples, list(samples))
+
+    assert result['ratio_ci_low'] <= 1.0 <= result['ratio_ci_high']
+    assert result['p_value'] == 1.0
+    assert not result['significant']
+
+
+def test_too_few_runs_fall_back_to_the_ci(tester):
+    # 3 vs 3 runs have 20 relabelings, so the exact p-value cannot go below 0.1
+    result = tester.test('pair', [1.0, 1.02, 0.98], [2.0, 2.04, 1.96])
+
+    assert result['min_p_value'] == pytest.approx(0.1)
+    assert result['p_value'] == pytest.approx(0.1)
+    assert result['decided_by'] == 'ci'
+    assert result['ratio_ci_low'] > 1.0
+    assert result['significant']
+
+
+def test_results_are_reproducible_per_pair(tester):
+    baseline, variant = throughputs(1.0, 8, seed=4), throughputs(1.05, 8, seed=5)
+    assert tester.test('a', baseline, variant) == tester.test('a', baseline, variant)
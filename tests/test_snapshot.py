@@ -0,0 +1,28 @@
+"""A binary snapshot reloads into the same analysis as parsing the logs"""
+
+import contextlib
+import io
+
+from generate_logs import generate_corpus
+import performance_analyzer
+
+
+def test_snapshot_round_trip(tmp_path):
+    corpus = tmp_path / 'corpus'
+    generate_corpus(corpus, platforms=2, configurations=2, runs=5, encodings=['utf-8'], concurrency=[1, 4])
+    snapshot = tmp_path / 'corpus.snap'
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed = performance_analyzer.PerformanceAnalyzer()
+        parsed.scan_directories(corpus)
+        parsed.export_snapshot(str(snapshot))
+        loaded = performance_analyzer.PerformanceAnalyzer()
+        loaded.load_snapshot(str(snapshot))
+        for analyzer, name in ((parsed, 'parsed.json'), (loaded, 'loaded.json')):
+            analyzer.export_json(str(tmp_path / name))
+
+    assert loaded.results == parsed.results
+    assert (tmp_path / 'loaded.json').read_text() == (tmp_path / 'parsed.json').read_text()
+    # Start/End times and tasks survive the round trip
+    assert loaded.generate_overhead_report() == parsed.generate_overhead_report()
+    assert loaded.generate_scaling_report() == parsed.generate_scaling_report()